@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Catalog of the locations a unit can be switched to (config/locations.ini).
+
+Each section is one location and has either a timetable:
+
+    [berlin-mosque]
+    csv = berlin-prayer-times.csv      ; relative to the catalog's directory
+
+or what prayer_calc needs to work the times out:
+
+    [makkah]
+    latitude = 21.4225
+    longitude = 39.8262
+    timezone = +3                      ; IANA name or UTC offset in hours
+    method = Makkah                    ; optional, as are the keys below
+    asr = standard
+    high_latitude = AngleBased
+    elevation = 0
+    adjust = Maghrib=2, Isha=-1
+
+compile_locations.py builds every location into its own compiled schedule
+ahead of time; switch_location.py then only has to publish one of them.
+"""
+import configparser
+import os
+from collections import namedtuple
+
+from schedule_store import BASE_COLUMNS
+from prayer_calc import (METHODS, DEFAULT_METHOD, ASR_FACTORS, HIGH_LATITUDE_RULES,
+                         DEFAULT_HIGH_LATITUDE_RULE, fixed_offset)
+
+# ──────────────────────────────────────────────────────────────
+# Catalog
+# ──────────────────────────────────────────────────────────────
+
+# csv is None for a calculated location, the calculation fields for a CSV one
+Location = namedtuple("Location", "name csv latitude longitude timezone method asr "
+                                  "high_latitude elevation adjustments")
+
+
+class CatalogError(Exception):
+    pass
+
+
+def _adjustments(name, text):
+    adjustments = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        column, _, minutes = part.partition("=")
+        column = column.strip()
+        if column not in BASE_COLUMNS:
+            raise CatalogError(f"[{name}] adjust: unknown column {column!r}")
+        try:
+            adjustments[column] = int(minutes)
+        except ValueError:
+            raise CatalogError(f"[{name}] adjust: expected {column}=<minutes>, got {part!r}")
+    return adjustments
+
+
+def _location(name, s, base_dir):
+    if not name.replace("-", "").replace("_", "").isalnum():
+        raise CatalogError(f"[{name}] names may only have letters, digits, - and _")
+    if "csv" in s:
+        return Location(name, os.path.join(base_dir, s["csv"]), None, None, None, None, None,
+                        None, None, None)
+
+    missing = [key for key in ("latitude", "longitude", "timezone") if not s.get(key)]
+    if missing:
+        raise CatalogError(f"[{name}] needs csv, or {', '.join(missing)}")
+    try:
+        latitude, longitude = float(s["latitude"]), float(s["longitude"])
+        elevation = float(s.get("elevation", 0))
+    except ValueError as e:
+        raise CatalogError(f"[{name}] {e}")
+    timezone = s["timezone"].strip()
+    offset = fixed_offset(timezone)
+
+    choices = {"method": (METHODS, DEFAULT_METHOD),
+               "asr": (ASR_FACTORS, "standard"),
+               "high_latitude": (HIGH_LATITUDE_RULES, DEFAULT_HIGH_LATITUDE_RULE)}
+    chosen = {}
+    for key, (allowed, default) in choices.items():
+        chosen[key] = s.get(key, default).strip()
+        if chosen[key] not in allowed:
+            raise CatalogError(f"[{name}] {key} must be one of {', '.join(allowed)}")
+
+    return Location(name, None, latitude, longitude, timezone if offset is None else offset,
+                    chosen["method"], chosen["asr"], chosen["high_latitude"], elevation,
+                    _adjustments(name, s.get("adjust", "")))
+
+
+def load_catalog(path):
+    """{name: Location} in the order of the file. Raises CatalogError."""
+    config = configparser.ConfigParser(interpolation=None, inline_comment_prefixes=(";",))
+    try:
+        if not config.read(path, encoding="utf-8"):
+            raise CatalogError(f"{path}: not found")
+    except configparser.Error as e:
+        raise CatalogError(f"{path}: {e}")
+    base_dir = os.path.dirname(os.path.abspath(path))
+    return {name: _location(name, config[name], base_dir) for name in config.sections()}
+
+
+def compiled_path(directory, name):
+    """Where compile_locations.py puts the schedule of location `name`."""
+    return os.path.join(directory, f"{name}.bin")
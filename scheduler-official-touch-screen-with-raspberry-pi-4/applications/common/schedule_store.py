@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""Compiled prayer-times schedule shared by the scheduler service and the GUIs.
+
+The file holds one fixed-width record per day of a leap year (366 slots, so
+Feb 29 always has a place). Each record is the month, the day and one signed
+16-bit minute-of-day per base prayer time (-1 when the time is missing). The
+header carries a magic, the format version, the slot/column counts, a
+revision number (one more than the file it replaced) and a CRC32 of the
+records.
+
+Derived times (Athkar, Duha, Tahajjud) are not stored: they are a fixed
+rule (base column and direction) plus a number of minutes from config.ini,
+and are worked out when a day is read. Changing an offset therefore only
+changes config.ini.
+
+Readers memory-map the file, so opening it costs the same no matter how many
+days it holds, and a lookup is a single struct unpack at a computed offset.
+"""
+import mmap
+import os
+import struct
+import zlib
+from datetime import timedelta
+
+# ──────────────────────────────────────────────────────────────
+# Format
+# ──────────────────────────────────────────────────────────────
+MAGIC = b"PTSB"
+FORMAT_VERSION = 2
+
+# Every column a day resolves to, in this order
+COLUMNS = [
+    'Fajr', 'Sunrise', 'Athkar_elsabah', 'Duha',
+    'Dhuhr', 'Asr', 'Maghrib', 'Athkar_elmasa',
+    'Isha', 'Tahajjud'
+]
+
+# Derived column -> (base column, direction of its config.ini offset)
+DERIVED_COLUMNS = {
+    'Athkar_elsabah': ('Fajr', 1),
+    'Duha': ('Dhuhr', -1),
+    'Athkar_elmasa': ('Maghrib', 1),
+    'Tahajjud': ('Fajr', -1),
+}
+# Offsets in minutes, by event type, when config.ini has none
+DEFAULT_OFFSETS = {
+    'athkar_elsabah': 60,
+    'duha': 60,
+    'athkar_elmasa': 20,
+    'tahajjud': 20,
+}
+
+# The columns actually stored
+BASE_COLUMNS = [label for label in COLUMNS if label not in DERIVED_COLUMNS]
+
+SLOT_COUNT = 366
+MISSING = -1
+MINUTES_PER_DAY = 24 * 60
+
+# magic, version, slot count, column count, revision, crc32 of records
+HEADER = struct.Struct("<4sHHHHI")
+RECORD = struct.Struct("<BB" + "h" * len(BASE_COLUMNS))
+
+# Day-of-year offsets in a leap year, indexed by month (1..12)
+_MONTH_LENGTHS = [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+_MONTH_OFFSETS = [0, 0]
+for _length in _MONTH_LENGTHS[:-1]:
+    _MONTH_OFFSETS.append(_MONTH_OFFSETS[-1] + _length)
+
+
+class ScheduleFormatError(Exception):
+    pass
+
+
+def slot_for(month, day):
+    """Index of the (month, day) record, or -1 if the date does not exist."""
+    if not 1 <= month <= 12 or not 1 <= day <= _MONTH_LENGTHS[month - 1]:
+        return -1
+    return _MONTH_OFFSETS[month] + day - 1
+
+
+def hhmm_to_minutes(value):
+    """Converts "HH:MM" to minutes since midnight; MISSING if empty or "nan"."""
+    value = str(value or "").strip()
+    if not value or value.lower() == "nan":
+        return MISSING
+    hour, minute = value.split(":")
+    hour, minute = int(hour), int(minute)
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"invalid time: {value}")
+    return hour * 60 + minute
+
+
+def minutes_to_hhmm(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def resolver(offsets=None):
+    """Function turning base minutes (BASE_COLUMNS order) into minutes for
+    every column of COLUMNS. Derived times wrap around midnight within the
+    same day; `offsets` maps event types to minutes (DEFAULT_OFFSETS if absent).
+    """
+    offsets = offsets or {}
+    plan = []
+    for label in COLUMNS:
+        base, direction = DERIVED_COLUMNS.get(label, (label, 0))
+        key = label.lower()
+        delta = direction * offsets.get(key, DEFAULT_OFFSETS.get(key, 0))
+        plan.append((BASE_COLUMNS.index(base), delta))
+
+    def resolve(base):
+        return tuple(MISSING if base[i] == MISSING else (base[i] + delta) % MINUTES_PER_DAY
+                     for i, delta in plan)
+    return resolve
+
+
+# ──────────────────────────────────────────────────────────────
+# Writer
+# ──────────────────────────────────────────────────────────────
+
+class ScheduleWriter:
+    """Builds a compiled schedule one day at a time.
+
+    Nothing touches `path` until commit(): the file is written next to the
+    target, fsync'd and renamed over it, so readers see either the old or the
+    new revision, never a mix. Readers that still have the old file mapped
+    are not affected and a failed build leaves it untouched.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._records = bytearray(RECORD.pack(0, 0, *([MISSING] * len(BASE_COLUMNS))) * SLOT_COUNT)
+
+    def add(self, month, day, minutes):
+        """Stores minute-of-day per base column (BASE_COLUMNS order) for the date."""
+        slot = slot_for(month, day)
+        if slot < 0:
+            raise ValueError(f"invalid date: {month}/{day}")
+        RECORD.pack_into(self._records, slot * RECORD.size, month, day, *minutes)
+
+    def commit(self):
+        """Publishes the schedule; returns its revision."""
+        revision = (_revision_of(self.path) + 1) % 0x10000
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, SLOT_COUNT, len(BASE_COLUMNS), revision,
+                             zlib.crc32(self._records))
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(self._records)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _fsync_dir(os.path.dirname(self.path))
+        return revision
+
+
+def _revision_of(path):
+    """Revision of the schedule at `path`, -1 if there is none."""
+    try:
+        with open(path, "rb") as f:
+            magic, _, _, _, revision, _ = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return -1
+    return revision if magic == MAGIC else -1
+
+
+def _fsync_dir(path):
+    fd = os.open(path or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_schedule(path, rows):
+    """Compiles rows ({"Month", "Day", <base column>: "HH:MM"}) into `path`."""
+    writer = ScheduleWriter(path)
+    for row in rows:
+        writer.add(int(row["Month"]), int(row["Day"]),
+                   [hhmm_to_minutes(row.get(label)) for label in BASE_COLUMNS])
+    writer.commit()
+
+
+# ──────────────────────────────────────────────────────────────
+# Reader
+# ──────────────────────────────────────────────────────────────
+
+class ScheduleStore:
+    """Read side. `offsets` (event type -> minutes, usually SettingsSnapshot.offsets)
+    decides where the derived times fall; DEFAULT_OFFSETS if not given."""
+
+    def __init__(self, path, offsets=None):
+        self.path = path
+        self._resolve = resolver(offsets)
+        with open(path, "rb") as f:
+            # An empty file cannot be mapped at all, and a shorter one has no header
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ScheduleFormatError(f"{path}: truncated header")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._check()
+        except ScheduleFormatError:
+            self._map.close()
+            raise
+
+    def _check(self):
+        magic, version, slots, columns, self.revision, self.crc = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ScheduleFormatError(f"{self.path}: not a compiled schedule")
+        if version != FORMAT_VERSION or slots != SLOT_COUNT or columns != len(BASE_COLUMNS):
+            raise ScheduleFormatError(f"{self.path}: unsupported format v{version} ({slots}x{columns})")
+        if len(self._map) != HEADER.size + RECORD.size * SLOT_COUNT:
+            raise ScheduleFormatError(f"{self.path}: truncated records")
+        if zlib.crc32(self._map[HEADER.size:]) != self.crc:
+            raise ScheduleFormatError(f"{self.path}: checksum mismatch")
+
+    def close(self):
+        self._map.close()
+
+    def _unpack(self, slot):
+        """(month, day, base minutes) of a slot; month is 0 for an empty slot."""
+        record = RECORD.unpack_from(self._map, HEADER.size + slot * RECORD.size)
+        return record[0], record[1], record[2:]
+
+    def day(self, month, day):
+        """Minute-of-day per column of COLUMNS for the date, or None if it is not in the file."""
+        slot = slot_for(month, day)
+        if slot < 0:
+            return None
+        month, _, base = self._unpack(slot)
+        if month == 0:
+            return None
+        return self._resolve(base)
+
+    def day_for_date(self, date):
+        """Minutes for a calendar date. A day missing from the file (e.g. Feb 29
+        when the source had none) falls back to the closest earlier day; None
+        only if the file has no days at all."""
+        for back in range(SLOT_COUNT):
+            d = date - timedelta(days=back)
+            record = self.day(d.month, d.day)
+            if record is not None:
+                return record
+        return None
+
+    def minutes(self, month, day, label):
+        """Minute-of-day of one event, or None if missing."""
+        record = self.day(month, day)
+        if record is None:
+            return None
+        value = record[COLUMNS.index(label)]
+        return None if value == MISSING else value
+
+    def base_days(self):
+        """Yields (month, day, base minutes) for every day in the file, as
+        ScheduleWriter.add() takes them."""
+        for slot in range(SLOT_COUNT):
+            month, day, base = self._unpack(slot)
+            if month:
+                yield month, day, base
+
+    def days(self):
+        """Yields (month, day, minutes) for every day in the file."""
+        for slot in range(SLOT_COUNT):
+            month, day, base = self._unpack(slot)
+            if month:
+                yield month, day, self._resolve(base)
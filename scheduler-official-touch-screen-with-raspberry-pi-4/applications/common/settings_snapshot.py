@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Typed, cached view of config/config.ini.
+
+SettingsCache parses config.ini once and hands out an immutable
+SettingsSnapshot. It re-parses only when the file's mtime, size or inode
+changes. write_settings() is the writer side: it replaces config.ini
+atomically, so a reader never sees a half-written file.
+"""
+import configparser
+import os
+from datetime import datetime
+from types import MappingProxyType
+
+from schedule_store import DEFAULT_OFFSETS
+
+# ──────────────────────────────────────────────────────────────
+# Keys
+# ──────────────────────────────────────────────────────────────
+SECTION = "Settings"
+
+AUDIO_KEYS = {
+    "fajr": "fajr_audio_checked",
+    "dhuhr": "dhuhr_audio_checked",
+    "asr": "asr_audio_checked",
+    "maghrib": "maghrib_audio_checked",
+    "isha": "isha_audio_checked",
+    "tahajjud": "tahajjud_audio_checked",
+    "duha": "duha_audio_checked",
+    "athkar_elsabah": "athkar_elsabah_audio_checked",
+    "athkar_elmasa": "athkar_elmasa_audio_checked",
+    "quran": "quran_audio_checked",
+}
+
+ENABLE_KEYS = {
+    "fajr": "enable_prayer_fajr",
+    "dhuhr": "enable_prayer_dhuhr",
+    "asr": "enable_prayer_asr",
+    "maghrib": "enable_prayer_maghrib",
+    "isha": "enable_prayer_isha",
+    "tahajjud": "enable_tahajjud_prayer",
+    "duha": "enable_duha_prayer",
+    "athkar_elsabah": "enable_athkar_elsabah",
+    "athkar_elmasa": "enable_athkar_elmasa",
+    "quran": "enable_listen_to_quran",
+}
+
+# Minutes between a derived event and the prayer it hangs off
+OFFSET_KEYS = {
+    "tahajjud": "tahajjud_time",
+    "duha": "duha_time",
+    "athkar_elsabah": "athkar_elsabah_time",
+    "athkar_elmasa": "athkar_elmasa_time",
+}
+
+# Never played, whatever config.ini says
+ALWAYS_SKIPPED = frozenset({"sunrise"})
+
+# Seconds before an event its audio is loaded and held paused (0 disables it)
+DEFAULT_PREARM_SECONDS = 5
+MAX_PREARM_SECONDS = 60
+
+
+class SettingsSnapshot:
+    """Immutable, parsed settings. Build with SettingsSnapshot.parse()."""
+    __slots__ = ("stamp", "skipped", "quran_time", "audio", "prearm_seconds", "measure_onset",
+                 "offsets")
+
+    def __init__(self, stamp, skipped, quran_time, audio,
+                 prearm_seconds=DEFAULT_PREARM_SECONDS, measure_onset=False,
+                 offsets=MappingProxyType(DEFAULT_OFFSETS)):
+        object.__setattr__(self, "stamp", stamp)
+        object.__setattr__(self, "skipped", skipped)
+        object.__setattr__(self, "quran_time", quran_time)
+        object.__setattr__(self, "audio", audio)
+        object.__setattr__(self, "prearm_seconds", prearm_seconds)
+        object.__setattr__(self, "measure_onset", measure_onset)
+        object.__setattr__(self, "offsets", offsets)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("SettingsSnapshot is immutable")
+
+    @classmethod
+    def parse(cls, config, stamp=None):
+        s = config[SECTION] if config.has_section(SECTION) else {}
+
+        skipped = set(ALWAYS_SKIPPED)
+        for event_type, key in ENABLE_KEYS.items():
+            if not _getboolean(s, key, True):
+                skipped.add(event_type)
+
+        try:
+            t = s.get("listen_to_quran", "").strip()
+            quran_time = datetime.strptime(t, "%H:%M").time() if t else None
+        except ValueError:
+            quran_time = None
+
+        audio = MappingProxyType({
+            event_type: tuple(f.strip() for f in s.get(key, "").split(",") if f.strip())
+            for event_type, key in AUDIO_KEYS.items()
+        })
+
+        try:
+            prearm_seconds = int(s.get("prearm_seconds", DEFAULT_PREARM_SECONDS))
+        except ValueError:
+            prearm_seconds = DEFAULT_PREARM_SECONDS
+        prearm_seconds = min(max(prearm_seconds, 0), MAX_PREARM_SECONDS)
+
+        offsets = {}
+        for event_type, key in OFFSET_KEYS.items():
+            try:
+                offsets[event_type] = int(s.get(key, DEFAULT_OFFSETS[event_type]))
+            except ValueError:
+                offsets[event_type] = DEFAULT_OFFSETS[event_type]
+
+        return cls(stamp, frozenset(skipped), quran_time, audio,
+                   prearm_seconds, _getboolean(s, "measure_onset", False),
+                   MappingProxyType(offsets))
+
+    def audio_for(self, event_type):
+        """Audio file names checked for the event, as a tuple."""
+        return self.audio.get(event_type, ())
+
+
+def _getboolean(section, key, fallback):
+    value = section.get(key)
+    if value is None:
+        return fallback
+    return configparser.ConfigParser.BOOLEAN_STATES.get(value.strip().lower(), fallback)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class SettingsCache:
+    def __init__(self, path):
+        self.path = path
+        self._snapshot = None
+
+    def current(self):
+        """The snapshot for the file as it is now; re-parsed only if it changed."""
+        try:
+            stamp = _stamp(self.path)
+        except OSError:
+            stamp = None
+        if self._snapshot is not None and self._snapshot.stamp == stamp:
+            return self._snapshot
+
+        config = configparser.ConfigParser(interpolation=None)
+        if stamp is not None:
+            try:
+                config.read(self.path, encoding="utf-8")
+            except configparser.Error:
+                if self._snapshot is not None:
+                    return self._snapshot  # keep the last good one
+        self._snapshot = SettingsSnapshot.parse(config, stamp)
+        return self._snapshot
+
+
+def write_settings(config, path):
+    """Writes a ConfigParser to `path` atomically (temp file + rename)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        config.write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Timeline of prayer events built from a compiled schedule.
+
+A Timetable turns the days of a ScheduleStore into one sorted list of event
+instants (epoch seconds) with their labels. The scheduler service reads its
+events from it, the countdown asks it which event was last and which comes
+next, and the settings GUI reads a day's times from it.
+
+current() answers by bisection and remembers the interval it found, so while
+the clock stays between the same two events (nearly every call from a once a
+second timer) it costs two comparisons and returns the same Window object.
+The timeline covers the day before to the day after the time asked about and
+is rebuilt when the clock leaves it.
+"""
+import bisect
+from array import array
+from collections import namedtuple
+from datetime import date, datetime, time as dt_time, timedelta
+
+from schedule_store import COLUMNS, MISSING
+
+# ──────────────────────────────────────────────────────────────
+# Timetable
+# ──────────────────────────────────────────────────────────────
+
+# Last and next event around an instant: labels, epoch seconds, and the
+# calendar date of the next one
+Window = namedtuple("Window", "previous next previous_at next_at next_date")
+
+# Days kept on each side of the day asked about
+_MARGIN_DAYS = 1
+
+
+class Timetable:
+    """Events of `labels` (columns of COLUMNS) from `store`, plus `extra`
+    ({label: datetime.time}) added on every day."""
+
+    def __init__(self, store, labels=COLUMNS, extra=None):
+        self.store = store
+        self.columns = [(COLUMNS.index(label), label) for label in labels]
+        self.extra = dict(extra or {})
+        self.instants = array("q")
+        self.labels = []
+        self._window = None
+        self._low = self._high = 0  # current() returns _window while _low <= t < _high
+
+    def build(self, first_day, days):
+        """(Re)builds the timeline over `days` calendar days from `first_day` on.
+        Days missing from the store fall back like ScheduleStore.day_for_date()."""
+        events = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            midnight = datetime.combine(day, dt_time.min)
+            minutes = self.store.day_for_date(day)
+            if minutes is not None:
+                for i, label in self.columns:
+                    if minutes[i] != MISSING:
+                        events.append((int((midnight + timedelta(minutes=minutes[i])).timestamp()), label))
+            for label, at in self.extra.items():
+                events.append((int(datetime.combine(day, at).timestamp()), label))
+        events.sort(key=lambda event: event[0])
+
+        self.instants = array("q", (at for at, _ in events))
+        self.labels = [label for _, label in events]
+        self._window = None
+        self._low = self._high = 0
+        return self
+
+    def events(self):
+        """Yields (epoch seconds, label) in time order."""
+        return zip(self.instants, self.labels)
+
+    def on(self, day):
+        """{label: minute of day} of the events on `day`; missing times are left out."""
+        minutes = self.store.day_for_date(day)
+        times = {label: minutes[i] for i, label in self.columns
+                 if minutes is not None and minutes[i] != MISSING}
+        times.update((label, at.hour * 60 + at.minute) for label, at in self.extra.items())
+        return times
+
+    def current(self, t):
+        """Window around epoch seconds `t`: the last event at or before it and
+        the first one after it. None if the store has no events near `t`."""
+        if self._low <= t < self._high:
+            return self._window
+
+        if not self.instants or not self.instants[0] <= t < self.instants[-1]:
+            day = date.fromtimestamp(t)
+            self.build(day - timedelta(days=_MARGIN_DAYS), 2 * _MARGIN_DAYS + 1)
+            if not self.instants or not self.instants[0] <= t < self.instants[-1]:
+                return None
+
+        i = bisect.bisect_right(self.instants, t)
+        previous_at, next_at = self.instants[i - 1], self.instants[i]
+        self._window = Window(self.labels[i - 1], self.labels[i], previous_at, next_at,
+                              date.fromtimestamp(next_at))
+        self._low, self._high = previous_at, next_at
+        return self._window
+
+    def next(self, t):
+        """(label, epoch seconds) of the first event after `t`, or None."""
+        window = self.current(t)
+        return window and (window.next, window.next_at)
+
+    def previous(self, t):
+        """(label, epoch seconds) of the last event at or before `t`, or None."""
+        window = self.current(t)
+        return window and (window.previous, window.previous_at)
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Measures what the two desktop GUIs cost to start and to update.
+
+Each GUI is started in a fresh Python process on Qt's offscreen platform,
+so no display is needed and the numbers do not depend on a compositor.
+For each one it records:
+
+  cold_start_ms     process start to the first painted frame, split into
+                    Python/Qt imports, the GUI module and the window itself
+  update_ms         one display update, until Qt has repainted what changed
+  paints, polishes  widget paint, polish and style-change events per update
+                    (a setStyleSheet() shows up as style changes on every
+                    child of the widget)
+  rss_kb            resident memory after start-up and at the end
+
+The updates are what the GUI does on its own: the countdown's
+update_countdown() on a virtual clock moved to the next time its timer was
+armed for (so each step is a real transition), and the settings window's
+time labels after an offset spin box changes.
+
+Both variants and any commit can be compared: the result is JSON tagged
+with the Qt version, the screen size and the git commit of MAIN_DIR if
+there is one, and with --baseline the run fails (exit 1) when a metric got
+worse than the baseline by more than the tolerance.
+
+Usage:
+    benchmark.py [--updates 200] [--runs 3] [--gui prayer_times_gui ...]
+                 [--label pi-zero] [--output FILE]
+                 [--baseline FILE] [--tolerance 0.2]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+STARTED = time.perf_counter()
+
+# ──────────────────────────────────────────────────────────────
+# Constants
+# ──────────────────────────────────────────────────────────────
+# The checkout this file is in (/home/ihms/Desktop/scheduler on a unit), so
+# it measures the GUIs next to it, whichever variant or commit that is
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DESKTOP_APPS_DIR = os.path.join(MAIN_DIR, "applications", "desktop")
+COMMON_DIR = os.path.join(MAIN_DIR, "applications", "common")
+
+# Common modules the GUIs import
+COMMON_MODULES = ("schedule_store", "timetable", "file_watcher", "settings_snapshot", "prayer_csv")
+
+# GUI -> window class and how its __main__ shows it (None: shows itself)
+GUIS = {
+    "prayer_times_gui": ("AdhanCounter", None),
+    "scheduler_settings_gui": ("ControlApp", "showMaximized"),
+}
+
+# Seconds to wait for the first frame
+FIRST_FRAME_TIMEOUT = 30
+
+# Metric -> absolute slack on top of the relative tolerance, so noise on
+# tiny values does not fail the gate
+GATED_METRICS = {
+    "cold_start_ms.total": 50.0,
+    "update_ms.p50": 0.5,
+    "update_ms.p90": 1.0,
+    "polishes_per_update": 1,
+    "rss_kb.end": 2048,
+}
+
+
+# ──────────────────────────────────────────────────────────────
+# Helpers
+# ──────────────────────────────────────────────────────────────
+
+def read_rss_kb(pid="self"):
+    """Current and peak resident set size of a process in kB."""
+    values = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value = line.split(":", 1)
+                values[key] = int(value.split()[0])
+    return values.get("VmRSS"), values.get("VmHWM")
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summary(values):
+    values = sorted(values)
+    if not values:
+        return None
+    return {
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p90": round(percentile(values, 90), 3),
+        "max": round(values[-1], 3),
+    }
+
+
+def git_commit(path):
+    try:
+        out = subprocess.run(["git", "-C", path, "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return out.stdout.strip() or None
+
+
+# ──────────────────────────────────────────────────────────────
+# Child process: one GUI
+# ──────────────────────────────────────────────────────────────
+
+def _load_gui(name):
+    # The GUIs put the installed common directory first on sys.path; importing
+    # the checkout's modules beforehand makes them use these instead
+    sys.path.insert(0, COMMON_DIR)
+    for common in COMMON_MODULES:
+        importlib.import_module(common)
+    spec = importlib.util.spec_from_file_location(name, os.path.join(DESKTOP_APPS_DIR, name, "main.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _countdown_steps(module, window, count):
+    """Update steps of AdhanCounter: the clock jumps to each time its timer was
+    armed for (every second for a repeating timer), then the timer is stopped
+    so only the steps update it."""
+    clock = [datetime.now().timestamp()]
+
+    class VirtualDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock[0], tz)
+
+    def step():
+        clock[0] += max(window.timer.interval(), 1) / 1000
+        window.update_countdown()
+        window.timer.stop()
+
+    module.datetime = VirtualDateTime
+    window.timer.stop()
+    for _ in range(count):
+        yield step
+
+
+def _settings_steps(module, window, count):
+    """Update steps of ControlApp: the Duha offset moves back and forth, with
+    the Duha section scrolled into view so its repaint is measured."""
+    spin = window.duha_spin
+    if hasattr(window.centralWidget(), "ensureWidgetVisible"):
+        window.centralWidget().ensureWidgetVisible(window.duha_time_label)
+    base = spin.value()
+    for i in range(count):
+        value = base + 1 + i % 2
+        yield lambda value=value: spin.setValue(value)
+
+
+def run_child(name, updates):
+    """Starts GUI `name`, updates it `updates` times; prints the metrics as JSON."""
+    started_at = float(os.environ.get("BENCHMARK_STARTED_AT", time.time()))
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    t0 = time.perf_counter()
+    from PyQt5.QtCore import QObject, QEvent, QT_VERSION_STR
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtGui import QFont
+
+    counts = {QEvent.Paint: 0, QEvent.Polish: 0, QEvent.StyleChange: 0}
+    first_frame = []
+
+    class EventCounter(QObject):
+        def eventFilter(self, obj, event):
+            kind = event.type()
+            if kind in counts and obj.isWidgetType():
+                counts[kind] += 1
+                if kind == QEvent.Paint and not first_frame:
+                    first_frame.append(time.perf_counter())
+            return False
+
+    app = QApplication([sys.argv[0]])
+    counter = EventCounter()
+    app.installEventFilter(counter)
+    if name == "scheduler_settings_gui":
+        app.setFont(QFont("Amiri"))
+    t1 = time.perf_counter()
+
+    module = _load_gui(name)
+    t2 = time.perf_counter()
+
+    class_name, show = GUIS[name]
+    window = getattr(module, class_name)()
+    if show:
+        getattr(window, show)()
+    deadline = time.monotonic() + FIRST_FRAME_TIMEOUT
+    while not first_frame and time.monotonic() < deadline:
+        app.processEvents()
+    if not first_frame:
+        raise RuntimeError(f"{name} painted nothing within {FIRST_FRAME_TIMEOUT} s")
+    t3 = first_frame[0]
+    # Let everything queued behind the first frame settle
+    for _ in range(10):
+        app.processEvents()
+    rss_start, _ = read_rss_kb()
+    startup_polishes = counts[QEvent.Polish] + counts[QEvent.StyleChange]
+
+    steps = _countdown_steps if name == "prayer_times_gui" else _settings_steps
+    times, paints, polishes = [], [], []
+    for step in steps(module, window, updates):
+        before = dict(counts)
+        start = time.perf_counter()
+        step()
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1000)
+        paints.append(counts[QEvent.Paint] - before[QEvent.Paint])
+        polishes.append(counts[QEvent.Polish] - before[QEvent.Polish]
+                        + counts[QEvent.StyleChange] - before[QEvent.StyleChange])
+    rss_end, rss_peak = read_rss_kb()
+
+    screen = app.primaryScreen().size()
+    print(json.dumps({
+        "qt": QT_VERSION_STR,
+        "screen": f"{screen.width()}x{screen.height()}",
+        "cold_start_ms": {
+            "total": round((time.time() - started_at - (time.perf_counter() - t3)) * 1000, 1),
+            "interpreter": round((time.time() - started_at - (time.perf_counter() - STARTED)) * 1000, 1),
+            "imports": round((t1 - t0) * 1000, 1),
+            "module": round((t2 - t1) * 1000, 1),
+            "window": round((t3 - t2) * 1000, 1),
+        },
+        "startup_polishes": startup_polishes,
+        "updates": len(times),
+        "update_ms": summary(times),
+        "paints_per_update": round(sum(paints) / max(len(paints), 1), 2),
+        "polishes_per_update": round(sum(polishes) / max(len(polishes), 1), 2),
+        "rss_kb": {"start": rss_start, "end": rss_end, "peak": rss_peak},
+    }))
+
+
+# ──────────────────────────────────────────────────────────────
+# Parent process
+# ──────────────────────────────────────────────────────────────
+
+def measure(name, updates):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", BENCHMARK_STARTED_AT=repr(time.time()))
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name,
+                          "--updates", str(updates)],
+                         capture_output=True, text=True, env=env)
+    if out.returncode != 0:
+        raise RuntimeError(f"{name} failed:\n{out.stderr.strip()}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def best_of(runs):
+    """Fastest cold start of several runs, with the median run of the rest."""
+    runs = sorted(runs, key=lambda r: r["cold_start_ms"]["total"])
+    result = dict(runs[len(runs) // 2])
+    result["cold_start_ms"] = runs[0]["cold_start_ms"]
+    result["runs"] = len(runs)
+    return result
+
+
+def lookup(result, dotted):
+    for part in dotted.split("."):
+        if not isinstance(result, dict) or part not in result:
+            return None
+        result = result[part]
+    return result
+
+
+def compare(result, baseline, tolerance):
+    """Regression messages for every gated metric worse than the baseline."""
+    failures = []
+    for name, metrics in result["guis"].items():
+        old_metrics = baseline.get("guis", {}).get(name)
+        if old_metrics is None:
+            continue
+        for metric, slack in GATED_METRICS.items():
+            new, old = lookup(metrics, metric), lookup(old_metrics, metric)
+            if new is None or old is None:
+                continue
+            limit = max(old * (1 + tolerance), old + slack)
+            if new > limit:
+                failures.append(f"{name} {metric}: {new} > {limit:.3f} (baseline {old})")
+    return failures
+
+
+def main_cli(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--gui", action="append", choices=sorted(GUIS),
+                        help="only this GUI (repeatable; default both)")
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=3, help="fresh starts per GUI")
+    parser.add_argument("--label", help="free text to tell results apart, e.g. the variant")
+    parser.add_argument("--output", help="write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", help="JSON result of an earlier run to gate against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child, args.updates)
+        return 0
+
+    guis = {}
+    for name in args.gui or GUIS:
+        guis[name] = best_of([measure(name, args.updates) for _ in range(max(args.runs, 1))])
+
+    result = {
+        "benchmark": "desktop_guis",
+        "label": args.label,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "commit": git_commit(MAIN_DIR),
+        "platform": "offscreen",
+        "guis": guis,
+    }
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(result, json.load(f), args.tolerance)
+        result["regressions"] = failures
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    for failure in failures:
+        print(f"Regression: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Measures how late the scheduler fires and what it costs while idle.
+
+The real AthanScheduler loop (real timer, journal, settings and file
+watcher, in a temporary var/config copy) runs in a child process against a
+stub player that only notes when it was asked to play. CPU time and memory
+are read from /proc for that process alone. The run has two phases:
+
+  idle    no events are due; wake-ups and CPU time of the sleeping loop
+  events  synthetic events every few seconds; deadline-to-dispatch latency
+
+Events are due on whole minutes. To get one every few seconds, the
+scheduler's clock runs ahead of the real one by an offset that grows by
+(60 - interval) seconds after every dispatch; its timer still sleeps on the
+real clock until each (shifted) deadline.
+
+To mimic a Pi Zero on a bigger board, --cpu-quota puts the process in a
+CPU-throttled cgroup (needs root) and --load adds busy processes next to it.
+Results are printed as JSON; with --baseline the run fails (exit 1) when a
+metric got worse than the baseline by more than the tolerance.
+
+Usage:
+    sudo benchmark.py [--cpu-quota 20] [--load 1] [--idle-seconds 60]
+                      [--events 50] [--interval 6] [--output FILE]
+                      [--baseline FILE] [--tolerance 0.2]
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import main
+from deadline_timer import DeadlineTimer
+from event_journal import make_key
+from file_watcher import FileWatcher
+from player import PlayRequest, PRIORITY_NORMAL, RESULT_DONE
+from settings_snapshot import SettingsCache
+
+# ──────────────────────────────────────────────────────────────
+# Constants
+# ──────────────────────────────────────────────────────────────
+CGROUP_ROOT = "/sys/fs/cgroup"
+CGROUP_NAME = "scheduler-benchmark"
+CPU_PERIOD_US = 100000
+
+# Metric -> absolute slack on top of the relative tolerance, so noise on
+# tiny values does not fail the gate
+GATED_METRICS = {
+    "latency_ms.p50": 1.0,
+    "latency_ms.p99": 2.0,
+    "wakeups_per_hour": 2,
+    "cpu_seconds_per_day": 1.0,
+    "rss_kb": 1024,
+}
+
+
+# ──────────────────────────────────────────────────────────────
+# Environment
+# ──────────────────────────────────────────────────────────────
+
+def _write(path, value):
+    with open(path, "w") as f:
+        f.write(str(value))
+
+
+def enter_cpu_cgroup(percent):
+    """Moves this process into a cgroup limited to `percent` of one CPU."""
+    quota = int(CPU_PERIOD_US * percent / 100)
+    if os.path.exists(os.path.join(CGROUP_ROOT, "cgroup.controllers")):
+        # cgroup v2
+        _write(os.path.join(CGROUP_ROOT, "cgroup.subtree_control"), "+cpu")
+        path = os.path.join(CGROUP_ROOT, CGROUP_NAME)
+        os.makedirs(path, exist_ok=True)
+        _write(os.path.join(path, "cpu.max"), f"{quota} {CPU_PERIOD_US}")
+    else:
+        # cgroup v1
+        path = os.path.join(CGROUP_ROOT, "cpu", CGROUP_NAME)
+        os.makedirs(path, exist_ok=True)
+        _write(os.path.join(path, "cpu.cfs_period_us"), CPU_PERIOD_US)
+        _write(os.path.join(path, "cpu.cfs_quota_us"), quota)
+    _write(os.path.join(path, "cgroup.procs"), os.getpid())
+
+
+def _burn():
+    while True:
+        pass
+
+
+def read_rss_kb(pid):
+    """Current and peak resident set size of a process in kB."""
+    values = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(("VmRSS:", "VmHWM:")):
+                key, value = line.split(":", 1)
+                values[key] = int(value.split()[0])
+    return values.get("VmRSS"), values.get("VmHWM")
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+# ──────────────────────────────────────────────────────────────
+# Stubs
+# ──────────────────────────────────────────────────────────────
+
+class WarpClock:
+    """Real time plus an offset that the stub player moves forward."""
+
+    def __init__(self, offset):
+        self.offset = offset
+
+    def now(self):
+        return datetime.fromtimestamp(self.timestamp())
+
+    def timestamp(self):
+        return time.time() + self.offset
+
+
+class CountingTimer(DeadlineTimer):
+    """DeadlineTimer on the warped clock, counting its wake-ups into a shared Value."""
+
+    def __init__(self, clock, wakeups):
+        super().__init__()
+        self.clock = clock
+        self.wakeups = wakeups
+
+    def wait_until(self, deadline, extra_fds=()):
+        reason = super().wait_until(deadline - self.clock.offset, extra_fds)
+        self.wakeups.value += 1
+        return reason
+
+
+class StubPlayer:
+    """Sends the dispatch latency of every request over `conn` and finishes it at once."""
+
+    def __init__(self, conn, clock, skip_seconds):
+        self.conn = conn
+        self.clock = clock
+        self.skip_seconds = skip_seconds
+        self.on_finished = None
+        self.measure_onset = False
+
+    def play(self, event_type, names=(), tag=None, due=None):
+        called = self.clock.timestamp()
+        if due is not None:
+            self.conn.send(called - due)  # seconds between due time and play()
+        self.clock.offset += self.skip_seconds  # next minute comes `interval` seconds from now
+        request = PlayRequest(event_type, names, PRIORITY_NORMAL, tag, self.on_finished, due)
+        request.released = True
+        request.finish(RESULT_DONE)
+        return request
+
+    def arm(self, event_type, names, due, tag=None):
+        return None  # always "busy": every event goes through the loop's own dispatch
+
+    def cancel(self, request):
+        pass
+
+    def stop(self):
+        pass
+
+    def status(self):
+        return None
+
+
+# ──────────────────────────────────────────────────────────────
+# Benchmark
+# ──────────────────────────────────────────────────────────────
+
+def synthetic_events(first_minute, count):
+    """Keys of `count` events on consecutive minutes, rotating through the kinds."""
+    return frozenset(make_key(first_minute + i, i % len(main.EVENT_TYPES)) for i in range(count))
+
+
+def cpu_seconds(pid):
+    """User + system CPU time of a process, from /proc."""
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _scheduler_process(args, work_dir, wakeups, conn):
+    """Child process: the scheduler loop with the stubs, reporting over `conn`."""
+    config_dir = os.path.join(work_dir, "config")
+    settings_path = os.path.join(config_dir, os.path.basename(main.SETTINGS_INI_FILE))
+    schedule_path = os.path.join(config_dir, os.path.basename(main.PRAYER_SCHEDULE_FILE))
+
+    main.logger.handlers.clear()
+    main.logger.addHandler(logging.FileHandler(os.path.join(work_dir, "scheduler.log")))
+
+    # The first event is due on a whole minute of the warped clock, after
+    # the idle phase and before it is pre-armed
+    prearm_seconds = SettingsCache(settings_path).current().prearm_seconds
+    first = time.time() + args.idle_seconds + prearm_seconds + 2
+    first_minute = int(first // 60) + 1
+    clock = WarpClock(first_minute * 60 - first)
+
+    timer = CountingTimer(clock, wakeups)
+    player = StubPlayer(conn, clock, 60 - args.interval)
+    scheduler = main.AthanScheduler(
+        now=clock.now, timer=timer, player=player,
+        watcher=FileWatcher(config_dir, [os.path.basename(settings_path),
+                                         os.path.basename(schedule_path)]),
+        schedule_path=schedule_path, settings_path=settings_path,
+        journal_path=os.path.join(work_dir, "executed-events.journal"),
+    )
+    events_per_day = len(scheduler.events) / main.SCHEDULE_WINDOW_DAYS if scheduler.events else len(main.EVENT_TYPES)
+
+    # One schedule load, as done every midnight
+    cpu_before = time.process_time()
+    scheduler.load_schedule()
+    reload_cpu = time.process_time() - cpu_before
+
+    scheduler.apply_events(scheduler.events | synthetic_events(first_minute, args.events))
+
+    conn.send(("ready", first, prearm_seconds, reload_cpu, events_per_day, timer.uses_timerfd))
+    scheduler.loop()
+
+
+def stop_process(process, timeout=5):
+    """Terminates a child process and reaps it, killing it if it does not exit."""
+    process.terminate()
+    process.join(timeout)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+def run_benchmark(args, work_dir):
+    config_dir = os.path.join(work_dir, "config")
+    os.makedirs(config_dir)
+    for path in (main.SETTINGS_INI_FILE, main.PRAYER_SCHEDULE_FILE):
+        if os.path.exists(path):
+            shutil.copy(path, config_dir)
+
+    wakeups = multiprocessing.Value("L", 0)
+    conn, child_conn = multiprocessing.Pipe(duplex=False)
+    child = multiprocessing.Process(target=_scheduler_process, name="scheduler",
+                                    args=(args, work_dir, wakeups, child_conn), daemon=True)
+    child.start()
+    try:
+        if not conn.poll(60):
+            raise RuntimeError("the scheduler did not start within 60 s")
+        _, first, prearm_seconds, reload_cpu, events_per_day, uses_timerfd = conn.recv()
+
+        # Idle phase
+        idle_start, idle_cpu_start, idle_wakeups_start = time.monotonic(), cpu_seconds(child.pid), wakeups.value
+        time.sleep(max(first - prearm_seconds - 1 - time.time(), 0))
+        idle_elapsed = time.monotonic() - idle_start
+        idle_cpu = cpu_seconds(child.pid) - idle_cpu_start
+        idle_wakeups = wakeups.value - idle_wakeups_start
+
+        # Event phase
+        events_start, events_cpu_start, events_wakeups_start = time.monotonic(), cpu_seconds(child.pid), wakeups.value
+        last = first + (args.events - 1) * args.interval
+        time.sleep(max(last + 1 - time.time(), 0))
+        events_elapsed = time.monotonic() - events_start
+        events_cpu = cpu_seconds(child.pid) - events_cpu_start
+        events_wakeups = wakeups.value - events_wakeups_start
+
+        rss_kb, rss_peak_kb = read_rss_kb(child.pid)
+        latencies = []
+        while conn.poll():
+            latencies.append(conn.recv() * 1000)
+        latencies.sort()
+    finally:
+        stop_process(child)
+
+    idle_cpu_rate = idle_cpu / idle_elapsed if idle_elapsed else 0.0
+    cpu_per_event = max(events_cpu - idle_cpu_rate * events_elapsed, 0.0) / max(len(latencies), 1)
+
+    return {
+        "idle_seconds": round(idle_elapsed, 1),
+        "events": len(latencies),
+        "events_expected": args.events,
+        "interval_seconds": args.interval,
+        "timerfd": uses_timerfd,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "p50": round(percentile(latencies, 50), 3) if latencies else None,
+            "p90": round(percentile(latencies, 90), 3) if latencies else None,
+            "p99": round(percentile(latencies, 99), 3) if latencies else None,
+            "max": round(latencies[-1], 3) if latencies else None,
+        },
+        "wakeups_per_hour": round(idle_wakeups * 3600 / idle_elapsed, 1) if idle_elapsed else None,
+        "wakeups_per_event": round(events_wakeups / max(len(latencies), 1), 2),
+        "cpu_ms_per_event": round(cpu_per_event * 1000, 3),
+        "cpu_ms_per_reload": round(reload_cpu * 1000, 3),
+        "cpu_seconds_per_day": round(idle_cpu_rate * 86400 + cpu_per_event * events_per_day + reload_cpu, 3),
+        "rss_kb": rss_kb,
+        "rss_peak_kb": rss_peak_kb,
+    }
+
+
+def lookup(result, dotted):
+    for part in dotted.split("."):
+        if not isinstance(result, dict) or part not in result:
+            return None
+        result = result[part]
+    return result
+
+
+def compare(result, baseline, tolerance):
+    """Regression messages for every gated metric worse than the baseline."""
+    failures = []
+    for metric, slack in GATED_METRICS.items():
+        new, old = lookup(result, metric), lookup(baseline, metric)
+        if new is None or old is None:
+            continue
+        limit = max(old * (1 + tolerance), old + slack)
+        if new > limit:
+            failures.append(f"{metric}: {new} > {limit:.3f} (baseline {old})")
+    return failures
+
+
+def main_cli(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cpu-quota", type=float, help="percent of one CPU, e.g. 20 (needs root)")
+    parser.add_argument("--load", type=int, default=0, help="busy processes running alongside")
+    parser.add_argument("--idle-seconds", type=int, default=60)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--interval", type=int, default=6, help="seconds between events")
+    parser.add_argument("--output", help="write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", help="JSON result of an earlier run to gate against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    args.interval = min(max(args.interval, 1), 60)
+
+    throttle_error = None
+    if args.cpu_quota:
+        try:
+            enter_cpu_cgroup(args.cpu_quota)
+        except OSError as e:
+            throttle_error = str(e)
+            print(f"Cannot set up the CPU cgroup, running unthrottled: {e}", file=sys.stderr)
+
+    burners = [multiprocessing.Process(target=_burn, daemon=True) for _ in range(args.load)]
+    for p in burners:
+        p.start()
+    work_dir = tempfile.mkdtemp(prefix="scheduler-benchmark-")
+    try:
+        metrics = run_benchmark(args, work_dir)
+    finally:
+        # The scheduler child is already reaped by run_benchmark()
+        for p in burners:
+            stop_process(p)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    result = {
+        "benchmark": "audio_event_scheduler",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "cpu_quota_percent": None if throttle_error else args.cpu_quota,
+        "load_processes": args.load,
+        **metrics,
+    }
+
+    failures = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            failures = compare(result, json.load(f), args.tolerance)
+        result["regressions"] = failures
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    for failure in failures:
+        print(f"Regression: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli(sys.argv[1:]))
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Sleep until an absolute wall-clock deadline.
+
+On Linux a timerfd armed on CLOCK_REALTIME with TFD_TIMER_CANCEL_ON_SET is
+used, so the sleep ends exactly at the deadline, or early when the system
+clock is set (NTP sync, RTC, manual change). wake() ends the sleep early from
+a signal handler or another thread, e.g. to reload the schedule, and extra
+descriptors (e.g. a file watcher) can be waited on at the same time.
+"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import time
+
+# ──────────────────────────────────────────────────────────────
+# Constants
+# ──────────────────────────────────────────────────────────────
+CLOCK_REALTIME = 0
+TFD_NONBLOCK = 0o4000
+TFD_CLOEXEC = 0o2000000
+TFD_TIMER_ABSTIME = 1 << 0
+TFD_TIMER_CANCEL_ON_SET = 1 << 1
+
+WAKE_DEADLINE = "deadline"
+WAKE_REQUESTED = "requested"
+WAKE_CLOCK_CHANGED = "clock_changed"
+WAKE_FD_READY = "fd_ready"
+
+# Only used when timerfd is not available
+FALLBACK_MAX_SLEEP_SECONDS = 60
+CLOCK_JUMP_TOLERANCE_SECONDS = 2
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    _fields_ = [("it_interval", _Timespec), ("it_value", _Timespec)]
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.timerfd_create.argtypes = [ctypes.c_int, ctypes.c_int]
+        libc.timerfd_settime.argtypes = [
+            ctypes.c_int, ctypes.c_int,
+            ctypes.POINTER(_Itimerspec), ctypes.POINTER(_Itimerspec),
+        ]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DeadlineTimer:
+    def __init__(self):
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        self._libc = _load_libc()
+        self._tfd = -1
+        if self._libc is not None:
+            fd = self._libc.timerfd_create(CLOCK_REALTIME, TFD_NONBLOCK | TFD_CLOEXEC)
+            if fd >= 0:
+                self._tfd = fd
+
+    @property
+    def uses_timerfd(self):
+        return self._tfd >= 0
+
+    def wake(self):
+        """Ends the current (or next) wait_until() early. Safe in signal handlers."""
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass
+
+    def _drain_wake_pipe(self):
+        try:
+            while os.read(self._wake_r, 64):
+                pass
+        except BlockingIOError:
+            pass
+
+    def wait_until(self, deadline, extra_fds=()):
+        """Blocks until the epoch timestamp `deadline`; returns the wake reason.
+
+        WAKE_FD_READY is returned when one of `extra_fds` becomes readable.
+        """
+        if self._tfd >= 0:
+            return self._wait_timerfd(deadline, list(extra_fds))
+        return self._wait_fallback(deadline, list(extra_fds))
+
+    def _wait_timerfd(self, deadline, extra_fds):
+        sec = int(deadline)
+        spec = _Itimerspec()
+        spec.it_value.tv_sec = max(sec, 1)
+        spec.it_value.tv_nsec = int((deadline - sec) * 1e9) if sec > 0 else 0
+        flags = TFD_TIMER_ABSTIME | TFD_TIMER_CANCEL_ON_SET
+        if self._libc.timerfd_settime(self._tfd, flags, ctypes.byref(spec), None) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        while True:
+            readable, _, _ = select.select([self._tfd, self._wake_r] + extra_fds, [], [])
+            if self._wake_r in readable:
+                self._drain_wake_pipe()
+                return WAKE_REQUESTED
+            if self._tfd not in readable:
+                return WAKE_FD_READY
+            try:
+                os.read(self._tfd, 8)
+                return WAKE_DEADLINE
+            except BlockingIOError:
+                continue
+            except OSError as e:
+                if e.errno == errno.ECANCELED:
+                    return WAKE_CLOCK_CHANGED
+                raise
+
+    def _wait_fallback(self, deadline, extra_fds):
+        while True:
+            wall_start = time.time()
+            mono_start = time.monotonic()
+            remaining = deadline - wall_start
+            if remaining <= 0:
+                return WAKE_DEADLINE
+
+            readable, _, _ = select.select(
+                [self._wake_r] + extra_fds, [], [], min(remaining, FALLBACK_MAX_SLEEP_SECONDS)
+            )
+            if self._wake_r in readable:
+                self._drain_wake_pipe()
+                return WAKE_REQUESTED
+            if readable:
+                return WAKE_FD_READY
+
+            drift = (time.time() - wall_start) - (time.monotonic() - mono_start)
+            if abs(drift) > CLOCK_JUMP_TOLERANCE_SECONDS:
+                return WAKE_CLOCK_CHANGED
@@ -1,25 +1,41 @@
 #!/usr/bin/env python3
-import subprocess
-from datetime import datetime, time as dt_time
-import time
+from array import array
+from collections import deque
+from datetime import datetime, timedelta, time as dt_time
+import heapq
 import logging
 import json
 import os
-import configparser
+import signal
+import sys
+
+from deadline_timer import DeadlineTimer, WAKE_CLOCK_CHANGED, WAKE_FD_READY
+from event_journal import EventJournal, make_key, key_minute, key_kind, STATUS_STARTED, STATUS_DONE, STATUS_FAILED
+from player import Player, ControlServer, RESULT_FAILED
 
 # ──────────────────────────────────────────────────────────────
 # Paths
 # ──────────────────────────────────────────────────────────────
-MAIN_DIR = "/home/ihms/Desktop/scheduler"
+# The checkout this file is in (/home/ihms/Desktop/scheduler on a unit), so
+# simulate.py and benchmark.py also work off the device
+MAIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 CONFIG_DIR = os.path.join(MAIN_DIR, "config")
-SCRIPTS_DIR = os.path.join(MAIN_DIR, "config","scripts")
+AUDIO_DIR = os.path.join(MAIN_DIR, "audio")
 LOG_DIR = os.path.join(MAIN_DIR, "logs")
+VAR_DIR = os.path.join(MAIN_DIR, "var")
 
 SETTINGS_INI_FILE = os.path.join(CONFIG_DIR, "config.ini")
-PRAYER_PYTHON_MAP_FILE = os.path.join(CONFIG_DIR, "prayer_times_map.py")
-EXECUTED_EVENTS_FILE = os.path.join(CONFIG_DIR, "executed-events.json")
+PRAYER_SCHEDULE_FILE = os.path.join(CONFIG_DIR, "prayer_times.bin")
+EXECUTED_EVENTS_FILE = os.path.join(VAR_DIR, "executed-events.journal")
+LEGACY_EXECUTED_EVENTS_FILE = os.path.join(CONFIG_DIR, "executed-events.json")
 AUDIO_EVENT_SCHEDULER_LOG_FILE = os.path.join(LOG_DIR, "audio_event_scheduler.log")
-PLAYER_APP_SCRIPT_FILE = os.path.join(SCRIPTS_DIR, "play_audio.sh")
+PLAYER_CONTROL_SOCKET = os.path.join(VAR_DIR, "player.sock")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import ScheduleStore, ScheduleFormatError
+from settings_snapshot import SettingsCache
+from file_watcher import FileWatcher
+from timetable import Timetable
 
 PRAYER_LABELS = [
     'Fajr', 'Sunrise', 'Athkar_elsabah', 'Duha',
@@ -28,56 +44,91 @@ PRAYER_LABELS = [
 ]
 QURAN_EVENT_LABEL = "Quran"
 
+# Event keys store the event kind as its index in this list (append only)
+EVENT_TYPES = [sys.intern(label.lower()) for label in PRAYER_LABELS + [QURAN_EVENT_LABEL]]
+EVENT_KINDS = {event_type: kind for kind, event_type in enumerate(EVENT_TYPES)}
+
+# An event is still played if we wake up within this many seconds after it
+MISSED_EVENT_GRACE_SECONDS = 60
+
+# How often config files are checked when inotify is not available
+WATCH_POLL_SECONDS = 30
+
+# Days of events (starting today) kept scheduled; the window moves every midnight
+SCHEDULE_WINDOW_DAYS = 2
+
 # ──────────────────────────────────────────────────────────────
 # Helpers
 # ──────────────────────────────────────────────────────────────
 
-def get_audio_for_event(event_type):
-    """Fetches the specific audio file list from config.ini for any event."""
-    config = configparser.ConfigParser()
-    config.read(SETTINGS_INI_FILE)
-    
-    # Mapping the event type to the key in config.ini
-    key_map = {
-        "fajr": "fajr_audio_checked",
-        "dhuhr": "dhuhr_audio_checked",
-        "asr": "asr_audio_checked",
-        "maghrib": "maghrib_audio_checked",
-        "isha": "isha_audio_checked",
-        "tahajjud": "tahajjud_audio_checked",
-        "duha": "duha_audio_checked",
-        "athkar_elsabah": "athkar_elsabah_audio_checked",
-        "athkar_elmasa": "athkar_elmasa_audio_checked",
-        "quran": "quran_audio_checked",
-    }
-    key = key_map.get(event_type.lower())
-    return config["Settings"].get(key, "") if key else ""
-
-def load_skipped_events():
-    skipped = ["sunrise"]
-    if not os.path.exists(SETTINGS_INI_FILE): return skipped
-    config = configparser.ConfigParser()
-    config.read(SETTINGS_INI_FILE)
-    
-    # Check prayers
-    mapping = {"enable_prayer_fajr":"Fajr", "enable_prayer_dhuhr":"Dhuhr", "enable_prayer_asr":"Asr", 
-               "enable_prayer_maghrib":"Maghrib", "enable_prayer_isha":"Isha", "enable_tahajjud_prayer":"Tahajjud",
-               "enable_duha_prayer":"Duha", "enable_athkar_elsabah":"Athkar_elsabah", "enable_athkar_elmasa":"Athkar_elmasa"}
-    
-    for key, label in mapping.items():
-        if not config["Settings"].getboolean(key, fallback=True):
-            skipped.append(label.lower())
-    if not config["Settings"].getboolean("enable_listen_to_quran", fallback=True):
-        skipped.append("quran")
-    return skipped
-
-def load_quran_time():
-    config = configparser.ConfigParser()
-    config.read(SETTINGS_INI_FILE)
-    try:
-        t = config["Settings"].get("listen_to_quran", fallback=None)
-        return datetime.strptime(t.strip(), "%H:%M").time() if t else None
-    except: return None
+def epoch_minute(dt):
+    return int(dt.timestamp()) // 60
+
+def next_midnight(now):
+    return datetime.combine(now.date() + timedelta(days=1), dt_time.min)
+
+# ──────────────────────────────────────────────────────────────
+# Events
+# ──────────────────────────────────────────────────────────────
+
+class Event:
+    """One scheduled event. It is fully described by its integer key (epoch
+    minute in the high bits, index into EVENT_TYPES in the low ones); the
+    scheduler keeps only keys and builds an Event when it fires one."""
+    __slots__ = ("key", "minute", "kind")
+
+    def __init__(self, minute, kind):
+        self.minute = minute
+        self.kind = kind
+        self.key = make_key(minute, kind)
+
+    @classmethod
+    def from_key(cls, key):
+        return cls(key_minute(key), key_kind(key))
+
+    @property
+    def type(self):
+        return EVENT_TYPES[self.kind]
+
+    @property
+    def timestamp(self):
+        return self.minute * 60
+
+    @property
+    def when(self):
+        return datetime.fromtimestamp(self.timestamp)
+
+
+class EventWindow:
+    """Events of a few days as parallel arrays of epoch minutes and kinds."""
+    __slots__ = ("minutes", "kinds")
+
+    def __init__(self):
+        self.minutes = array("q")
+        self.kinds = array("B")
+
+    def __len__(self):
+        return len(self.minutes)
+
+    def add(self, minute, event_type):
+        self.minutes.append(minute)
+        self.kinds.append(EVENT_KINDS[event_type])
+
+    def keys(self):
+        return frozenset(make_key(m, k) for m, k in zip(self.minutes, self.kinds))
+
+
+def build_window(store, settings, first_day, days):
+    """The events of `days` calendar days from `first_day` on, across year ends."""
+    labels = [label for label in PRAYER_LABELS if label.lower() not in settings.skipped]
+    extra = {}
+    if "quran" not in settings.skipped and settings.quran_time:
+        extra[QURAN_EVENT_LABEL] = settings.quran_time
+
+    window = EventWindow()
+    for at, label in Timetable(store, labels, extra).build(first_day, days).events():
+        window.add(at // 60, label.lower())
+    return window
 
 # ──────────────────────────────────────────────────────────────
 # Logging Setup
@@ -85,117 +136,271 @@ def load_quran_time():
 logger = logging.getLogger("scheduler")
 logger.setLevel(logging.INFO)
 logger.propagate = False
-if logger.hasHandlers(): logger.handlers.clear()
-formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-file_handler = logging.FileHandler(AUDIO_EVENT_SCHEDULER_LOG_FILE)
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
+
+
+def setup_logging(path=AUDIO_EVENT_SCHEDULER_LOG_FILE):
+    """Sends the service log to `path`; called by the service itself, not on import."""
+    if logger.hasHandlers(): logger.handlers.clear()
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    file_handler = logging.FileHandler(path)
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
 # ──────────────────────────────────────────────────────────────
 # Scheduler Class
 # ──────────────────────────────────────────────────────────────
 
 class AthanScheduler:
-    def __init__(self):
-        self.schedule = []
-        self.executed_events = self.load_executed_events()
+    """The service's scheduling loop.
+
+    Everything it touches can be swapped out (clock, timer, player, file
+    watcher and file paths); simulate.py uses that to replay a whole year
+    on a virtual clock.
+    """
+
+    def __init__(self, now=datetime.now, timer=None, player=None, watcher=None,
+                 schedule_path=PRAYER_SCHEDULE_FILE, settings_path=SETTINGS_INI_FILE,
+                 journal_path=EXECUTED_EVENTS_FILE):
+        self.now = now
+        self.schedule_path = schedule_path
+        self.revision = None       # revision of the compiled schedule in use
+        self.events = frozenset()  # keys of the loaded window
+        self.pending = set()       # keys still waiting to fire
+        self.queue = []            # heap of keys (time-ordered); keys missing from pending are cancelled
+        self.timer = timer or DeadlineTimer()
+        self.settings = SettingsCache(settings_path)
+        self.watcher = watcher or FileWatcher(CONFIG_DIR, [
+            os.path.basename(settings_path),
+            os.path.basename(schedule_path),
+        ])
+        self.reload_requested = False
+        self.finished = deque()  # PlayRequests handed over by the player thread
+        self.armed = {}  # event key -> armed PlayRequest, None if the player was busy
+        self.player = player or Player(AUDIO_DIR)
+        self.player.on_finished = self.playback_finished
+        self.executed_events = self.load_executed_events(journal_path)
         self.load_schedule()
 
-    def load_executed_events(self):
-        if os.path.exists(EXECUTED_EVENTS_FILE):
-            with open(EXECUTED_EVENTS_FILE, "r") as f:
-                return set(json.load(f))
-        return set()
+    def load_executed_events(self, path):
+        journal = EventJournal(path)
 
-    def save_executed_events(self):
-        with open(EXECUTED_EVENTS_FILE, "w") as f:
-            json.dump(list(self.executed_events), f)
+        # One-time import of the old JSON list of "YYYY-MM-DD_HH:MM_type" ids
+        if path == EXECUTED_EVENTS_FILE and not len(journal) and os.path.exists(LEGACY_EXECUTED_EVENTS_FILE):
+            try:
+                with open(LEGACY_EXECUTED_EVENTS_FILE, "r") as f:
+                    legacy_ids = json.load(f)
+                for eid in legacy_ids:
+                    stamp, event_type = eid[:16], eid[17:]
+                    dt = datetime.strptime(stamp, "%Y-%m-%d_%H:%M")
+                    if event_type in EVENT_TYPES:
+                        journal.add(make_key(epoch_minute(dt), EVENT_KINDS[event_type]))
+                logger.info(f"Imported {len(journal)} executed events from {LEGACY_EXECUTED_EVENTS_FILE}")
+                journal.compact(epoch_minute(self.now()))
+                os.remove(LEGACY_EXECUTED_EVENTS_FILE)
+            except (OSError, ValueError) as e:
+                logger.error(f"Failed to import {LEGACY_EXECUTED_EVENTS_FILE}: {e}")
+        return journal
 
     def load_schedule(self):
-        self.schedule.clear()
-        if not os.path.exists(PRAYER_PYTHON_MAP_FILE): return
-        
-        prayer_globals = {}
-        with open(PRAYER_PYTHON_MAP_FILE, "r") as f:
-            exec(f.read(), {}, prayer_globals)
-        
-        prayer_times = prayer_globals.get("prayerTimes", [])
-        year = datetime.now().year
-        skipped_set = set(load_skipped_events())
-        q_time = load_quran_time()
-
-        for row in prayer_times:
-            month = int(row.get("Month", row.get("month", 1)))
-            day = int(row.get("Day", row.get("day", 1)))
-
-            # Schedule Prayers
-            for label in PRAYER_LABELS:
-                if label.lower() in skipped_set: continue
-                time_str = str(row.get(label, row.get(label.lower(), "nan"))).strip()
-                if time_str.lower() == "nan": continue
-                try:
-                    dt = datetime.strptime(f"{year}-{month:02d}-{day:02d} {time_str}", "%Y-%m-%d %H:%M")
-                    self.schedule.append({"datetime": dt, "type": label.lower()})
-                except: continue
-
-            # Schedule Quran for this day
-            if "quran" not in skipped_set and q_time:
-                q_dt = datetime.combine(datetime(year, month, day).date(), q_time)
-                self.schedule.append({"datetime": q_dt, "type": "quran"})
-
-        logger.info(f"Loaded {len(self.schedule)} events.")
+        """Adopts the current schedule file and settings.
+
+        Runs between deadlines and only swaps the difference in, so events that
+        did not change keep their place (and their pre-armed audio) even when a
+        new revision lands seconds before they are due.
+        """
+        self.executed_events.compact(epoch_minute(self.now()))
+        settings = self.settings.current()
+        self.player.measure_onset = settings.measure_onset
+        try:
+            store = ScheduleStore(self.schedule_path, settings.offsets)
+        except (OSError, ScheduleFormatError) as e:
+            if self.revision is not None:
+                logger.error(f"Cannot open compiled schedule, keeping revision {self.revision}: {e}")
+                return
+            logger.error(f"Cannot open compiled schedule: {e}")
+            self.disarm()
+            self.apply_events(frozenset())
+            return
+
+        window = build_window(store, settings, self.now().date(), SCHEDULE_WINDOW_DAYS)
+        if store.revision != self.revision:
+            logger.info(f"Adopted schedule revision {store.revision}.")
+        self.revision = store.revision
+        store.close()
+        logger.info(f"Loaded {len(window)} events.")
+        self.apply_events(window.keys())
+        self.disarm_stale()
+
+    def apply_events(self, new_keys):
+        """Queues added event keys and cancels removed ones; the rest stay untouched."""
+        added = new_keys - self.events
+        removed = self.events - new_keys
+        self.pending -= removed
+
+        cutoff_minute = (self.now().timestamp() - MISSED_EVENT_GRACE_SECONDS) / 60
+        for key in added:
+            if key_minute(key) > cutoff_minute and key not in self.executed_events:
+                self.pending.add(key)
+                heapq.heappush(self.queue, key)
+
+        self.events = new_keys
+
+        # Drop cancelled entries once they dominate the heap
+        if len(self.queue) > 2 * len(self.pending) + 64:
+            self.queue = list(self.pending)
+            heapq.heapify(self.queue)
+
+        logger.info(f"Schedule updated: {len(added)} added, {len(removed)} removed, "
+                    f"{len(self.pending)} upcoming.")
+
+    def reset_queue(self):
+        self.disarm()
+        self.events = frozenset()
+        self.pending = set()
+        self.queue = []
+
+    def request_reload(self, *_):
+        self.reload_requested = True
+        self.timer.wake()
+
+    def playback_finished(self, request):
+        """Player callback, runs on the player thread: hand over to the main loop."""
+        if request.tag is not None:
+            self.finished.append(request)
+            self.timer.wake()
 
     def execute_athan(self, event):
-        eid = f"{event['datetime'].strftime('%Y-%m-%d_%H:%M')}_{event['type']}"
-        audio_files = get_audio_for_event(event["type"])
-        
-        # ALWAYS send two parameters: [script, event_type, audio_list]
-        cmd = [PLAYER_APP_SCRIPT_FILE, event["type"], audio_files]
+        key = event.key
+        audio_files = self.settings.current().audio_for(event.type)
+
+        # Recorded before playing, so a restart mid-playback does not repeat it
+        self.executed_events.add(key, STATUS_STARTED, epoch_minute(self.now()))
+        request = self.armed.pop(key, None)
+        if request is not None and request.result is None:
+            logger.info(f"Released armed {event.type} with audio: {','.join(request.names)}")
+            return
+        self.player.play(event.type, audio_files, tag=key, due=event.timestamp)
+        logger.info(f"Dispatched {event.type} with audio: {','.join(audio_files)}")
+
+    def arm_next_event(self):
+        """Lets the player prepare the next event's audio PREARM seconds ahead."""
+        prearm_seconds = self.settings.current().prearm_seconds
+        self.drop_cancelled()
+        if not prearm_seconds or not self.queue:
+            return
+        key = self.queue[0]
+        due = key_minute(key) * 60
+        now = self.now().timestamp()
+        if key in self.armed or due <= now or due - now > prearm_seconds:
+            return
+        event = Event.from_key(key)
+        audio_files = self.settings.current().audio_for(event.type)
+        self.armed[key] = self.player.arm(event.type, audio_files, due, tag=key)
+
+    def disarm_stale(self):
+        """Cancels armed audio whose event was dropped or whose audio files changed."""
+        settings = self.settings.current()
+        for key, request in list(self.armed.items()):
+            if (request is not None and request.result is None and key in self.pending
+                    and request.names == settings.audio_for(request.event_type)):
+                continue
+            if request is not None:
+                self.player.cancel(request)
+            del self.armed[key]
+
+    def disarm(self):
+        for request in self.armed.values():
+            if request is not None:
+                self.player.cancel(request)
+        self.armed = {}
+
+    def collect_finished(self):
+        """Records the outcome of playbacks that ended since the last call."""
+        while self.finished:
+            request = self.finished.popleft()
+            if self.executed_events.status(request.tag) is None:
+                continue  # armed and dropped before it was due
+            if request.result == RESULT_FAILED:
+                self.executed_events.add(request.tag, STATUS_FAILED)
+                logger.error(f"Failed to execute {request.event_type}")
+            else:
+                self.executed_events.add(request.tag, STATUS_DONE)
+                logger.info(f"Executed {request.event_type} ({request.result})")
+
+    def fire_due_events(self):
+        while self.queue and key_minute(self.queue[0]) * 60 <= self.now().timestamp():
+            key = heapq.heappop(self.queue)
+            if key not in self.pending:
+                continue  # cancelled
+            self.pending.discard(key)
+            if key in self.executed_events:
+                continue  # already played
+
+            event = Event.from_key(key)
+            now = self.now()
+            if now.timestamp() - event.timestamp >= MISSED_EVENT_GRACE_SECONDS:
+                logger.warning(f"Missed {event.type} scheduled at {event.when}")
+                continue
+
+            logger.info(f"Triggering {event.type} at {now}")
+            self.execute_athan(event)
+
+    def drop_cancelled(self):
+        while self.queue and self.queue[0] not in self.pending:
+            heapq.heappop(self.queue)
+
+    def next_deadline(self, reload_at):
+        """Epoch time of the next thing to do: an event, its pre-arm, a reload or a poll."""
+        self.drop_cancelled()
+        now = self.now().timestamp()
+        deadline = reload_at.timestamp()
+        if self.queue:
+            key = self.queue[0]
+            due = key_minute(key) * 60
+            prearm_seconds = self.settings.current().prearm_seconds
+            if prearm_seconds and key not in self.armed:
+                due = max(due - prearm_seconds, now)
+            deadline = min(deadline, due)
+        if self.watcher.fileno() is None:
+            deadline = min(deadline, now + WATCH_POLL_SECONDS)
+        return deadline
 
-        try:
-            subprocess.run(cmd, check=True, cwd=CONFIG_DIR)
-            self.executed_events.add(eid)
-            self.save_executed_events()
-            logger.info(f"Executed {event['type']} with audio: {audio_files}")
-        except Exception as e:
-            logger.error(f"Failed to execute {event['type']}: {e}")
     def run(self):
         logger.info("Scheduler started.")
+        signal.signal(signal.SIGHUP, self.request_reload)
+        ControlServer(self.player, PLAYER_CONTROL_SOCKET).start()
+        self.loop()
+
+    def loop(self):
+        reload_at = next_midnight(self.now())
+        watch_fds = [self.watcher.fileno()] if self.watcher.fileno() is not None else []
+
         while True:
-            now = datetime.now()
-            for event in self.schedule:
-                eid = f"{event['datetime'].strftime('%Y-%m-%d_%H:%M')}_{event['type']}"
-    
-                # Skip if already executed
-                if eid in self.executed_events:
-                    continue
-    
-                # Only consider today's events
-                if event["datetime"].date() != now.date():
-                    continue
-    
-                # Calculate seconds from scheduled event
-                delay = (now - event["datetime"]).total_seconds()
-    
-                # If event is scheduled for this minute (0 <= delay < 60)
-                if 0 <= delay < 60:
-                    # Try to execute at every second until it succeeds
-                    for sec_offset in range(60 - int(delay)):
-                        now = datetime.now()
-                        current_second = now.second
-                        target_second = event["datetime"].second  # usually 0
-                        if current_second == target_second:
-                            logger.info(f"Triggering {event['type']} at {now}")
-                            self.execute_athan(event)
-                            break  # stop checking once executed
-                        time.sleep(1)  # check every second
-
-            # Reload schedule at midnight (Fixed Indentation: Moved inside the while loop)
-            if now.hour == 0 and now.minute == 0 and now.second < 10:
+            self.collect_finished()
+            self.fire_due_events()
+            self.arm_next_event()
+
+            # Reload schedule at midnight or when asked to (SIGHUP)
+            now = self.now()
+            if self.reload_requested or now >= reload_at:
+                self.reload_requested = False
                 self.load_schedule()
-                time.sleep(10)
+                reload_at = next_midnight(now)
+                continue
+
+            # Sleep until the next deadline; only a reload, a finished playback,
+            # a settings/schedule change or a clock change wakes us early
+            reason = self.timer.wait_until(self.next_deadline(reload_at), watch_fds)
+            if reason == WAKE_CLOCK_CHANGED:
+                logger.info("System clock changed, reloading the schedule.")
+                self.reset_queue()
+                self.reload_requested = True
 
-            time.sleep(1)  # check loop every second for high accuracy (Fixed Indentation: Moved inside the while loop)
+            changed = self.watcher.changes() if reason == WAKE_FD_READY or not watch_fds else ()
+            if changed:
+                logger.info(f"Detected change in {', '.join(sorted(changed))}, applying it.")
+                self.load_schedule()
 
 if __name__ == "__main__":
+    setup_logging()
     AthanScheduler().run()
@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+"""Long-lived audio player of the scheduler service.
+
+One Player lives for the whole service. It owns a single VLC instance
+(python-vlc), so the decoder and the audio sink stay initialised between
+events. When python-vlc is not installed it falls back to starting cvlc per
+request. Requests go through a priority queue worked off by one thread:
+the five daily prayers preempt whatever is playing, anything else is skipped
+while audio is playing (the same rules play_audio.sh enforced with pkill and
+flock). play() never blocks: the returned PlayRequest can be waited on, or
+the Player can be given an on_finished callback that receives every finished
+request.
+
+arm() prepares an event ahead of time: the files are opened, decoded and the
+audio output is started with the first file paused, then the audio is
+released on an absolute-deadline timer, so it starts on the second rather
+than after process start and decoder setup. With measure_onset set, the
+delay between the due time and audible playback is logged for every event.
+
+ControlServer exposes the player on a Unix socket ("play", "stop",
+"status"), see config/scripts/player_ctl.py.
+"""
+import heapq
+import itertools
+import logging
+import os
+import socket
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+try:
+    import vlc
+except ImportError:
+    vlc = None
+
+from deadline_timer import DeadlineTimer, WAKE_DEADLINE
+
+# ──────────────────────────────────────────────────────────────
+# Constants
+# ──────────────────────────────────────────────────────────────
+PRIORITY_PRAYERS = ("fajr", "dhuhr", "asr", "maghrib", "isha")
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+# Isha at or after this hour plays the Fajr audio instead
+LATE_ISHA_HOUR = 22
+
+AUDIO_EXTENSION = ".mp3"
+
+# How long preparing an armed request may take before it counts as failed
+PREPARE_TIMEOUT_SECONDS = 3
+ONSET_POLL_SECONDS = 0.002
+
+RESULT_DONE = "done"
+RESULT_PREEMPTED = "preempted"
+RESULT_STOPPED = "stopped"
+RESULT_BUSY = "busy"
+RESULT_NO_FILES = "no_files"
+RESULT_FAILED = "failed"
+
+logger = logging.getLogger("scheduler.player")
+
+
+def configure_audio_environment():
+    """Session variables VLC needs to reach PulseAudio from a system service."""
+    uid = os.getuid()
+    os.environ.setdefault("XDG_RUNTIME_DIR", f"/run/user/{uid}")
+    os.environ.setdefault("PULSE_SERVER", f"unix:/run/user/{uid}/pulse/native")
+    os.environ.setdefault("DBUS_SESSION_BUS_ADDRESS", f"unix:path=/run/user/{uid}/bus")
+    os.environ.setdefault("DISPLAY", ":0")
+
+
+# ──────────────────────────────────────────────────────────────
+# Audio file index
+# ──────────────────────────────────────────────────────────────
+
+class AudioIndex:
+    """Cached listing of audio/<event_type>/*.mp3, refreshed when a directory changes."""
+
+    def __init__(self, audio_dir):
+        self.audio_dir = audio_dir
+        self._dirs = {}  # event_type -> (mtime_ns, sorted file names)
+
+    def files(self, event_type):
+        directory = os.path.join(self.audio_dir, event_type)
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            return ()
+        cached = self._dirs.get(event_type)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        names = tuple(sorted(
+            name for name in os.listdir(directory) if name.lower().endswith(AUDIO_EXTENSION)
+        ))
+        self._dirs[event_type] = (mtime, names)
+        return names
+
+    def resolve(self, event_type, names, now=None):
+        """Full paths to play for the event; all files of the directory if `names` is empty."""
+        now = now or datetime.now()
+        if event_type == "isha" and now.hour >= LATE_ISHA_HOUR:
+            event_type, names = "fajr", ()
+
+        directory = os.path.join(self.audio_dir, event_type)
+        available = self.files(event_type)
+        if not names:
+            return [os.path.join(directory, name) for name in available]
+
+        paths = []
+        for name in names:
+            if name in available:
+                paths.append(os.path.join(directory, name))
+            else:
+                logger.warning(f"Audio file not found: {os.path.join(directory, name)}")
+        return paths
+
+
+# ──────────────────────────────────────────────────────────────
+# Backends
+# ──────────────────────────────────────────────────────────────
+
+class VlcBackend:
+    """In-process libvlc player; the instance and its audio output stay open."""
+
+    def __init__(self):
+        self.instance = vlc.Instance("--no-video", "--quiet")
+        self.media_player = self.instance.media_player_new()
+        self.list_player = self.instance.media_list_player_new()
+        self.list_player.set_media_player(self.media_player)
+        self._finished = threading.Event()
+        self._paused = threading.Event()
+        self._failed = False
+
+        events = self.list_player.event_manager()
+        events.event_attach(vlc.EventType.MediaListPlayerPlayed, self._on_finished)
+        events.event_attach(vlc.EventType.MediaListPlayerStopped, self._on_finished)
+        player_events = self.media_player.event_manager()
+        player_events.event_attach(vlc.EventType.MediaPlayerEncounteredError, self._on_error)
+        player_events.event_attach(vlc.EventType.MediaPlayerPaused, self._on_paused)
+
+    def _on_finished(self, _event):
+        self._finished.set()
+
+    def _on_error(self, _event):
+        self._failed = True
+
+    def _on_paused(self, _event):
+        self._paused.set()
+
+    def _load(self, paths, paused):
+        self._finished.clear()
+        self._paused.clear()
+        self._failed = False
+        media_list = self.instance.media_list_new()
+        for i, path in enumerate(paths):
+            media = self.instance.media_new(path)
+            if paused and i == 0:
+                media.add_option(":start-paused")
+            media_list.add_media(media)
+        self.list_player.set_media_list(media_list)
+        self.list_player.play()
+
+    def start(self, paths):
+        self._load(paths, paused=False)
+
+    def prepare(self, paths):
+        """Opens the files, decoder and audio output, holding the first file paused."""
+        self._load(paths, paused=True)
+        if not self._paused.wait(PREPARE_TIMEOUT_SECONDS):
+            raise RuntimeError("libvlc did not reach the paused state")
+
+    def release(self):
+        self.media_player.set_pause(0)
+
+    def audible_at(self, timeout=1.0):
+        """Epoch time the playback position started moving, None on timeout."""
+        position = max(self.media_player.get_time(), 0)
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            now = self.media_player.get_time()
+            if now > position:
+                return time.time() - (now - position) / 1000
+            time.sleep(ONSET_POLL_SECONDS)
+        return None
+
+    def stop(self):
+        self.list_player.stop()
+        self._finished.set()
+
+    def wait(self, timeout=None):
+        return self._finished.wait(timeout)
+
+    def failed(self):
+        return self._failed
+
+
+class ProcessBackend:
+    """Fallback without python-vlc: one cvlc process per request."""
+
+    def __init__(self):
+        self.proc = None
+
+    def start(self, paths):
+        self.proc = subprocess.Popen(
+            ["cvlc", "--intf", "dummy", "--no-video", "--play-and-exit", *paths],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    def prepare(self, paths):
+        """Starts cvlc with the first file paused; release() resumes it over stdin."""
+        self.proc = subprocess.Popen(
+            ["cvlc", "--intf", "rc", "--rc-fake-tty", "--no-video", "--play-and-exit",
+             paths[0], ":start-paused", *paths[1:]],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+
+    def release(self):
+        self.proc.stdin.write(b"play\n")
+        self.proc.stdin.flush()
+
+    def audible_at(self, timeout=1.0):
+        """cvlc gives no feedback, so this is the time the command was sent."""
+        return time.time()
+
+    def stop(self):
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+    def wait(self, timeout=None):
+        try:
+            self.proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        if self.proc.stdin is not None:
+            self.proc.stdin.close()
+        return True
+
+    def failed(self):
+        return self.proc.returncode not in (0, None)
+
+
+def default_backend():
+    if vlc is not None:
+        try:
+            return VlcBackend()
+        except Exception as e:
+            logger.error(f"Cannot initialise libvlc, falling back to cvlc: {e}")
+    return ProcessBackend()
+
+
+# ──────────────────────────────────────────────────────────────
+# Player
+# ──────────────────────────────────────────────────────────────
+
+class PlayRequest:
+    def __init__(self, event_type, names, priority, tag=None, on_finished=None, due=None):
+        self.event_type = event_type
+        self.names = tuple(names)
+        self.priority = priority
+        self.tag = tag  # caller's id for the request, e.g. an event key
+        self.due = due  # epoch time the audio should start, if it has one
+        self.armed = False     # prepared ahead and released at `due`
+        self.released = False  # audio started
+        self.onset_error = None  # seconds between `due` and audible start (measure mode)
+        self.interrupted = None  # RESULT_PREEMPTED / RESULT_STOPPED once interrupted
+        self.result = None
+        self._on_finished = on_finished
+        self._done = threading.Event()
+
+    def finish(self, result):
+        self.result = result
+        self._done.set()
+        if self._on_finished is not None:
+            try:
+                self._on_finished(self)
+            except Exception as e:
+                logger.error(f"on_finished callback failed for {self.event_type}: {e}")
+
+    def wait(self, timeout=None):
+        """Blocks until the request is finished; returns its result (None on timeout)."""
+        self._done.wait(timeout)
+        return self.result
+
+
+class Player:
+    def __init__(self, audio_dir, backend=None, on_finished=None):
+        configure_audio_environment()
+        self.on_finished = on_finished
+        self.measure_onset = False  # log the onset error of every request with a due time
+        self.index = AudioIndex(audio_dir)
+        self.backend = backend or default_backend()
+        self._lock = threading.Condition()
+        self._queue = []  # heap of (priority, seq, request)
+        self._seq = itertools.count()
+        self._current = None
+        self._release_timer = DeadlineTimer()
+        self._thread = threading.Thread(target=self._worker, name="player", daemon=True)
+        self._thread.start()
+        logger.info(f"Player ready ({type(self.backend).__name__}).")
+
+    def _request(self, event_type, names, tag, due):
+        priority = PRIORITY_HIGH if event_type in PRIORITY_PRAYERS else PRIORITY_NORMAL
+        return PlayRequest(event_type, names, priority, tag, self.on_finished, due)
+
+    def _interrupt_current(self, reason):
+        self._current.interrupted = reason
+        self.backend.stop()
+        self._release_timer.wake()
+
+    def play(self, event_type, names=(), tag=None, due=None):
+        """Queues audio for the event and returns its PlayRequest right away.
+
+        Priority prayers preempt whatever is playing (or armed); other events
+        are finished with RESULT_BUSY while something is playing.
+        """
+        request = self._request(event_type, names, tag, due)
+        with self._lock:
+            current = self._current
+            if current is not None:
+                if request.priority != PRIORITY_HIGH:
+                    request.finish(RESULT_BUSY)
+                    return request
+                logger.info(f"{event_type} preempts {current.event_type}.")
+                self._interrupt_current(RESULT_PREEMPTED)
+            heapq.heappush(self._queue, (request.priority, next(self._seq), request))
+            self._lock.notify()
+        return request
+
+    def arm(self, event_type, names, due, tag=None):
+        """Prepares the event's audio now and starts it at the epoch time `due`.
+
+        Returns None when the player is busy; the event then has to be played
+        with play() when it is due.
+        """
+        request = self._request(event_type, names, tag, due)
+        request.armed = True
+        with self._lock:
+            if self._current is not None or self._queue:
+                return None
+            self._current = request
+            heapq.heappush(self._queue, (request.priority, next(self._seq), request))
+            self._lock.notify()
+        return request
+
+    def cancel(self, request):
+        """Drops an armed request that has not started playing yet."""
+        with self._lock:
+            if request.released or request.result is not None or request.interrupted:
+                return
+            request.interrupted = RESULT_STOPPED
+            if self._current is request:
+                self.backend.stop()
+                self._release_timer.wake()
+
+    def stop(self):
+        """Stops playback and drops everything queued."""
+        with self._lock:
+            for _, _, request in self._queue:
+                request.interrupted = RESULT_STOPPED
+            if self._current is not None:
+                self._interrupt_current(RESULT_STOPPED)
+
+    def status(self):
+        with self._lock:
+            current = self._current
+            if current is None:
+                return None
+            return current.event_type if current.released else f"{current.event_type} (armed)"
+
+    def _worker(self):
+        while True:
+            with self._lock:
+                while not self._queue:
+                    self._lock.wait()
+                _, _, request = heapq.heappop(self._queue)
+                if request.interrupted:
+                    self._current = None
+                    request.finish(request.interrupted)
+                    continue
+                # The request counts as current while it is being started, so
+                # play() preempts it or answers busy without waiting for the lock
+                self._current = request
+
+            # Resolving and preparing can take seconds; play(), cancel(), stop()
+            # and status() are not held up meanwhile
+            # Files are chosen for the due time: an armed request is resolved ahead of it
+            due = datetime.fromtimestamp(request.due) if request.due else None
+            paths = self.index.resolve(request.event_type, request.names, now=due)
+            result = None
+            if not paths:
+                logger.warning(f"No audio files to play for {request.event_type}.")
+                result = RESULT_NO_FILES
+            else:
+                try:
+                    if request.armed:
+                        self.backend.prepare(paths)
+                    else:
+                        self.backend.start(paths)
+                except Exception as e:
+                    if not request.interrupted:
+                        logger.error(f"Cannot play {request.event_type}: {e}")
+                    result = RESULT_FAILED
+
+            with self._lock:
+                if request.interrupted or result is not None:
+                    # Preempted, cancelled or stopped while starting, or it failed
+                    if result != RESULT_NO_FILES:
+                        self.backend.stop()
+                    self._current = None
+                    request.finish(request.interrupted or result)
+                    continue
+                if request.armed:
+                    logger.info(f"Armed {request.event_type}: {len(paths)} file(s), "
+                                f"starts at {datetime.fromtimestamp(request.due).time()}.")
+                else:
+                    request.released = True
+                    logger.info(f"Playing {request.event_type}: {len(paths)} file(s).")
+
+            if request.armed:
+                self._release(request)
+            if self.measure_onset and request.released and request.due is not None:
+                self._measure(request)
+
+            self.backend.wait()
+
+            with self._lock:
+                self._current = None
+            if request.interrupted:
+                request.finish(request.interrupted)
+            else:
+                request.finish(RESULT_FAILED if self.backend.failed() else RESULT_DONE)
+
+    def _release(self, request):
+        """Waits for the armed request's due time on an absolute timer, then unpauses it."""
+        while request.interrupted is None:
+            if self._release_timer.wait_until(request.due) == WAKE_DEADLINE:
+                break
+        with self._lock:
+            if request.interrupted is None:
+                self.backend.release()
+                request.released = True
+                logger.info(f"Playing {request.event_type} (armed).")
+
+    def _measure(self, request):
+        audible = self.backend.audible_at()
+        if audible is None:
+            logger.warning(f"Onset of {request.event_type}: playback did not start within 1 s.")
+            return
+        request.onset_error = audible - request.due
+        logger.info(f"Onset of {request.event_type}: {request.onset_error * 1000:+.0f} ms "
+                    f"({'armed' if request.armed else 'not armed'}).")
+
+
+# ──────────────────────────────────────────────────────────────
+# Control socket
+# ──────────────────────────────────────────────────────────────
+
+class ControlServer:
+    """Line-based control API on a Unix socket.
+
+    play <event_type> [file1.mp3,file2.mp3]  ->  queued | busy
+    stop                                     ->  ok
+    status                                   ->  playing <event_type> | idle
+    """
+
+    def __init__(self, player, path):
+        self.player = player
+        self.path = path
+        if os.path.exists(path):
+            os.remove(path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(path)
+        self.sock.listen(4)
+        self._thread = threading.Thread(target=self._serve, name="player-control", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def _serve(self):
+        while True:
+            conn, _ = self.sock.accept()
+            with conn:
+                try:
+                    line = conn.makefile("r").readline().strip()
+                    conn.sendall((self.handle(line) + "\n").encode())
+                except OSError as e:
+                    logger.error(f"Player control connection failed: {e}")
+
+    def handle(self, line):
+        parts = line.split(None, 2)
+        command = parts[0].lower() if parts else ""
+        if command == "play" and len(parts) >= 2:
+            names = [n.strip() for n in parts[2].split(",") if n.strip()] if len(parts) == 3 else []
+            request = self.player.play(parts[1].lower(), names)
+            return RESULT_BUSY if request.result == RESULT_BUSY else "queued"
+        if command == "stop":
+            self.player.stop()
+            return "ok"
+        if command == "status":
+            current = self.player.status()
+            return f"playing {current}" if current else "idle"
+        return "error: usage: play <event_type> [files] | stop | status"
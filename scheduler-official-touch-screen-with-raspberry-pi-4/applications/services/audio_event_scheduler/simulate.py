@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""Replays the scheduler on a virtual clock.
+
+AthanScheduler runs unchanged, but its clock, timer and player are fakes:
+every sleep jumps the clock straight to the deadline and every play is
+recorded instead of heard. A whole year, with its midnight reloads, the
+year rollover and restarts at random times of day, takes seconds.
+
+The result is a timeline of fired events, plus every event of the compiled
+schedule that was missed, fired twice or fired without being scheduled.
+The exit status is 1 if there were any, so the script can gate a config
+change before it goes to a device.
+
+Usage:
+    simulate.py [--start 2026-01-01] [--days 365] [--restarts 12] [--seed 1]
+                [--config-dir DIR] [--timeline FILE] [--verbose]
+"""
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import main
+from deadline_timer import WAKE_DEADLINE, WAKE_REQUESTED
+from event_journal import make_key
+from player import PlayRequest, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_PRAYERS, RESULT_DONE, RESULT_STOPPED
+from schedule_store import ScheduleStore, COLUMNS
+from settings_snapshot import SettingsCache
+
+# How long a fake playback lasts
+PLAY_SECONDS = 120
+
+
+class SimulationEnd(Exception):
+    pass
+
+
+class Restart(Exception):
+    pass
+
+
+# ──────────────────────────────────────────────────────────────
+# Fakes
+# ──────────────────────────────────────────────────────────────
+
+class VirtualClock:
+    def __init__(self, start):
+        self.current = start
+
+    def now(self):
+        return self.current
+
+
+class VirtualTimer:
+    """DeadlineTimer stand-in: wait_until() moves the clock instead of sleeping."""
+    uses_timerfd = True
+
+    def __init__(self, clock, end, restart_at=None):
+        self.clock = clock
+        self.end = end
+        self.restart_at = restart_at
+        self.player = None
+        self.wakeups = 0
+        self._woken = False
+
+    def wake(self):
+        self._woken = True
+
+    def wait_until(self, deadline, extra_fds=()):
+        if self._woken:
+            self._woken = False
+            return WAKE_REQUESTED
+        target = max(datetime.fromtimestamp(deadline), self.clock.current)
+        if self.restart_at is not None and target >= self.restart_at:
+            self.clock.current = self.restart_at
+            raise Restart()
+        if target >= self.end:
+            self.clock.current = self.end
+            raise SimulationEnd()
+        self.clock.current = target
+        self.wakeups += 1
+        self.player.settle()
+        return WAKE_DEADLINE
+
+
+class IdleWatcher:
+    """FileWatcher stand-in that never reports a change."""
+
+    def __init__(self):
+        self._r, self._w = os.pipe()
+
+    def fileno(self):
+        return self._r
+
+    def changes(self):
+        return set()
+
+    def close(self):
+        os.close(self._r)
+        os.close(self._w)
+
+
+class FakePlayer:
+    """Records plays on the shared timeline; each one "lasts" PLAY_SECONDS."""
+
+    def __init__(self, clock, timeline):
+        self.clock = clock
+        self.timeline = timeline  # list of (datetime, event_type, key, armed)
+        self.on_finished = None
+        self.measure_onset = False
+        self._armed = []
+        self._playing = []  # (end datetime, request)
+
+    def _request(self, event_type, names, tag, due):
+        priority = PRIORITY_HIGH if event_type in PRIORITY_PRAYERS else PRIORITY_NORMAL
+        return PlayRequest(event_type, names, priority, tag, self.on_finished, due)
+
+    def _start(self, request, at):
+        request.released = True
+        self.timeline.append((at, request.event_type, request.tag, request.armed))
+        self._playing.append((at + timedelta(seconds=PLAY_SECONDS), request))
+
+    def play(self, event_type, names=(), tag=None, due=None):
+        request = self._request(event_type, names, tag, due)
+        self._start(request, self.clock.now())
+        return request
+
+    def arm(self, event_type, names, due, tag=None):
+        request = self._request(event_type, names, tag, due)
+        request.armed = True
+        self._armed.append(request)
+        return request
+
+    def cancel(self, request):
+        if request in self._armed:
+            self._armed.remove(request)
+            request.finish(RESULT_STOPPED)
+
+    def stop(self):
+        pass
+
+    def status(self):
+        return None
+
+    def settle(self):
+        """Releases armed requests that are due and finishes the ones that ran out."""
+        now = self.clock.now()
+        for request in [r for r in self._armed if r.due <= now.timestamp()]:
+            self._armed.remove(request)
+            self._start(request, datetime.fromtimestamp(request.due))
+        for end, request in [p for p in self._playing if p[0] <= now]:
+            self._playing.remove((end, request))
+            request.finish(RESULT_DONE)
+
+
+# ──────────────────────────────────────────────────────────────
+# Expected events
+# ──────────────────────────────────────────────────────────────
+
+def expected_events(schedule_path, settings_path, start, end):
+    """Keys of every event in [start, end), straight from the compiled schedule."""
+    settings = SettingsCache(settings_path).current()
+    store = ScheduleStore(schedule_path, settings.offsets)
+    columns = [(i, label.lower()) for i, label in enumerate(COLUMNS)
+               if label in main.PRAYER_LABELS and label.lower() not in settings.skipped]
+    expected = {}
+    day = start.date()
+    while day < end.date() + timedelta(days=1):
+        midnight = datetime.combine(day, datetime.min.time())
+        minutes = store.day_for_date(day) or ()
+        events = [(midnight + timedelta(minutes=minutes[i]), event_type)
+                  for i, event_type in columns if minutes and minutes[i] >= 0]
+        if "quran" not in settings.skipped and settings.quran_time:
+            events.append((datetime.combine(day, settings.quran_time), "quran"))
+        for dt, event_type in events:
+            if start <= dt < end:
+                expected[make_key(main.epoch_minute(dt), main.EVENT_KINDS[event_type])] = (dt, event_type)
+        day += timedelta(days=1)
+    store.close()
+    return expected
+
+
+# ──────────────────────────────────────────────────────────────
+# Simulation
+# ──────────────────────────────────────────────────────────────
+
+def simulate(start, end, restart_times, schedule_path, settings_path):
+    clock = VirtualClock(start)
+    timeline = []
+    restarts = sorted(restart_times)
+    wakeups = 0
+    with tempfile.TemporaryDirectory() as var_dir:
+        journal_path = os.path.join(var_dir, "executed-events.journal")
+        while True:
+            restart_at = restarts.pop(0) if restarts else None
+            timer = VirtualTimer(clock, end, restart_at)
+            timer.player = FakePlayer(clock, timeline)
+            watcher = IdleWatcher()
+            scheduler = main.AthanScheduler(
+                now=clock.now, timer=timer, player=timer.player, watcher=watcher,
+                schedule_path=schedule_path, settings_path=settings_path,
+                journal_path=journal_path,
+            )
+            try:
+                scheduler.loop()
+            except Restart:
+                main.logger.info(f"Simulated restart at {clock.now()}")
+                continue
+            except SimulationEnd:
+                return timeline, wakeups + timer.wakeups
+            finally:
+                wakeups += timer.wakeups
+                scheduler.executed_events.close()
+                watcher.close()
+
+
+def report(timeline, expected, out):
+    fired = {key for _, _, key, _ in timeline}
+    seen = set()
+    rows = []
+    for dt, event_type, key, armed in timeline:
+        if key not in expected:
+            kind = "unexpected"
+        elif key in seen:
+            kind = "duplicate"
+        else:
+            kind = "fired"
+        seen.add(key)
+        rows.append((dt, kind, event_type, " (armed)" if armed else ""))
+    for key, (dt, event_type) in expected.items():
+        if key not in fired:
+            rows.append((dt, "missed", event_type, ""))
+    rows.sort()
+    for dt, kind, event_type, note in rows:
+        out.write(f"{dt:%Y-%m-%d %H:%M:%S}\t{kind}\t{event_type}{note}\n")
+    return Counter(kind for _, kind, _, _ in rows)
+
+
+def main_cli(argv):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--start", default=f"{datetime.now().year}-01-01",
+                        help="first simulated day, YYYY-MM-DD")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--restarts", type=int, default=12, help="restarts at random times")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--config-dir", default=main.CONFIG_DIR,
+                        help="directory with config.ini and prayer_times.bin")
+    parser.add_argument("--timeline", help="write the timeline to this file ('-' for stdout)")
+    parser.add_argument("--verbose", action="store_true", help="print the scheduler log")
+    args = parser.parse_args(argv)
+
+    main.logger.handlers.clear()
+    if args.verbose:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        main.logger.addHandler(handler)
+    else:
+        main.logger.addHandler(logging.NullHandler())
+
+    start = datetime.strptime(args.start, "%Y-%m-%d")
+    end = start + timedelta(days=args.days)
+    rng = random.Random(args.seed)
+    span = int((end - start).total_seconds())
+    restart_times = [start + timedelta(seconds=rng.randrange(span)) for _ in range(args.restarts)]
+    schedule_path = os.path.join(args.config_dir, os.path.basename(main.PRAYER_SCHEDULE_FILE))
+    settings_path = os.path.join(args.config_dir, os.path.basename(main.SETTINGS_INI_FILE))
+
+    wall_start = time.perf_counter()
+    timeline, wakeups = simulate(start, end, restart_times, schedule_path, settings_path)
+    wall = time.perf_counter() - wall_start
+
+    expected = expected_events(schedule_path, settings_path, start, end)
+    if args.timeline == "-":
+        counts = report(timeline, expected, sys.stdout)
+    elif args.timeline:
+        with open(args.timeline, "w") as f:
+            counts = report(timeline, expected, f)
+    else:
+        with open(os.devnull, "w") as f:
+            counts = report(timeline, expected, f)
+
+    print(f"Simulated {start:%Y-%m-%d} .. {end:%Y-%m-%d} ({args.days} days, "
+          f"{args.restarts} restarts) in {wall:.1f} s, {wakeups} wake-ups.")
+    print(f"Expected {len(expected)}, fired {counts['fired']}, missed {counts['missed']}, "
+          f"duplicated {counts['duplicate']}, unexpected {counts['unexpected']}.")
+    return 1 if counts["missed"] or counts["duplicate"] or counts["unexpected"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_cli(sys.argv[1:]))
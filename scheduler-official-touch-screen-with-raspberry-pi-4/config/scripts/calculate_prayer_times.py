@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Calculates a year of prayer times for a location.
+
+Writes the same CSV the user fills in (Month,Day,Fajr,Sunrise,Dhuhr,Asr,
+Maghrib,Isha), so the result goes through ingest_prayer_times.py like any
+other input. The rows are checked with the same reader first, and nothing
+is written if ingest would refuse them. With --check the calculated times
+are compared day by day with an existing CSV (e.g. the mosque's printed
+table) and the deviations are printed; the exit status is 1 if any of them
+is over --tolerance minutes.
+
+Usage:
+    calculate_prayer_times.py --lat 52.52 --lng 13.405 --timezone Europe/Berlin
+        [--method MWL] [--asr standard|hanafi] [--high-latitude AngleBased]
+        [--elevation 0] [--year 2026] [--adjust Maghrib=3 ...]
+        [-o output.csv] [--check reference.csv [--tolerance 5]]
+"""
+import argparse
+import io
+import os
+import sys
+import time
+from datetime import date
+
+started = time.perf_counter()
+
+# ===== CONFIGURATION =====
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+DESKTOP_DIR = os.path.dirname(MAIN_DIR)
+
+PRAYER_INPUT_CSV_FILE = os.path.join(DESKTOP_DIR, "إدخال-مواقيت-الصلاة-للمستخدم.csv")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import BASE_COLUMNS, MISSING, MINUTES_PER_DAY
+from prayer_csv import PrayerCsvReader, ERROR, format_issue, format_prayer_csv
+from prayer_calc import (METHODS, DEFAULT_METHOD, ASR_FACTORS, HIGH_LATITUDE_RULES,
+                         DEFAULT_HIGH_LATITUDE_RULE, compute_year, fixed_offset)
+
+DEFAULT_TOLERANCE = 5
+
+
+# ===== OUTPUT =====
+def write_csv(path, text):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# ===== CROSS-CHECK =====
+def deviation(calculated, reference):
+    """Signed minutes from reference to calculated, the short way round midnight."""
+    if MISSING in (calculated, reference):
+        return None
+    return (calculated - reference + MINUTES_PER_DAY // 2) % MINUTES_PER_DAY - MINUTES_PER_DAY // 2
+
+
+def cross_check(days, reference_path, tolerance):
+    """Prints the per-day deviations from the CSV at `reference_path` and a
+    summary per column; returns the number of times over `tolerance`."""
+    with open(reference_path, newline='', encoding='utf-8-sig') as f:
+        reader = PrayerCsvReader(f)
+        reference = {(month, day): base for month, day, base in reader}
+    for issue in reader.issues:
+        print(f"{reference_path}: {format_issue(issue)}")
+
+    print("Date   " + "".join(f"{name:>9}" for name in BASE_COLUMNS))
+    stats = {name: [0, 0, None, 0] for name in BASE_COLUMNS}  # sum, count, worst (dev, date), over
+    for month, day, minutes in days:
+        base = reference.get((month, day))
+        if base is None:
+            continue
+        cells = []
+        for name, calculated, expected in zip(BASE_COLUMNS, minutes, base):
+            dev = deviation(calculated, expected)
+            if dev is None:
+                cells.append(f"{'-':>9}")
+                continue
+            column = stats[name]
+            column[0] += abs(dev)
+            column[1] += 1
+            if column[2] is None or abs(dev) > abs(column[2][0]):
+                column[2] = (dev, f"{month}/{day}")
+            if abs(dev) > tolerance:
+                column[3] += 1
+            cells.append(f"{dev:>+8d}{'!' if abs(dev) > tolerance else ' '}")
+        print(f"{month:>2}/{day:<2}  " + "".join(cells))
+
+    print()
+    print(f"{'':9}{'mean':>6}{'max':>6}  {'on':<6}{'over':>5}")
+    over = 0
+    for name in BASE_COLUMNS:
+        total, count, worst, column_over = stats[name]
+        over += column_over
+        if not count:
+            print(f"{name:9}{'-':>6}")
+            continue
+        print(f"{name:9}{total / count:>6.1f}{worst[0]:>+6d}  {worst[1]:<6}{column_over:>5}")
+    compared = sum(stats[name][1] for name in BASE_COLUMNS)
+    print(f"{compared} times compared, {over} more than {tolerance} min off")
+    return over
+
+
+# ===== MAIN =====
+def adjustment(text):
+    name, _, minutes = text.partition('=')
+    if name not in BASE_COLUMNS:
+        raise argparse.ArgumentTypeError(f"unknown column {name!r}, one of {', '.join(BASE_COLUMNS)}")
+    try:
+        return name, int(minutes)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected {name}=<minutes>, got {text!r}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calculate a year of prayer times for a location.")
+    parser.add_argument('--lat', type=float, required=True, help="latitude in degrees, north positive")
+    parser.add_argument('--lng', type=float, required=True, help="longitude in degrees, east positive")
+    parser.add_argument('--timezone', required=True, help="IANA name (Europe/Berlin) or UTC offset (+3)")
+    parser.add_argument('--method', default=DEFAULT_METHOD, choices=sorted(METHODS))
+    parser.add_argument('--asr', default="standard", choices=sorted(ASR_FACTORS))
+    parser.add_argument('--high-latitude', default=DEFAULT_HIGH_LATITUDE_RULE, choices=HIGH_LATITUDE_RULES)
+    parser.add_argument('--elevation', type=float, default=0, help="metres above the horizon")
+    parser.add_argument('--year', type=int, default=date.today().year,
+                        help="leap years also give the 2/29 row")
+    parser.add_argument('--adjust', type=adjustment, nargs='*', default=[], metavar="COLUMN=MINUTES",
+                        help="minutes added to a column, e.g. Maghrib=3")
+    parser.add_argument('-o', '--output', help=f"CSV to write (default {PRAYER_INPUT_CSV_FILE}, "
+                                               "not written with --check unless given)")
+    parser.add_argument('--check', metavar="REFERENCE_CSV", help="compare with this CSV")
+    parser.add_argument('--tolerance', type=int, default=DEFAULT_TOLERANCE,
+                        help=f"minutes --check accepts (default {DEFAULT_TOLERANCE})")
+    args = parser.parse_args()
+
+    offset = fixed_offset(args.timezone)
+    try:
+        days = compute_year(args.year, args.lat, args.lng,
+                            args.timezone if offset is None else offset,
+                            args.method, args.asr, args.high_latitude, args.elevation,
+                            dict(args.adjust))
+    except (ValueError, KeyError) as e:
+        print(f"Cannot calculate: {e}")
+        sys.exit(1)
+    missing = sum(1 for _, _, minutes in days for m in minutes if m == MISSING)
+    if missing:
+        print(f"warning: {missing} times do not exist at this latitude, try another --high-latitude rule")
+
+    # Checked like ingest_prayer_times.py will, so only a file it accepts is written
+    text = format_prayer_csv(days)
+    reader = PrayerCsvReader(io.StringIO(text, newline=''))
+    for _ in reader:
+        pass
+    errors = [issue for issue in reader.issues if issue.severity == ERROR]
+    for issue in errors:
+        print(f"error: {format_issue(issue)}")
+    if not reader.ok:
+        print(f"{reader.errors} rows would be refused by ingest_prayer_times.py, nothing written")
+        sys.exit(1)
+
+    output = args.output or (None if args.check else PRAYER_INPUT_CSV_FILE)
+    if output:
+        write_csv(output, text)
+        print(f"{len(days)} days written to {output}")
+
+    over = 0
+    if args.check:
+        if not os.path.exists(args.check):
+            print(f"CSV file not found: {args.check}")
+            sys.exit(1)
+        over = cross_check(days, args.check, args.tolerance)
+    print(f"Done in {(time.perf_counter() - started) * 1000:.1f} ms")
+    sys.exit(1 if over else 0)
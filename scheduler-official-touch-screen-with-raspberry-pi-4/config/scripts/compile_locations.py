@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Compiles every location of config/locations.ini into its own schedule.
+
+Each location (a timetable CSV, or coordinates and a method for
+prayer_calc) becomes var/locations/<name>.bin, in the format of
+config/prayer_times.bin. The locations are built side by side in a process
+pool, one per CPU, and a location whose source has not changed since its
+last build is skipped (same fingerprint scheme as ingest_prayer_times.py).
+Calculated locations are worked out for --year, the current year by default,
+and rebuilt once it changes.
+
+Run this wherever there is time and CPU to spare, e.g. after editing the
+catalog; switch_location.py then makes one of the results current without
+any of this work on the unit itself.
+
+Usage:
+    compile_locations.py [--force] [--jobs N] [--year YEAR] [name ...]
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+started = time.perf_counter()
+
+# ===== CONFIGURATION =====
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+CONFIG_DIR = os.path.join(MAIN_DIR, "config")
+VAR_DIR = os.path.join(MAIN_DIR, "var")
+
+LOCATIONS_INI_FILE = os.path.join(CONFIG_DIR, "locations.ini")
+LOCATIONS_DIR = os.path.join(VAR_DIR, "locations")
+LOCATIONS_CACHE_FILE = os.path.join(VAR_DIR, "locations-cache.json")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import FORMAT_VERSION
+from location_catalog import CatalogError, load_catalog, compiled_path
+from prayer_calc import compute_year
+from prayer_csv import format_prayer_csv
+from ingest_prayer_times import (IngestError, CACHE_VERSION, ingest, file_digest,
+                                 load_cache, save_cache, up_to_date)
+
+
+# ===== COMPILE =====
+def fingerprint(location, year):
+    """What a location's schedule is built from; None if its CSV is missing."""
+    prefix = f"v{CACHE_VERSION}.{FORMAT_VERSION}"
+    if location.csv:
+        digest = file_digest(location.csv)
+        return digest and f"{prefix}:csv:{digest}"
+    params = location._replace(name=None, csv=None)._asdict()
+    return f"{prefix}:calc:{year}:{json.dumps(params, sort_keys=True)}"
+
+
+def compile_location(location, path, year):
+    """Builds one location into `path`; returns (days, warnings).
+    Runs in a worker process."""
+    if location.csv:
+        with open(location.csv, 'rb') as f:
+            lines = io.StringIO(f.read().decode('utf-8-sig'), newline='')
+        days, _, warnings = ingest(lines, None, path, None)
+        return days, warnings
+
+    # Checked and compiled exactly like a CSV, so a calculation the ingest
+    # would refuse fails here too
+    days = compute_year(year, location.latitude, location.longitude, location.timezone,
+                        location.method, location.asr, location.high_latitude,
+                        location.elevation, location.adjustments)
+    lines = io.StringIO(format_prayer_csv(days), newline='')
+    days, _, warnings = ingest(lines, None, path, None)
+    return days, warnings
+
+
+def compile_all(catalog, directory, cache_path, year, jobs=None, force=False):
+    """Compiles the out-of-date locations of `catalog` in parallel; returns
+    {name: report line} and the number of locations that failed."""
+    os.makedirs(directory, exist_ok=True)
+    cache = {} if force else load_cache(cache_path)
+    reports, failed = {}, 0
+
+    stale = {}
+    for name, location in catalog.items():
+        path = compiled_path(directory, name)
+        inputs = fingerprint(location, year)
+        if inputs is None:
+            reports[name] = f"failed  {name}: {location.csv} not found"
+            failed += 1
+        elif up_to_date(cache, path, inputs):
+            reports[name] = f"reused  {name}"
+        else:
+            stale[name] = (path, inputs)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {name: pool.submit(compile_location, catalog[name], path, year)
+                       for name, (path, _) in stale.items()}
+            for name, future in futures.items():
+                path, inputs = stale[name]
+                try:
+                    days, warnings = future.result()
+                except (IngestError, OSError, ValueError, KeyError, UnicodeDecodeError) as e:
+                    reports[name] = f"failed  {name}:" + "".join(
+                        f"\n    {line}" for line in str(e).splitlines())
+                    cache.pop(path, None)
+                    failed += 1
+                    continue
+                reports[name] = f"rebuilt {name} ({days} days)" + "".join(
+                    f"\n    warning: {w}" for w in warnings)
+                cache[path] = {'inputs': inputs, 'output': file_digest(path)}
+
+    save_cache(cache_path, {path: entry for path, entry in cache.items() if os.path.exists(path)})
+    return {name: reports[name] for name in catalog}, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the locations of the catalog.")
+    parser.add_argument('names', nargs='*', help="only these locations (default all)")
+    parser.add_argument('--force', action='store_true', help="rebuild even what is up to date")
+    parser.add_argument('--jobs', type=int, help="worker processes (default one per CPU)")
+    parser.add_argument('--year', type=int, default=date.today().year,
+                        help="year of the calculated locations (default this year)")
+    parser.add_argument('--catalog', default=LOCATIONS_INI_FILE)
+    args = parser.parse_args()
+
+    try:
+        catalog = load_catalog(args.catalog)
+    except CatalogError as e:
+        print(e)
+        sys.exit(1)
+    unknown = [name for name in args.names if name not in catalog]
+    if unknown:
+        print(f"Not in {args.catalog}: {', '.join(unknown)}")
+        sys.exit(1)
+    if args.names:
+        catalog = {name: catalog[name] for name in args.names}
+
+    reports, failed = compile_all(catalog, LOCATIONS_DIR, LOCATIONS_CACHE_FILE, args.year,
+                                  args.jobs, args.force)
+    for report in reports.values():
+        print(report)
+    print(f"{len(catalog) - failed} of {len(catalog)} locations compiled "
+          f"in {(time.perf_counter() - started) * 1000:.1f} ms")
+    sys.exit(1 if failed else 0)
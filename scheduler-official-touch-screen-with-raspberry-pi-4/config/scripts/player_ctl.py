@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Talks to the scheduler service's audio player.
+
+Usage:
+    player_ctl.py play <prayer_name> ["file1.mp3,file2.mp3"]
+    player_ctl.py stop
+    player_ctl.py status
+"""
+import os
+import socket
+import sys
+
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+PLAYER_CONTROL_SOCKET = os.path.join(MAIN_DIR, "var", "player.sock")
+
+
+def main(argv):
+    if not argv or argv[0] not in ("play", "stop", "status") or (argv[0] == "play" and len(argv) < 2):
+        print(__doc__.strip())
+        return 1
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(PLAYER_CONTROL_SOCKET)
+        except OSError as e:
+            print(f"Cannot reach the scheduler service at {PLAYER_CONTROL_SOCKET}: {e}")
+            return 1
+        sock.sendall((" ".join(argv) + "\n").encode())
+        reply = sock.makefile("r").readline().strip()
+
+    print(reply)
+    return 1 if reply.startswith("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
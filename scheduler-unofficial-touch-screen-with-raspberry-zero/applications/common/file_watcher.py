@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Notices when files in a directory are written or replaced.
+
+On Linux the directory is watched with inotify, so the watcher has a file
+descriptor that can be passed to select() next to other wake-up sources.
+Files are usually replaced with a rename (temp file + os.replace), which is
+why the directory is watched rather than the files themselves. Without
+inotify, changes() falls back to comparing stat() stamps and the caller has
+to call it periodically.
+"""
+import ctypes
+import ctypes.util
+import os
+import struct
+
+# ──────────────────────────────────────────────────────────────
+# Constants
+# ──────────────────────────────────────────────────────────────
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+        return st.st_mtime_ns, st.st_size, st.st_ino
+    except OSError:
+        return None
+
+
+class FileWatcher:
+    def __init__(self, directory, names):
+        self.directory = directory
+        self.names = set(names)
+        self._fd = -1
+
+        libc = _load_libc()
+        if libc is not None:
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) >= 0:
+                    self._fd = fd
+                else:
+                    os.close(fd)
+
+        self._stamps = {name: _stamp(os.path.join(directory, name)) for name in self.names}
+
+    def fileno(self):
+        """inotify descriptor to select() on, or None when polling."""
+        return self._fd if self._fd >= 0 else None
+
+    def changes(self):
+        """Names of the watched files that changed since the last call."""
+        if self._fd >= 0:
+            return self._read_events()
+
+        changed = set()
+        for name in self.names:
+            stamp = _stamp(os.path.join(self.directory, name))
+            if stamp != self._stamps[name]:
+                self._stamps[name] = stamp
+                changed.add(name)
+        return changed
+
+    def _read_events(self):
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+                offset += length
+                if name in self.names:
+                    changed.add(name)
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""Prayer times from the position of the sun.
+
+compute_year() works out Fajr, Sunrise, Dhuhr, Asr, Maghrib and Isha for
+every day of a year from a latitude, a longitude, a time zone and a
+calculation method. It follows the usual formulation (as in PrayTimes.org):
+the sun's declination and the equation of time give solar noon, and each
+other time is the hour angle at which the sun reaches that prayer's angle
+below (or, for Asr, shadow length above) the horizon.
+
+The year is computed column by column: one list of Julian days, then one
+pass per quantity over all days, so the inner loops stay in plain float
+maths. It is laid out like a vectorised computation but uses lists rather
+than numpy, which the units do not have; a year takes a few tens of ms.
+Times come back as minutes since midnight (MISSING where the sun never
+reaches the angle and no high-latitude rule fills it in), ready for the
+CSV the ingest reads.
+"""
+import math
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+from schedule_store import BASE_COLUMNS, MISSING, MINUTES_PER_DAY
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+# ──────────────────────────────────────────────────────────────
+# Methods
+# ──────────────────────────────────────────────────────────────
+
+# Sun angles below the horizon in degrees. Isha is either an angle or a fixed
+# number of minutes after Maghrib; Maghrib is sunset unless it has an angle.
+Method = namedtuple("Method", "name fajr_angle isha_angle isha_minutes maghrib_angle")
+
+METHODS = {
+    "MWL": Method("Muslim World League", 18, 17, None, None),
+    "ISNA": Method("Islamic Society of North America", 15, 15, None, None),
+    "Egypt": Method("Egyptian General Authority of Survey", 19.5, 17.5, None, None),
+    "Makkah": Method("Umm al-Qura University, Makkah", 18.5, None, 90, None),
+    "Karachi": Method("University of Islamic Sciences, Karachi", 18, 18, None, None),
+    "Tehran": Method("Institute of Geophysics, University of Tehran", 17.7, 14, None, 4.5),
+    "Jafari": Method("Shia Ithna-Ashari, Leva Institute, Qum", 16, 14, None, 4),
+}
+DEFAULT_METHOD = "MWL"
+
+# Shadow length factor for Asr
+ASR_FACTORS = {"standard": 1, "hanafi": 2}
+
+# Where the sun never gets low enough for Fajr/Isha (or gets there absurdly
+# late), these limit them to a portion of the night. NightMiddle can put Isha
+# and Fajr on the same minute around midsummer, hence not the default.
+HIGH_LATITUDE_RULES = ("none", "NightMiddle", "OneSeventh", "AngleBased")
+DEFAULT_HIGH_LATITUDE_RULE = "AngleBased"
+
+# Sun's apparent radius plus refraction at sunrise/sunset
+RISE_SET_ANGLE = 0.833
+
+# First guesses (hours) of each time; the sun's position is taken there
+_GUESSES = {"Fajr": 5, "Sunrise": 6, "Dhuhr": 12, "Asr": 13, "Maghrib": 18, "Isha": 18}
+
+
+# ──────────────────────────────────────────────────────────────
+# Solar position
+# ──────────────────────────────────────────────────────────────
+
+def _dsin(d):
+    return math.sin(math.radians(d))
+
+
+def _dcos(d):
+    return math.cos(math.radians(d))
+
+
+def julian_day(year, month, day):
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = year // 100
+    b = 2 - a + a // 4
+    return math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+
+
+def sun_positions(jds):
+    """(declinations in degrees, equations of time in hours) for a list of Julian days."""
+    declinations, equations = [], []
+    for jd in jds:
+        d = jd - 2451545.0
+        g = math.radians((357.529 + 0.98560028 * d) % 360)
+        q = (280.459 + 0.98564736 * d) % 360
+        lon = math.radians((q + 1.915 * math.sin(g) + 0.020 * math.sin(2 * g)) % 360)
+        e = math.radians(23.439 - 0.00000036 * d)
+        ra = math.degrees(math.atan2(math.cos(e) * math.sin(lon), math.cos(lon))) / 15
+        declinations.append(math.degrees(math.asin(math.sin(e) * math.sin(lon))))
+        equations.append(q / 15 - ra % 24)
+    return declinations, equations
+
+
+# ──────────────────────────────────────────────────────────────
+# Year computation
+# ──────────────────────────────────────────────────────────────
+
+def utc_offsets(tz, days):
+    """UTC offset in hours of each date, taken at local noon (so DST counts).
+    `tz` is an IANA name ("Europe/Berlin") or a fixed number of hours."""
+    if isinstance(tz, (int, float)):
+        return [float(tz)] * len(days)
+    if ZoneInfo is None:
+        raise ValueError("time zone names need Python 3.9+, give the UTC offset in hours")
+    zone = ZoneInfo(tz)
+    return [datetime(d.year, d.month, d.day, 12, tzinfo=zone).utcoffset().total_seconds() / 3600
+            for d in days]
+
+
+def compute_year(year, latitude, longitude, tz, method=DEFAULT_METHOD, asr="standard",
+                 high_latitude=DEFAULT_HIGH_LATITUDE_RULE, elevation=0, adjustments=None):
+    """[(month, day, minutes in BASE_COLUMNS order)] for every date of `year`.
+
+    `adjustments` maps a column to minutes added after rounding, for tables
+    that keep a safety margin.
+    """
+    if isinstance(method, str):
+        method = METHODS[method]
+    asr_factor = ASR_FACTORS[asr]
+    if high_latitude not in HIGH_LATITUDE_RULES:
+        raise ValueError(f"unknown high-latitude rule: {high_latitude}")
+
+    first = date(year, 1, 1)
+    days = [first + timedelta(days=i) for i in range((date(year + 1, 1, 1) - first).days)]
+    # Julian day of local midnight at this longitude
+    jd0 = [julian_day(d.year, d.month, d.day) - longitude / 360 for d in days]
+
+    def position(hours):
+        return sun_positions([jd + h / 24 for jd, h in zip(jd0, hours)])
+
+    def noon(hours):
+        _, eqt = position(hours)
+        return [(12 - e) % 24 for e in eqt]
+
+    def angle_time(angles, hours, before_noon):
+        """Hours at which the sun is angles[i] degrees below the horizon on
+        day i (None if it never is). `angles` is a number or a function of
+        the day's declination."""
+        decl, _ = position(hours)
+        out = []
+        for dec, n in zip(decl, noon(hours)):
+            angle = angles(dec) if callable(angles) else angles
+            cos_t = (-_dsin(angle) - _dsin(dec) * _dsin(latitude)) / (_dcos(dec) * _dcos(latitude))
+            if not -1 <= cos_t <= 1:
+                out.append(None)
+                continue
+            t = math.degrees(math.acos(cos_t)) / 15
+            out.append(n - t if before_noon else n + t)
+        return out
+
+    def asr_angle(dec):
+        # Negative: the sun is above the horizon when the shadow reaches its length
+        return -math.degrees(math.atan(1 / (asr_factor + math.tan(math.radians(abs(latitude - dec))))))
+
+    rise_set = RISE_SET_ANGLE + 0.0347 * math.sqrt(max(elevation, 0))
+
+    def solve(guess):
+        times = {
+            "Fajr": angle_time(method.fajr_angle, guess["Fajr"], True),
+            "Sunrise": angle_time(rise_set, guess["Sunrise"], True),
+            "Dhuhr": noon(guess["Dhuhr"]),
+            "Asr": angle_time(asr_angle, guess["Asr"], False),
+            "Maghrib": angle_time(rise_set, guess["Maghrib"], False),
+        }
+        sunset = times["Maghrib"]
+        if method.maghrib_angle is not None:
+            times["Maghrib"] = angle_time(method.maghrib_angle, guess["Maghrib"], False)
+        if method.isha_minutes is not None:
+            times["Isha"] = [None if m is None else m + method.isha_minutes / 60 for m in times["Maghrib"]]
+        else:
+            times["Isha"] = angle_time(method.isha_angle, guess["Isha"], False)
+        return times, sunset
+
+    # Solve once from fixed guesses, then again with the sun taken at the
+    # times found, which brings them within a few seconds
+    guess = {name: [hours] * len(days) for name, hours in _GUESSES.items()}
+    times, _ = solve(guess)
+    times, sunset = solve({name: [g if t is None else t for t, g in zip(times[name], guess[name])]
+                           for name in guess})
+
+    if high_latitude != "none":
+        nights = [None if r is None or s is None else 24 - (s - r)
+                  for r, s in zip(times["Sunrise"], sunset)]
+
+        def limit(column, angle, base, before):
+            portions = {"NightMiddle": 1 / 2, "OneSeventh": 1 / 7, "AngleBased": angle / 60}
+            out = []
+            for t, b, night in zip(times[column], base, nights):
+                if b is not None and night is not None:
+                    portion = portions[high_latitude] * night
+                    diff = None if t is None else (b - t if before else t - b)
+                    if diff is None or diff > portion:
+                        t = b - portion if before else b + portion
+                out.append(t)
+            times[column] = out
+
+        limit("Fajr", method.fajr_angle, times["Sunrise"], True)
+        if method.isha_minutes is None:
+            limit("Isha", method.isha_angle, sunset, False)
+        if method.maghrib_angle is not None:
+            limit("Maghrib", method.maghrib_angle, sunset, False)
+
+    offsets = utc_offsets(tz, days)
+    adjustments = adjustments or {}
+    columns = []
+    for name in BASE_COLUMNS:
+        shift = adjustments.get(name, 0)
+        columns.append([
+            MISSING if t is None else (math.floor((t + tz_hours - longitude / 15) * 60 + 0.5) + shift) % MINUTES_PER_DAY
+            for t, tz_hours in zip(times[name], offsets)
+        ])
+    return [(d.month, d.day, [column[i] for column in columns]) for i, d in enumerate(days)]
+
+
+def fixed_offset(text):
+    """Hours of a fixed offset like +1, -5.5 or UTC+2; None for a zone name."""
+    value = text.upper().replace("UTC", "").replace("GMT", "").strip()
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return None
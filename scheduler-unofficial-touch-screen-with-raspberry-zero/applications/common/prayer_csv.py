@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Streaming reader and validator for the user's prayer-times CSV.
+
+PrayerCsvReader goes through the file once, row by row, and yields the days
+it could read while collecting every problem with its line number:
+malformed rows, bad times, impossible or repeated dates, prayers out of
+order, and after the last row the days of the year that never showed up
+(a warning: like a missing 2/29, such a day uses the closest earlier day).
+Nothing is kept per row but a seen-slot table, so it costs the same per row
+whatever the size of the file, and a broken file stops producing messages
+after MAX_ISSUES (the errors are still counted).
+"""
+import csv
+import io
+from collections import namedtuple
+
+from schedule_store import BASE_COLUMNS, MISSING, SLOT_COUNT, hhmm_to_minutes, minutes_to_hhmm, slot_for
+
+# ──────────────────────────────────────────────────────────────
+# Format
+# ──────────────────────────────────────────────────────────────
+REQUIRED_COLUMNS = ['Month', 'Day'] + BASE_COLUMNS
+
+ERROR = "error"      # the file cannot be applied
+WARNING = "warning"  # applied, but worth telling the user
+
+MAX_ISSUES = 50
+
+FEB_29_SLOT = slot_for(2, 29)
+
+# line is 0 for problems about the file as a whole
+CsvIssue = namedtuple("CsvIssue", "line severity message")
+
+
+def _slot_date(slot):
+    for month in range(12, 0, -1):
+        first = slot_for(month, 1)
+        if slot >= first:
+            return month, slot - first + 1
+
+
+def _date_ranges(slots):
+    """A sorted list of slots as date ranges, e.g. 3/5-3/9, 4/1."""
+    ranges = []
+    for slot in slots:
+        if ranges and ranges[-1][1] == slot - 1:
+            ranges[-1][1] = slot
+        else:
+            ranges.append([slot, slot])
+    parts = []
+    for first, last in ranges:
+        text = "%d/%d" % _slot_date(first)
+        if last != first:
+            text += "-%d/%d" % _slot_date(last)
+        parts.append(text)
+    return ", ".join(parts)
+
+
+class PrayerCsvReader:
+    """Iterate to get (month, day, base minutes in BASE_COLUMNS order) for every
+    row that is fine; `issues` and `ok` are final once iteration is over."""
+
+    def __init__(self, lines, max_issues=MAX_ISSUES):
+        self.lines = lines
+        self.max_issues = max_issues
+        self.issues = []
+        self.errors = 0
+        self.days = 0
+
+    @property
+    def ok(self):
+        return self.errors == 0
+
+    def _report(self, line, severity, message):
+        if severity == ERROR:
+            self.errors += 1
+        if len(self.issues) < self.max_issues:
+            self.issues.append(CsvIssue(line, severity, message))
+
+    def __iter__(self):
+        reader = csv.reader(self.lines)
+        header = [name.strip() for name in next(reader, [])]
+        missing = [name for name in REQUIRED_COLUMNS if name not in header]
+        if missing:
+            self._report(1, ERROR, f"missing columns: {', '.join(missing)}")
+            return
+        index = [header.index(name) for name in REQUIRED_COLUMNS]
+        width = max(index) + 1
+
+        seen = {}  # slot -> line
+        for row in reader:
+            line = reader.line_num
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) < width:
+                self._report(line, ERROR, f"expected {len(header)} fields, got {len(row)}")
+                continue
+            cells = [row[i].strip() for i in index]
+
+            try:
+                month, day = int(cells[0]), int(cells[1])
+            except ValueError:
+                self._report(line, ERROR, f"invalid date {cells[0]!r}/{cells[1]!r}")
+                continue
+            slot = slot_for(month, day)
+            if slot < 0:
+                self._report(line, ERROR, f"invalid date {month}/{day}")
+                continue
+            if slot in seen:
+                self._report(line, ERROR, f"{month}/{day} already given on line {seen[slot]}")
+                continue
+            seen[slot] = line
+
+            base = []
+            for name, value in zip(BASE_COLUMNS, cells[2:]):
+                try:
+                    base.append(hhmm_to_minutes(value))
+                except ValueError:
+                    self._report(line, ERROR, f"invalid {name} time {value!r}")
+                    base = None
+                    break
+            if base is None:
+                continue
+            if not self._check_order(line, month, day, base):
+                continue
+
+            self.days += 1
+            yield month, day, base
+
+        self._check_year(seen)
+
+    def _check_order(self, line, month, day, base):
+        """Fajr < Sunrise < Dhuhr < Asr < Maghrib, and Isha after Maghrib or,
+        in high-latitude summers, past midnight up to Fajr (the rules that
+        follow the middle of the night can put Isha and Fajr together)."""
+        for name, m in zip(BASE_COLUMNS, base):
+            if m == MISSING:
+                self._report(line, WARNING, f"no {name} time on {month}/{day}, it is skipped")
+        day_part = [(name, m) for name, m in zip(BASE_COLUMNS, base)
+                    if m != MISSING and name != 'Isha']
+        for (a, ma), (b, mb) in zip(day_part, day_part[1:]):
+            if mb <= ma:
+                self._report(line, ERROR, f"{b} ({minutes_to_hhmm(mb)}) is not after "
+                                          f"{a} ({minutes_to_hhmm(ma)})")
+                return False
+        isha = base[BASE_COLUMNS.index('Isha')]
+        if isha != MISSING and day_part:
+            (first_name, first), (last_name, last) = day_part[0], day_part[-1]
+            if first < isha <= last:
+                self._report(line, ERROR, f"Isha ({minutes_to_hhmm(isha)}) is neither after "
+                                          f"{last_name} ({minutes_to_hhmm(last)}) nor at or "
+                                          f"before {first_name} ({minutes_to_hhmm(first)})")
+                return False
+        return True
+
+    def _check_year(self, seen):
+        if not seen:
+            self._report(0, ERROR, "no days in the file")
+            return
+        missing = [slot for slot in range(SLOT_COUNT) if slot not in seen and slot != FEB_29_SLOT]
+        if missing:
+            self._report(0, WARNING, f"missing days: {_date_ranges(missing)}, "
+                                     "they use the times of the closest earlier day")
+        if FEB_29_SLOT not in seen:
+            self._report(0, WARNING, "no 2/29 row, leap years use the 2/28 times")
+
+
+def validate_prayer_csv(path, max_issues=MAX_ISSUES):
+    """Reads the whole file at `path`; returns the PrayerCsvReader with its issues."""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = PrayerCsvReader(f, max_issues)
+        for _ in reader:
+            pass
+    return reader
+
+
+def format_prayer_csv(days):
+    """The CSV text, in the format the reader takes, of (month, day, base
+    minutes) rows such as prayer_calc.compute_year() returns."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(REQUIRED_COLUMNS)
+    for month, day, base in days:
+        writer.writerow([month, day] + ['' if m == MISSING else minutes_to_hhmm(m) for m in base])
+    return out.getvalue()
+
+
+def format_issue(issue):
+    where = f"line {issue.line}: " if issue.line else ""
+    return f"{where}{issue.message}"
@@ -1,76 +1,207 @@
+import os
 import sys
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, time as dt_time
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QLabel, QVBoxLayout, QPushButton,
-    QGraphicsView, QGraphicsScene, QGraphicsProxyWidget
+    QApplication, QWidget, QLabel, QVBoxLayout, QPushButton, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QFont, QTransform
-from prayer_times_map import prayerTimes  # your Python prayer times file
+from PyQt5.QtCore import Qt, QTimer, QSize, QObject, QSocketNotifier, pyqtSignal
+from PyQt5.QtGui import QFont, QFontMetrics, QPainter, QPixmap, QColor
 
+# -------------------------
+# Paths
+# -------------------------
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+CONFIG_DIR = os.path.join(MAIN_DIR, "config")
+PRAYER_SCHEDULE_FILE = os.path.join(CONFIG_DIR, "prayer_times.bin")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import ScheduleStore, ScheduleFormatError
+from timetable import Timetable
+from file_watcher import FileWatcher
+
+
+# -------------------------
+# Prayers
+# -------------------------
+prayerNames = {
+    "Fajr": "الفجر",
+    "Sunrise": "الشروق",
+    "Dhuhr": "الظهر",
+    "Asr": "العصر",
+    "Maghrib": "المغرب",
+    "Isha": "العشاء",
+}
+
+# Colour windows around a prayer, in seconds
+GREEN_AFTER_SECONDS = 1800
+RED_BEFORE_SECONDS = 1200
+
+# How long to wait when there is nothing to count down to
+RETRY_MS = 60 * 1000
+
+# The display is updated this long after a transition, so the clock is
+# surely past it when it is read again
+WAKE_SLACK_MS = 20
+
+# How often the schedule file is checked where inotify is not available
+SCHEDULE_POLL_MS = 5 * 1000
 
 # -------------------------
-# Build date → prayer map
+# Schedule reload
 # -------------------------
-prayersByDate = {}
-for pt in prayerTimes:
-    key = f"{pt['Month']}-{pt['Day']}"
-    prayersByDate[key] = {
-        "الفجر": pt.get("Fajr"),
-        "الشروق": pt.get("Sunrise"),
-        "الظهر": pt.get("Dhuhr"),
-        "العصر": pt.get("Asr"),
-        "المغرب": pt.get("Maghrib"),
-        "العشاء": pt.get("Isha"),
-    }
-
-prayerOrder = ["الفجر", "الشروق", "الظهر", "العصر", "المغرب", "العشاء"]
-
-
-def key_for_date(d):
-    return f"{d.month}-{d.day}"
-
-def build_datetime(date, time_str):
-    if not time_str:
-        return None
-    h, m = map(int, time_str.split(":"))
-    return datetime(date.year, date.month, date.day, h, m)
-
-def next_occurrence(prayer, now):
-    today_time = prayersByDate.get(key_for_date(now), {}).get(prayer)
-    if today_time:
-        dt = build_datetime(now, today_time)
-        if dt > now:
-            return dt
-    tomorrow = now + timedelta(days=1)
-    tomorrow_time = prayersByDate.get(key_for_date(tomorrow), {}).get(prayer)
-    if tomorrow_time:
-        return build_datetime(tomorrow, tomorrow_time)
-    return None
-
-def prev_occurrence(prayer, now):
-    today_time = prayersByDate.get(key_for_date(now), {}).get(prayer)
-    if today_time:
-        dt = build_datetime(now, today_time)
-        if dt <= now:
-            return dt
-    yesterday = now - timedelta(days=1)
-    y_time = prayersByDate.get(key_for_date(yesterday), {}).get(prayer)
-    if y_time:
-        return build_datetime(yesterday, y_time)
-    return None
-
-def get_prev_next_prayer(now):
-    prev_p = next_p = None
-    prev_t = next_t = None
-    for p in prayerOrder:
-        nt = next_occurrence(p, now)
-        pt = prev_occurrence(p, now)
-        if nt and (not next_t or nt < next_t):
-            next_p, next_t = p, nt
-        if pt and (not prev_t or pt > prev_t):
-            prev_p, prev_t = p, pt
-    return prev_p, next_p, prev_t, next_t
+class ScheduleReloader(QObject):
+    """Notices a new prayer_times.bin and loads it off the UI thread.
+
+    The config directory is watched (the file is replaced by a rename, or
+    appears for the first time after the first ingest); on a change a worker
+    thread opens the new file and builds its Timetable around the current
+    time, then `loaded` hands both to the UI thread, which only has to swap a
+    reference. A file that cannot be opened is reported and the schedule in
+    use, if any, is kept.
+    """
+    loaded = pyqtSignal(object, object)  # ScheduleStore, Timetable
+    finished = pyqtSignal()
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.identity = None  # (revision, crc) of the schedule handed out last
+        self.watcher = FileWatcher(os.path.dirname(path), [os.path.basename(path)])
+        self.busy = False
+        self.again = False
+        self.finished.connect(self.load_done)
+
+        if self.watcher.fileno() is not None:
+            self.notifier = QSocketNotifier(self.watcher.fileno(), QSocketNotifier.Read, self)
+            self.notifier.activated.connect(self.check)
+        else:
+            self.poll = QTimer(self)
+            self.poll.timeout.connect(self.check)
+            self.poll.start(SCHEDULE_POLL_MS)
+
+    def check(self):
+        if self.watcher.changes():
+            self.start_load()
+
+    def start_load(self):
+        if self.busy:
+            # The load under way may have read the file before this change
+            self.again = True
+            return
+        self.busy, self.again = True, False
+        threading.Thread(target=self.load, daemon=True).start()
+
+    def open(self):
+        """(ScheduleStore, Timetable) of the file if it differs from the one
+        handed out last, else None. Runs in the worker thread, and once on
+        the UI thread at start-up."""
+        try:
+            store = ScheduleStore(self.path)
+        except (OSError, ScheduleFormatError) as e:
+            kept = ", keeping the one in use" if self.identity else ""
+            print(f"Cannot open compiled schedule{kept}: {e}")
+            return None
+        # The 16-bit revision wraps, and a file rebuilt from scratch starts
+        # over, so the CRC of the records has to match as well
+        identity = (store.revision, store.crc)
+        if identity == self.identity:
+            store.close()
+            return None
+        self.identity = identity
+        new_timetable = Timetable(store, list(prayerNames))
+        new_timetable.current(datetime.now().timestamp())
+        return store, new_timetable
+
+    def load(self):
+        """Runs in the worker thread."""
+        opened = self.open()
+        if opened is not None:
+            self.loaded.emit(*opened)
+        self.finished.emit()
+
+    def load_done(self):
+        self.busy = False
+        if self.again:
+            self.start_load()
+
+# -------------------------
+# Countdown display
+# -------------------------
+class CountdownDisplay(QWidget):
+    """The big HH:MM, stretched vertically by `scale_y`.
+
+    Each character it can show is rendered once per font, scale and colour
+    into a pixmap; painting just copies five of them, so a repaint costs the
+    same small amount whatever the font size.
+    """
+    GLYPHS = "0123456789:-"
+
+    # (font, scale, colour, pixel ratio) -> {char: (pixmap, x offset, advance)}
+    _glyph_cache = {}
+
+    def __init__(self, font, scale_y=1.0, color=QColor("white"), text="--:--"):
+        super().__init__()
+        self.glyph_font, self.scale_y, self.color = font, scale_y, QColor(color)
+        self.glyph_height = int(QFontMetrics(font).height() * scale_y) + 1
+        self._text = text
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+
+    def text(self):
+        return self._text
+
+    def setText(self, text):
+        if text != self._text:
+            self._text = text
+            self.update()
+
+    def glyphs(self):
+        ratio = self.devicePixelRatioF()
+        key = (self.glyph_font.key(), self.scale_y, self.color.rgba(), ratio)
+        glyphs = self._glyph_cache.get(key)
+        if glyphs is None:
+            glyphs = self._glyph_cache[key] = self.render_glyphs(ratio)
+        return glyphs
+
+    def render_glyphs(self, ratio):
+        metrics = QFontMetrics(self.glyph_font)
+        glyphs = {}
+        for char in self.GLYPHS:
+            # The ink can reach past the advance, so the pixmap covers both
+            bounds = metrics.boundingRect(char)
+            advance = metrics.horizontalAdvance(char)
+            left = min(0, bounds.left())
+            width = max(advance, bounds.right() + 1) - left
+            pixmap = QPixmap(int(width * ratio) + 1, int(self.glyph_height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.scale(1.0, self.scale_y)
+            painter.setFont(self.glyph_font)
+            painter.setPen(self.color)
+            painter.drawText(-left, metrics.ascent(), char)
+            painter.end()
+            glyphs[char] = (pixmap, left, advance)
+        return glyphs
+
+    def sizeHint(self):
+        glyphs = self.glyphs()
+        width = sum(glyphs[char][2] for char in "00:00")
+        return QSize(width, self.glyph_height)
+
+    def paintEvent(self, event):
+        glyphs = self.glyphs()
+        shown = [glyphs[char] for char in self._text if char in glyphs]
+        x = (self.width() - sum(advance for _, _, advance in shown)) // 2
+        y = (self.height() - self.glyph_height) // 2
+        painter = QPainter(self)
+        for pixmap, left, advance in shown:
+            painter.drawPixmap(x + left, y, pixmap)
+            x += advance
+        painter.end()
+
 
 # -------------------------
 # PyQt5 UI
@@ -90,43 +221,16 @@ class AdhanCounter(QWidget):
         # Labels
         self.title = QLabel("الوقت المتبقي لأذان")
         self.prayerName = QLabel("")
-        self.countdown = QLabel("--:--")
 
         self.title.setAlignment(Qt.AlignCenter)
         self.prayerName.setAlignment(Qt.AlignCenter)
-        self.countdown.setAlignment(Qt.AlignCenter)
 
         self.layout.addWidget(self.title)
         self.layout.addWidget(self.prayerName)
 
-        # --------- COUNTDOWN VERTICAL SCALE (ONLY CHANGE) ---------
-        self.countdown.setFont(QFont("Lateef", 190, QFont.Bold))
-        self.countdown.setAttribute(Qt.WA_TranslucentBackground)
-        self.countdown.setStyleSheet("background: transparent; color: white;")
-
-
-        scene = QGraphicsScene(self)
-        proxy = QGraphicsProxyWidget()
-        proxy.setWidget(self.countdown)
-        proxy.setTransform(QTransform().scale(1.0, 1.35))  # vertical only
-
-        view = QGraphicsView(scene)
-        scene.addItem(proxy)
-
-        view.setStyleSheet("background: transparent; border: none;")
-        view.setAlignment(Qt.AlignCenter)
-        view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-
-        self.layout.addWidget(view)
-
-        scene.setBackgroundBrush(Qt.transparent)
-        view.setBackgroundBrush(Qt.transparent)
-        view.setAttribute(Qt.WA_TranslucentBackground)
-        view.setStyleSheet("background: transparent; border: none;")
-
-        # ----------------------------------------------------------
+        # Countdown, stretched vertically
+        self.countdown = CountdownDisplay(QFont("Lateef", 190, QFont.Bold), scale_y=1.35)
+        self.layout.addWidget(self.countdown)
 
         self.setLayout(self.layout)
 
@@ -157,10 +261,23 @@ class AdhanCounter(QWidget):
         self.exit_btn.setStyleSheet(btn_style)
         self.fullscreen_btn.setStyleSheet(btn_style)
 
-        # Timer
-        self.timer = QTimer()
+        # Timer: single shot, armed for the next time the display changes
+        # (minute rollover, colour window or prayer switch) rather than every second
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.PreciseTimer)
         self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(1000)
+        self.shown = {}  # what each widget was last given, to skip unchanged updates
+
+        # Schedule in use, replaced as a whole when a new file is published.
+        # Without one (fresh install, nothing ingested yet) the counter shows
+        # --:-- until the file appears.
+        self.schedule = self.timetable = None
+        self.reloader = ScheduleReloader(PRAYER_SCHEDULE_FILE, self)
+        self.reloader.loaded.connect(self.adopt_schedule)
+        opened = self.reloader.open()
+        if opened is not None:
+            self.schedule, self.timetable = opened
 
         self.showFullScreen()
         self.update_countdown()
@@ -170,46 +287,82 @@ class AdhanCounter(QWidget):
     # -------------------------
     def update_countdown(self):
         now = datetime.now()
-        prev_p, next_p, prev_t, next_t = get_prev_next_prayer(now)
+        now_ts = now.timestamp()
+        window = self.timetable.current(now_ts) if self.timetable is not None else None
 
-        if not next_t or not prev_t:
-            self.countdown.setText("--:--")
-            self.setStyleSheet("background:#808080;color:white;")
+        if window is None:
+            self.set_text(self.countdown, "--:--")
+            self.set_background("#808080")
+            self.timer.start(RETRY_MS)
             return
+        prev_p, next_p = prayerNames[window.previous], prayerNames[window.next]
 
         if next_p == "الشروق":
-            self.title.setText("الوقت المتبقي ل ")
+            self.set_text(self.title, "الوقت المتبقي ل ")
         else:
-            self.title.setText("الوقت المتبقي لأذان")
+            self.set_text(self.title, "الوقت المتبقي لأذان")
 
-        remaining = int((next_t - now).total_seconds())
+        remaining = int(window.next_at - now_ts)
         hours = remaining // 3600
         minutes = (remaining % 3600) // 60
 
-        self.countdown.setText(f"{hours:02d}:{minutes:02d}")
+        self.set_text(self.countdown, f"{hours:02d}:{minutes:02d}")
 
         label = next_p
-        if now.date() != next_t.date():
+        if now.date() != window.next_date:
             label += " (غداً)"
-        self.prayerName.setText(label)
+        self.set_text(self.prayerName, label)
 
-        since_prev = (now - prev_t).total_seconds()
+        since_prev = now_ts - window.previous_at
 
         # --- LOGIC FOR BACKGROUND COLOR ---
         
         # 1. Green: Post-Athan (except Sunrise itself)
-        if 0 <= since_prev <= 1800 and prev_p != "الشروق":
+        if 0 <= since_prev <= GREEN_AFTER_SECONDS and prev_p != "الشروق":
             bg = "#00cc00"  # Green
         
         # 2. Red: Pre-Athan or Sunrise warning
-        elif 0 < remaining <= 1200:
+        elif 0 < remaining <= RED_BEFORE_SECONDS:
             bg = "#ff0000"  # Red
         
         # 3. Default
         else:
             bg = "#787878"  # Gray
         
-        self.setStyleSheet(f"background:{bg};color:white;")
+        self.set_background(bg)
+
+        # --- Sleep until the next thing on screen changes ---
+        tomorrow = datetime.combine(now.date() + timedelta(days=1), dt_time.min)
+        transitions = (
+            window.next_at - 60 * (remaining // 60),       # countdown minute rollover
+            window.next_at,                                # prayer switch
+            window.previous_at + GREEN_AFTER_SECONDS,      # end of green
+            window.next_at - RED_BEFORE_SECONDS - 1,       # start of red
+            window.next_at - 1,                            # end of red (last second)
+            tomorrow.timestamp(),                          # "(غداً)" label
+        )
+        wake = min(t for t in transitions if t >= now_ts)
+        self.timer.start(int((wake - now_ts) * 1000) + WAKE_SLACK_MS)
+
+    def adopt_schedule(self, store, new_timetable):
+        """Switches to a schedule loaded by the reloader and redraws at once."""
+        old = self.schedule
+        self.schedule, self.timetable = store, new_timetable
+        if old is not None:
+            old.close()
+        self.update_countdown()
+
+    def set_text(self, label, text):
+        if self.shown.get(label) != text:
+            self.shown[label] = text
+            label.setText(text)
+
+    def set_background(self, bg):
+        """Restyles the window only when the colour changes: a stylesheet
+        change re-polishes every child widget."""
+        if self.shown.get(self) != bg:
+            self.shown[self] = bg
+            self.setStyleSheet(f"background:{bg};color:white;")
 
     # -------------------------
     # Fullscreen handling
@@ -1,5112 +0,0 @@
-prayerTimes = [
-    {
-        "Month": 1,
-        "Day": 1,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:15",
-        "Dhuhr": "12:15",
-        "Asr": "13:50",
-        "Maghrib": "16:09",
-        "Athkar_elmasa": "16:29",
-        "Isha": "17:55",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 2,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:15",
-        "Dhuhr": "12:15",
-        "Asr": "13:51",
-        "Maghrib": "16:10",
-        "Athkar_elmasa": "16:30",
-        "Isha": "17:56",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 3,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:16",
-        "Dhuhr": "12:16",
-        "Asr": "13:52",
-        "Maghrib": "16:11",
-        "Athkar_elmasa": "16:31",
-        "Isha": "17:57",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 4,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:16",
-        "Dhuhr": "12:16",
-        "Asr": "13:53",
-        "Maghrib": "16:12",
-        "Athkar_elmasa": "16:32",
-        "Isha": "17:58",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 5,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "13:54",
-        "Maghrib": "16:14",
-        "Athkar_elmasa": "16:34",
-        "Isha": "17:59",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 6,
-        "Fajr": "06:10",
-        "Sunrise": "08:09",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "13:55",
-        "Maghrib": "16:15",
-        "Athkar_elmasa": "16:35",
-        "Isha": "18:00",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 7,
-        "Fajr": "06:10",
-        "Sunrise": "08:09",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "13:56",
-        "Maghrib": "16:16",
-        "Athkar_elmasa": "16:36",
-        "Isha": "18:01",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 8,
-        "Fajr": "06:10",
-        "Sunrise": "08:08",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:18",
-        "Dhuhr": "12:18",
-        "Asr": "13:57",
-        "Maghrib": "16:17",
-        "Athkar_elmasa": "16:37",
-        "Isha": "18:02",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 1,
-        "Day": 9,
-        "Fajr": "06:09",
-        "Sunrise": "08:08",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:18",
-        "Dhuhr": "12:18",
-        "Asr": "13:58",
-        "Maghrib": "16:19",
-        "Athkar_elmasa": "16:39",
-        "Isha": "18:04",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 1,
-        "Day": 10,
-        "Fajr": "06:09",
-        "Sunrise": "08:07",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "14:00",
-        "Maghrib": "16:20",
-        "Athkar_elmasa": "16:40",
-        "Isha": "18:05",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 1,
-        "Day": 11,
-        "Fajr": "06:09",
-        "Sunrise": "08:07",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "14:01",
-        "Maghrib": "16:22",
-        "Athkar_elmasa": "16:42",
-        "Isha": "18:06",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 1,
-        "Day": 12,
-        "Fajr": "06:08",
-        "Sunrise": "08:06",
-        "Athkar_elsabah": "10:08",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "14:02",
-        "Maghrib": "16:23",
-        "Athkar_elmasa": "16:43",
-        "Isha": "18:07",
-        "Tahajjud": "05:48"
-    },
-    {
-        "Month": 1,
-        "Day": 13,
-        "Fajr": "06:08",
-        "Sunrise": "08:05",
-        "Athkar_elsabah": "10:08",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "14:03",
-        "Maghrib": "16:25",
-        "Athkar_elmasa": "16:45",
-        "Isha": "18:08",
-        "Tahajjud": "05:48"
-    },
-    {
-        "Month": 1,
-        "Day": 14,
-        "Fajr": "06:07",
-        "Sunrise": "08:04",
-        "Athkar_elsabah": "10:07",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "14:05",
-        "Maghrib": "16:26",
-        "Athkar_elmasa": "16:46",
-        "Isha": "18:10",
-        "Tahajjud": "05:47"
-    },
-    {
-        "Month": 1,
-        "Day": 15,
-        "Fajr": "06:07",
-        "Sunrise": "08:04",
-        "Athkar_elsabah": "10:07",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "14:06",
-        "Maghrib": "16:28",
-        "Athkar_elmasa": "16:48",
-        "Isha": "18:11",
-        "Tahajjud": "05:47"
-    },
-    {
-        "Month": 1,
-        "Day": 16,
-        "Fajr": "06:06",
-        "Sunrise": "08:03",
-        "Athkar_elsabah": "10:06",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "14:07",
-        "Maghrib": "16:29",
-        "Athkar_elmasa": "16:49",
-        "Isha": "18:12",
-        "Tahajjud": "05:46"
-    },
-    {
-        "Month": 1,
-        "Day": 17,
-        "Fajr": "06:06",
-        "Sunrise": "08:02",
-        "Athkar_elsabah": "10:06",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "14:08",
-        "Maghrib": "16:31",
-        "Athkar_elmasa": "16:51",
-        "Isha": "18:14",
-        "Tahajjud": "05:46"
-    },
-    {
-        "Month": 1,
-        "Day": 18,
-        "Fajr": "06:05",
-        "Sunrise": "08:01",
-        "Athkar_elsabah": "10:05",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "14:10",
-        "Maghrib": "16:33",
-        "Athkar_elmasa": "16:53",
-        "Isha": "18:15",
-        "Tahajjud": "05:45"
-    },
-    {
-        "Month": 1,
-        "Day": 19,
-        "Fajr": "06:04",
-        "Sunrise": "08:00",
-        "Athkar_elsabah": "10:04",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "14:11",
-        "Maghrib": "16:34",
-        "Athkar_elmasa": "16:54",
-        "Isha": "18:16",
-        "Tahajjud": "05:44"
-    },
-    {
-        "Month": 1,
-        "Day": 20,
-        "Fajr": "06:03",
-        "Sunrise": "07:59",
-        "Athkar_elsabah": "10:03",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "14:13",
-        "Maghrib": "16:36",
-        "Athkar_elmasa": "16:56",
-        "Isha": "18:18",
-        "Tahajjud": "05:43"
-    },
-    {
-        "Month": 1,
-        "Day": 21,
-        "Fajr": "06:03",
-        "Sunrise": "07:57",
-        "Athkar_elsabah": "10:03",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "14:14",
-        "Maghrib": "16:38",
-        "Athkar_elmasa": "16:58",
-        "Isha": "18:19",
-        "Tahajjud": "05:43"
-    },
-    {
-        "Month": 1,
-        "Day": 22,
-        "Fajr": "06:02",
-        "Sunrise": "07:56",
-        "Athkar_elsabah": "10:02",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "14:15",
-        "Maghrib": "16:40",
-        "Athkar_elmasa": "17:00",
-        "Isha": "18:21",
-        "Tahajjud": "05:42"
-    },
-    {
-        "Month": 1,
-        "Day": 23,
-        "Fajr": "06:01",
-        "Sunrise": "07:55",
-        "Athkar_elsabah": "10:01",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "14:17",
-        "Maghrib": "16:41",
-        "Athkar_elmasa": "17:01",
-        "Isha": "18:22",
-        "Tahajjud": "05:41"
-    },
-    {
-        "Month": 1,
-        "Day": 24,
-        "Fajr": "06:00",
-        "Sunrise": "07:54",
-        "Athkar_elsabah": "10:00",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "14:18",
-        "Maghrib": "16:43",
-        "Athkar_elmasa": "17:03",
-        "Isha": "18:24",
-        "Tahajjud": "05:40"
-    },
-    {
-        "Month": 1,
-        "Day": 25,
-        "Fajr": "05:59",
-        "Sunrise": "07:52",
-        "Athkar_elsabah": "09:59",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "14:20",
-        "Maghrib": "16:45",
-        "Athkar_elmasa": "17:05",
-        "Isha": "18:25",
-        "Tahajjud": "05:39"
-    },
-    {
-        "Month": 1,
-        "Day": 26,
-        "Fajr": "05:58",
-        "Sunrise": "07:51",
-        "Athkar_elsabah": "09:58",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "14:21",
-        "Maghrib": "16:47",
-        "Athkar_elmasa": "17:07",
-        "Isha": "18:27",
-        "Tahajjud": "05:38"
-    },
-    {
-        "Month": 1,
-        "Day": 27,
-        "Fajr": "05:57",
-        "Sunrise": "07:50",
-        "Athkar_elsabah": "09:57",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "14:23",
-        "Maghrib": "16:48",
-        "Athkar_elmasa": "17:08",
-        "Isha": "18:28",
-        "Tahajjud": "05:37"
-    },
-    {
-        "Month": 1,
-        "Day": 28,
-        "Fajr": "05:56",
-        "Sunrise": "07:48",
-        "Athkar_elsabah": "09:56",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "14:24",
-        "Maghrib": "16:50",
-        "Athkar_elmasa": "17:10",
-        "Isha": "18:30",
-        "Tahajjud": "05:36"
-    },
-    {
-        "Month": 1,
-        "Day": 29,
-        "Fajr": "05:54",
-        "Sunrise": "07:47",
-        "Athkar_elsabah": "09:54",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "14:26",
-        "Maghrib": "16:52",
-        "Athkar_elmasa": "17:12",
-        "Isha": "18:31",
-        "Tahajjud": "05:34"
-    },
-    {
-        "Month": 1,
-        "Day": 30,
-        "Fajr": "05:53",
-        "Sunrise": "07:45",
-        "Athkar_elsabah": "09:53",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:27",
-        "Maghrib": "16:54",
-        "Athkar_elmasa": "17:14",
-        "Isha": "18:33",
-        "Tahajjud": "05:33"
-    },
-    {
-        "Month": 1,
-        "Day": 31,
-        "Fajr": "05:52",
-        "Sunrise": "07:44",
-        "Athkar_elsabah": "09:52",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:29",
-        "Maghrib": "16:56",
-        "Athkar_elmasa": "17:16",
-        "Isha": "18:34",
-        "Tahajjud": "05:32"
-    },
-    {
-        "Month": 2,
-        "Day": 1,
-        "Fajr": "05:51",
-        "Sunrise": "07:42",
-        "Athkar_elsabah": "09:51",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:30",
-        "Maghrib": "16:58",
-        "Athkar_elmasa": "17:18",
-        "Isha": "18:36",
-        "Tahajjud": "05:31"
-    },
-    {
-        "Month": 2,
-        "Day": 2,
-        "Fajr": "05:49",
-        "Sunrise": "07:41",
-        "Athkar_elsabah": "09:49",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:32",
-        "Maghrib": "17:00",
-        "Athkar_elmasa": "17:20",
-        "Isha": "18:38",
-        "Tahajjud": "05:29"
-    },
-    {
-        "Month": 2,
-        "Day": 3,
-        "Fajr": "05:48",
-        "Sunrise": "07:39",
-        "Athkar_elsabah": "09:48",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:33",
-        "Maghrib": "17:02",
-        "Athkar_elmasa": "17:22",
-        "Isha": "18:39",
-        "Tahajjud": "05:28"
-    },
-    {
-        "Month": 2,
-        "Day": 4,
-        "Fajr": "05:47",
-        "Sunrise": "07:37",
-        "Athkar_elsabah": "09:47",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:35",
-        "Maghrib": "17:03",
-        "Athkar_elmasa": "17:23",
-        "Isha": "18:41",
-        "Tahajjud": "05:27"
-    },
-    {
-        "Month": 2,
-        "Day": 5,
-        "Fajr": "05:45",
-        "Sunrise": "07:36",
-        "Athkar_elsabah": "09:45",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:36",
-        "Maghrib": "17:05",
-        "Athkar_elmasa": "17:25",
-        "Isha": "18:42",
-        "Tahajjud": "05:25"
-    },
-    {
-        "Month": 2,
-        "Day": 6,
-        "Fajr": "05:44",
-        "Sunrise": "07:34",
-        "Athkar_elsabah": "09:44",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:38",
-        "Maghrib": "17:07",
-        "Athkar_elmasa": "17:27",
-        "Isha": "18:44",
-        "Tahajjud": "05:24"
-    },
-    {
-        "Month": 2,
-        "Day": 7,
-        "Fajr": "05:42",
-        "Sunrise": "07:32",
-        "Athkar_elsabah": "09:42",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:39",
-        "Maghrib": "17:09",
-        "Athkar_elmasa": "17:29",
-        "Isha": "18:46",
-        "Tahajjud": "05:22"
-    },
-    {
-        "Month": 2,
-        "Day": 8,
-        "Fajr": "05:41",
-        "Sunrise": "07:30",
-        "Athkar_elsabah": "09:41",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:41",
-        "Maghrib": "17:11",
-        "Athkar_elmasa": "17:31",
-        "Isha": "18:47",
-        "Tahajjud": "05:21"
-    },
-    {
-        "Month": 2,
-        "Day": 9,
-        "Fajr": "05:39",
-        "Sunrise": "07:28",
-        "Athkar_elsabah": "09:39",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:42",
-        "Maghrib": "17:13",
-        "Athkar_elmasa": "17:33",
-        "Isha": "18:49",
-        "Tahajjud": "05:19"
-    },
-    {
-        "Month": 2,
-        "Day": 10,
-        "Fajr": "05:38",
-        "Sunrise": "07:27",
-        "Athkar_elsabah": "09:38",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:44",
-        "Maghrib": "17:15",
-        "Athkar_elmasa": "17:35",
-        "Isha": "18:51",
-        "Tahajjud": "05:18"
-    },
-    {
-        "Month": 2,
-        "Day": 11,
-        "Fajr": "05:36",
-        "Sunrise": "07:25",
-        "Athkar_elsabah": "09:36",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:45",
-        "Maghrib": "17:17",
-        "Athkar_elmasa": "17:37",
-        "Isha": "18:52",
-        "Tahajjud": "05:16"
-    },
-    {
-        "Month": 2,
-        "Day": 12,
-        "Fajr": "05:34",
-        "Sunrise": "07:23",
-        "Athkar_elsabah": "09:34",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:47",
-        "Maghrib": "17:19",
-        "Athkar_elmasa": "17:39",
-        "Isha": "18:54",
-        "Tahajjud": "05:14"
-    },
-    {
-        "Month": 2,
-        "Day": 13,
-        "Fajr": "05:32",
-        "Sunrise": "07:21",
-        "Athkar_elsabah": "09:32",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:48",
-        "Maghrib": "17:21",
-        "Athkar_elmasa": "17:41",
-        "Isha": "18:56",
-        "Tahajjud": "05:12"
-    },
-    {
-        "Month": 2,
-        "Day": 14,
-        "Fajr": "05:31",
-        "Sunrise": "07:19",
-        "Athkar_elsabah": "09:31",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:50",
-        "Maghrib": "17:22",
-        "Athkar_elmasa": "17:42",
-        "Isha": "18:57",
-        "Tahajjud": "05:11"
-    },
-    {
-        "Month": 2,
-        "Day": 15,
-        "Fajr": "05:29",
-        "Sunrise": "07:17",
-        "Athkar_elsabah": "09:29",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:51",
-        "Maghrib": "17:24",
-        "Athkar_elmasa": "17:44",
-        "Isha": "18:59",
-        "Tahajjud": "05:09"
-    },
-    {
-        "Month": 2,
-        "Day": 16,
-        "Fajr": "05:27",
-        "Sunrise": "07:15",
-        "Athkar_elsabah": "09:27",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:52",
-        "Maghrib": "17:26",
-        "Athkar_elmasa": "17:46",
-        "Isha": "19:01",
-        "Tahajjud": "05:07"
-    },
-    {
-        "Month": 2,
-        "Day": 17,
-        "Fajr": "05:25",
-        "Sunrise": "07:13",
-        "Athkar_elsabah": "09:25",
-        "Duha": "11:26",
-        "Dhuhr": "12:26",
-        "Asr": "14:54",
-        "Maghrib": "17:28",
-        "Athkar_elmasa": "17:48",
-        "Isha": "19:03",
-        "Tahajjud": "05:05"
-    },
-    {
-        "Month": 2,
-        "Day": 18,
-        "Fajr": "05:23",
-        "Sunrise": "07:11",
-        "Athkar_elsabah": "09:23",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:55",
-        "Maghrib": "17:30",
-        "Athkar_elmasa": "17:50",
-        "Isha": "19:04",
-        "Tahajjud": "05:03"
-    },
-    {
-        "Month": 2,
-        "Day": 19,
-        "Fajr": "05:21",
-        "Sunrise": "07:09",
-        "Athkar_elsabah": "09:21",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:57",
-        "Maghrib": "17:32",
-        "Athkar_elmasa": "17:52",
-        "Isha": "19:06",
-        "Tahajjud": "05:01"
-    },
-    {
-        "Month": 2,
-        "Day": 20,
-        "Fajr": "05:20",
-        "Sunrise": "07:07",
-        "Athkar_elsabah": "09:20",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "14:58",
-        "Maghrib": "17:34",
-        "Athkar_elmasa": "17:54",
-        "Isha": "19:08",
-        "Tahajjud": "05:00"
-    },
-    {
-        "Month": 2,
-        "Day": 21,
-        "Fajr": "05:18",
-        "Sunrise": "07:05",
-        "Athkar_elsabah": "09:18",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "15:00",
-        "Maghrib": "17:36",
-        "Athkar_elmasa": "17:56",
-        "Isha": "19:10",
-        "Tahajjud": "04:58"
-    },
-    {
-        "Month": 2,
-        "Day": 22,
-        "Fajr": "05:16",
-        "Sunrise": "07:03",
-        "Athkar_elsabah": "09:16",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "15:01",
-        "Maghrib": "17:38",
-        "Athkar_elmasa": "17:58",
-        "Isha": "19:11",
-        "Tahajjud": "04:56"
-    },
-    {
-        "Month": 2,
-        "Day": 23,
-        "Fajr": "05:14",
-        "Sunrise": "07:00",
-        "Athkar_elsabah": "09:14",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "15:02",
-        "Maghrib": "17:39",
-        "Athkar_elmasa": "17:59",
-        "Isha": "19:13",
-        "Tahajjud": "04:54"
-    },
-    {
-        "Month": 2,
-        "Day": 24,
-        "Fajr": "05:11",
-        "Sunrise": "06:58",
-        "Athkar_elsabah": "09:11",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "15:04",
-        "Maghrib": "17:41",
-        "Athkar_elmasa": "18:01",
-        "Isha": "19:15",
-        "Tahajjud": "04:51"
-    },
-    {
-        "Month": 2,
-        "Day": 25,
-        "Fajr": "05:09",
-        "Sunrise": "06:56",
-        "Athkar_elsabah": "09:09",
-        "Duha": "11:25",
-        "Dhuhr": "12:25",
-        "Asr": "15:05",
-        "Maghrib": "17:43",
-        "Athkar_elmasa": "18:03",
-        "Isha": "19:17",
-        "Tahajjud": "04:49"
-    },
-    {
-        "Month": 2,
-        "Day": 26,
-        "Fajr": "05:07",
-        "Sunrise": "06:54",
-        "Athkar_elsabah": "09:07",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:07",
-        "Maghrib": "17:45",
-        "Athkar_elmasa": "18:05",
-        "Isha": "19:18",
-        "Tahajjud": "04:47"
-    },
-    {
-        "Month": 2,
-        "Day": 27,
-        "Fajr": "05:05",
-        "Sunrise": "06:52",
-        "Athkar_elsabah": "09:05",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:08",
-        "Maghrib": "17:47",
-        "Athkar_elmasa": "18:07",
-        "Isha": "19:20",
-        "Tahajjud": "04:45"
-    },
-    {
-        "Month": 2,
-        "Day": 28,
-        "Fajr": "05:03",
-        "Sunrise": "06:50",
-        "Athkar_elsabah": "09:03",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:09",
-        "Maghrib": "17:49",
-        "Athkar_elmasa": "18:09",
-        "Isha": "19:22",
-        "Tahajjud": "04:43"
-    },
-    {
-        "Month": 3,
-        "Day": 1,
-        "Fajr": "05:01",
-        "Sunrise": "06:47",
-        "Athkar_elsabah": "09:01",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:11",
-        "Maghrib": "17:51",
-        "Athkar_elmasa": "18:11",
-        "Isha": "19:24",
-        "Tahajjud": "04:41"
-    },
-    {
-        "Month": 3,
-        "Day": 2,
-        "Fajr": "04:59",
-        "Sunrise": "06:45",
-        "Athkar_elsabah": "08:59",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:12",
-        "Maghrib": "17:52",
-        "Athkar_elmasa": "18:12",
-        "Isha": "19:26",
-        "Tahajjud": "04:39"
-    },
-    {
-        "Month": 3,
-        "Day": 3,
-        "Fajr": "04:56",
-        "Sunrise": "06:43",
-        "Athkar_elsabah": "08:56",
-        "Duha": "11:24",
-        "Dhuhr": "12:24",
-        "Asr": "15:13",
-        "Maghrib": "17:54",
-        "Athkar_elmasa": "18:14",
-        "Isha": "19:27",
-        "Tahajjud": "04:36"
-    },
-    {
-        "Month": 3,
-        "Day": 4,
-        "Fajr": "04:54",
-        "Sunrise": "06:41",
-        "Athkar_elsabah": "08:54",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "15:14",
-        "Maghrib": "17:56",
-        "Athkar_elmasa": "18:16",
-        "Isha": "19:29",
-        "Tahajjud": "04:34"
-    },
-    {
-        "Month": 3,
-        "Day": 5,
-        "Fajr": "04:52",
-        "Sunrise": "06:38",
-        "Athkar_elsabah": "08:52",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "15:16",
-        "Maghrib": "17:58",
-        "Athkar_elmasa": "18:18",
-        "Isha": "19:31",
-        "Tahajjud": "04:32"
-    },
-    {
-        "Month": 3,
-        "Day": 6,
-        "Fajr": "04:49",
-        "Sunrise": "06:36",
-        "Athkar_elsabah": "08:49",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "15:17",
-        "Maghrib": "18:00",
-        "Athkar_elmasa": "18:20",
-        "Isha": "19:33",
-        "Tahajjud": "04:29"
-    },
-    {
-        "Month": 3,
-        "Day": 7,
-        "Fajr": "04:47",
-        "Sunrise": "06:34",
-        "Athkar_elsabah": "08:47",
-        "Duha": "11:23",
-        "Dhuhr": "12:23",
-        "Asr": "15:18",
-        "Maghrib": "18:02",
-        "Athkar_elmasa": "18:22",
-        "Isha": "19:35",
-        "Tahajjud": "04:27"
-    },
-    {
-        "Month": 3,
-        "Day": 8,
-        "Fajr": "04:45",
-        "Sunrise": "06:32",
-        "Athkar_elsabah": "08:45",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "15:20",
-        "Maghrib": "18:03",
-        "Athkar_elmasa": "18:23",
-        "Isha": "19:37",
-        "Tahajjud": "04:25"
-    },
-    {
-        "Month": 3,
-        "Day": 9,
-        "Fajr": "04:42",
-        "Sunrise": "06:29",
-        "Athkar_elsabah": "08:42",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "15:21",
-        "Maghrib": "18:05",
-        "Athkar_elmasa": "18:25",
-        "Isha": "19:39",
-        "Tahajjud": "04:22"
-    },
-    {
-        "Month": 3,
-        "Day": 10,
-        "Fajr": "04:40",
-        "Sunrise": "06:27",
-        "Athkar_elsabah": "08:40",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "15:22",
-        "Maghrib": "18:07",
-        "Athkar_elmasa": "18:27",
-        "Isha": "19:40",
-        "Tahajjud": "04:20"
-    },
-    {
-        "Month": 3,
-        "Day": 11,
-        "Fajr": "04:37",
-        "Sunrise": "06:25",
-        "Athkar_elsabah": "08:37",
-        "Duha": "11:22",
-        "Dhuhr": "12:22",
-        "Asr": "15:23",
-        "Maghrib": "18:09",
-        "Athkar_elmasa": "18:29",
-        "Isha": "19:42",
-        "Tahajjud": "04:17"
-    },
-    {
-        "Month": 3,
-        "Day": 12,
-        "Fajr": "04:35",
-        "Sunrise": "06:22",
-        "Athkar_elsabah": "08:35",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "15:24",
-        "Maghrib": "18:11",
-        "Athkar_elmasa": "18:31",
-        "Isha": "19:44",
-        "Tahajjud": "04:15"
-    },
-    {
-        "Month": 3,
-        "Day": 13,
-        "Fajr": "04:32",
-        "Sunrise": "06:20",
-        "Athkar_elsabah": "08:32",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "15:26",
-        "Maghrib": "18:12",
-        "Athkar_elmasa": "18:32",
-        "Isha": "19:46",
-        "Tahajjud": "04:12"
-    },
-    {
-        "Month": 3,
-        "Day": 14,
-        "Fajr": "04:30",
-        "Sunrise": "06:18",
-        "Athkar_elsabah": "08:30",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "15:27",
-        "Maghrib": "18:14",
-        "Athkar_elmasa": "18:34",
-        "Isha": "19:48",
-        "Tahajjud": "04:10"
-    },
-    {
-        "Month": 3,
-        "Day": 15,
-        "Fajr": "04:27",
-        "Sunrise": "06:15",
-        "Athkar_elsabah": "08:27",
-        "Duha": "11:21",
-        "Dhuhr": "12:21",
-        "Asr": "15:28",
-        "Maghrib": "18:16",
-        "Athkar_elmasa": "18:36",
-        "Isha": "19:50",
-        "Tahajjud": "04:07"
-    },
-    {
-        "Month": 3,
-        "Day": 16,
-        "Fajr": "04:25",
-        "Sunrise": "06:13",
-        "Athkar_elsabah": "08:25",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "15:29",
-        "Maghrib": "18:18",
-        "Athkar_elmasa": "18:38",
-        "Isha": "19:52",
-        "Tahajjud": "04:05"
-    },
-    {
-        "Month": 3,
-        "Day": 17,
-        "Fajr": "04:22",
-        "Sunrise": "06:11",
-        "Athkar_elsabah": "08:22",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "15:30",
-        "Maghrib": "18:20",
-        "Athkar_elmasa": "18:40",
-        "Isha": "19:54",
-        "Tahajjud": "04:02"
-    },
-    {
-        "Month": 3,
-        "Day": 18,
-        "Fajr": "04:19",
-        "Sunrise": "06:08",
-        "Athkar_elsabah": "08:19",
-        "Duha": "11:20",
-        "Dhuhr": "12:20",
-        "Asr": "15:31",
-        "Maghrib": "18:21",
-        "Athkar_elmasa": "18:41",
-        "Isha": "19:56",
-        "Tahajjud": "03:59"
-    },
-    {
-        "Month": 3,
-        "Day": 19,
-        "Fajr": "04:17",
-        "Sunrise": "06:06",
-        "Athkar_elsabah": "08:17",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "15:32",
-        "Maghrib": "18:23",
-        "Athkar_elmasa": "18:43",
-        "Isha": "19:58",
-        "Tahajjud": "03:57"
-    },
-    {
-        "Month": 3,
-        "Day": 20,
-        "Fajr": "04:14",
-        "Sunrise": "06:04",
-        "Athkar_elsabah": "08:14",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "15:34",
-        "Maghrib": "18:25",
-        "Athkar_elmasa": "18:45",
-        "Isha": "20:00",
-        "Tahajjud": "03:54"
-    },
-    {
-        "Month": 3,
-        "Day": 21,
-        "Fajr": "04:12",
-        "Sunrise": "06:01",
-        "Athkar_elsabah": "08:12",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "15:35",
-        "Maghrib": "18:27",
-        "Athkar_elmasa": "18:47",
-        "Isha": "20:02",
-        "Tahajjud": "03:52"
-    },
-    {
-        "Month": 3,
-        "Day": 22,
-        "Fajr": "04:09",
-        "Sunrise": "05:59",
-        "Athkar_elsabah": "08:09",
-        "Duha": "11:19",
-        "Dhuhr": "12:19",
-        "Asr": "15:36",
-        "Maghrib": "18:28",
-        "Athkar_elmasa": "18:48",
-        "Isha": "20:04",
-        "Tahajjud": "03:49"
-    },
-    {
-        "Month": 3,
-        "Day": 23,
-        "Fajr": "04:06",
-        "Sunrise": "05:56",
-        "Athkar_elsabah": "08:06",
-        "Duha": "11:18",
-        "Dhuhr": "12:18",
-        "Asr": "15:37",
-        "Maghrib": "18:30",
-        "Athkar_elmasa": "18:50",
-        "Isha": "20:06",
-        "Tahajjud": "03:46"
-    },
-    {
-        "Month": 3,
-        "Day": 24,
-        "Fajr": "04:03",
-        "Sunrise": "05:54",
-        "Athkar_elsabah": "08:03",
-        "Duha": "11:18",
-        "Dhuhr": "12:18",
-        "Asr": "15:38",
-        "Maghrib": "18:32",
-        "Athkar_elmasa": "18:52",
-        "Isha": "20:08",
-        "Tahajjud": "03:43"
-    },
-    {
-        "Month": 3,
-        "Day": 25,
-        "Fajr": "04:01",
-        "Sunrise": "05:52",
-        "Athkar_elsabah": "08:01",
-        "Duha": "11:18",
-        "Dhuhr": "12:18",
-        "Asr": "15:39",
-        "Maghrib": "18:34",
-        "Athkar_elmasa": "18:54",
-        "Isha": "20:10",
-        "Tahajjud": "03:41"
-    },
-    {
-        "Month": 3,
-        "Day": 26,
-        "Fajr": "03:58",
-        "Sunrise": "05:49",
-        "Athkar_elsabah": "07:58",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "15:40",
-        "Maghrib": "18:35",
-        "Athkar_elmasa": "18:55",
-        "Isha": "20:12",
-        "Tahajjud": "03:38"
-    },
-    {
-        "Month": 3,
-        "Day": 27,
-        "Fajr": "03:55",
-        "Sunrise": "05:47",
-        "Athkar_elsabah": "07:55",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "15:41",
-        "Maghrib": "18:37",
-        "Athkar_elmasa": "18:57",
-        "Isha": "20:14",
-        "Tahajjud": "03:35"
-    },
-    {
-        "Month": 3,
-        "Day": 28,
-        "Fajr": "03:52",
-        "Sunrise": "05:45",
-        "Athkar_elsabah": "07:52",
-        "Duha": "11:17",
-        "Dhuhr": "12:17",
-        "Asr": "15:42",
-        "Maghrib": "18:39",
-        "Athkar_elmasa": "18:59",
-        "Isha": "20:16",
-        "Tahajjud": "03:32"
-    },
-    {
-        "Month": 3,
-        "Day": 29,
-        "Fajr": "03:49",
-        "Sunrise": "05:42",
-        "Athkar_elsabah": "07:49",
-        "Duha": "11:16",
-        "Dhuhr": "12:16",
-        "Asr": "15:43",
-        "Maghrib": "18:41",
-        "Athkar_elmasa": "19:01",
-        "Isha": "20:19",
-        "Tahajjud": "03:29"
-    },
-    {
-        "Month": 3,
-        "Day": 30,
-        "Fajr": "03:46",
-        "Sunrise": "05:40",
-        "Athkar_elsabah": "07:46",
-        "Duha": "11:16",
-        "Dhuhr": "12:16",
-        "Asr": "15:44",
-        "Maghrib": "18:42",
-        "Athkar_elmasa": "19:02",
-        "Isha": "20:21",
-        "Tahajjud": "03:26"
-    },
-    {
-        "Month": 3,
-        "Day": 31,
-        "Fajr": "03:44",
-        "Sunrise": "05:38",
-        "Athkar_elsabah": "07:44",
-        "Duha": "11:16",
-        "Dhuhr": "12:16",
-        "Asr": "15:45",
-        "Maghrib": "18:44",
-        "Athkar_elmasa": "19:04",
-        "Isha": "20:23",
-        "Tahajjud": "03:24"
-    },
-    {
-        "Month": 4,
-        "Day": 1,
-        "Fajr": "04:41",
-        "Sunrise": "06:35",
-        "Athkar_elsabah": "08:41",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "16:46",
-        "Maghrib": "19:46",
-        "Athkar_elmasa": "20:06",
-        "Isha": "21:25",
-        "Tahajjud": "04:21"
-    },
-    {
-        "Month": 4,
-        "Day": 2,
-        "Fajr": "04:38",
-        "Sunrise": "06:33",
-        "Athkar_elsabah": "08:38",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "16:47",
-        "Maghrib": "19:48",
-        "Athkar_elmasa": "20:08",
-        "Isha": "21:27",
-        "Tahajjud": "04:18"
-    },
-    {
-        "Month": 4,
-        "Day": 3,
-        "Fajr": "04:35",
-        "Sunrise": "06:31",
-        "Athkar_elsabah": "08:35",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "16:48",
-        "Maghrib": "19:49",
-        "Athkar_elmasa": "20:09",
-        "Isha": "21:30",
-        "Tahajjud": "04:15"
-    },
-    {
-        "Month": 4,
-        "Day": 4,
-        "Fajr": "04:32",
-        "Sunrise": "06:28",
-        "Athkar_elsabah": "08:32",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "16:49",
-        "Maghrib": "19:51",
-        "Athkar_elmasa": "20:11",
-        "Isha": "21:32",
-        "Tahajjud": "04:12"
-    },
-    {
-        "Month": 4,
-        "Day": 5,
-        "Fajr": "04:29",
-        "Sunrise": "06:26",
-        "Athkar_elsabah": "08:29",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "16:50",
-        "Maghrib": "19:53",
-        "Athkar_elmasa": "20:13",
-        "Isha": "21:34",
-        "Tahajjud": "04:09"
-    },
-    {
-        "Month": 4,
-        "Day": 6,
-        "Fajr": "04:26",
-        "Sunrise": "06:24",
-        "Athkar_elsabah": "08:26",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "16:50",
-        "Maghrib": "19:55",
-        "Athkar_elmasa": "20:15",
-        "Isha": "21:36",
-        "Tahajjud": "04:06"
-    },
-    {
-        "Month": 4,
-        "Day": 7,
-        "Fajr": "04:23",
-        "Sunrise": "06:21",
-        "Athkar_elsabah": "08:23",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "16:51",
-        "Maghrib": "19:56",
-        "Athkar_elmasa": "20:16",
-        "Isha": "21:39",
-        "Tahajjud": "04:03"
-    },
-    {
-        "Month": 4,
-        "Day": 8,
-        "Fajr": "04:20",
-        "Sunrise": "06:19",
-        "Athkar_elsabah": "08:20",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "16:52",
-        "Maghrib": "19:58",
-        "Athkar_elmasa": "20:18",
-        "Isha": "21:41",
-        "Tahajjud": "04:00"
-    },
-    {
-        "Month": 4,
-        "Day": 9,
-        "Fajr": "04:16",
-        "Sunrise": "06:17",
-        "Athkar_elsabah": "08:16",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "16:53",
-        "Maghrib": "20:00",
-        "Athkar_elmasa": "20:20",
-        "Isha": "21:43",
-        "Tahajjud": "03:56"
-    },
-    {
-        "Month": 4,
-        "Day": 10,
-        "Fajr": "04:13",
-        "Sunrise": "06:14",
-        "Athkar_elsabah": "08:13",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "16:54",
-        "Maghrib": "20:02",
-        "Athkar_elmasa": "20:22",
-        "Isha": "21:46",
-        "Tahajjud": "03:53"
-    },
-    {
-        "Month": 4,
-        "Day": 11,
-        "Fajr": "04:10",
-        "Sunrise": "06:12",
-        "Athkar_elsabah": "08:10",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "16:55",
-        "Maghrib": "20:03",
-        "Athkar_elmasa": "20:23",
-        "Isha": "21:48",
-        "Tahajjud": "03:50"
-    },
-    {
-        "Month": 4,
-        "Day": 12,
-        "Fajr": "04:07",
-        "Sunrise": "06:10",
-        "Athkar_elsabah": "08:07",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:56",
-        "Maghrib": "20:05",
-        "Athkar_elmasa": "20:25",
-        "Isha": "21:51",
-        "Tahajjud": "03:47"
-    },
-    {
-        "Month": 4,
-        "Day": 13,
-        "Fajr": "04:04",
-        "Sunrise": "06:08",
-        "Athkar_elsabah": "08:04",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:57",
-        "Maghrib": "20:07",
-        "Athkar_elmasa": "20:27",
-        "Isha": "21:53",
-        "Tahajjud": "03:44"
-    },
-    {
-        "Month": 4,
-        "Day": 14,
-        "Fajr": "04:01",
-        "Sunrise": "06:05",
-        "Athkar_elsabah": "08:01",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:57",
-        "Maghrib": "20:09",
-        "Athkar_elmasa": "20:29",
-        "Isha": "21:56",
-        "Tahajjud": "03:41"
-    },
-    {
-        "Month": 4,
-        "Day": 15,
-        "Fajr": "03:57",
-        "Sunrise": "06:03",
-        "Athkar_elsabah": "07:57",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:58",
-        "Maghrib": "20:10",
-        "Athkar_elmasa": "20:30",
-        "Isha": "21:58",
-        "Tahajjud": "03:37"
-    },
-    {
-        "Month": 4,
-        "Day": 16,
-        "Fajr": "03:54",
-        "Sunrise": "06:01",
-        "Athkar_elsabah": "07:54",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "16:59",
-        "Maghrib": "20:12",
-        "Athkar_elmasa": "20:32",
-        "Isha": "22:01",
-        "Tahajjud": "03:34"
-    },
-    {
-        "Month": 4,
-        "Day": 17,
-        "Fajr": "03:51",
-        "Sunrise": "05:59",
-        "Athkar_elsabah": "07:51",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:00",
-        "Maghrib": "20:14",
-        "Athkar_elmasa": "20:34",
-        "Isha": "22:03",
-        "Tahajjud": "03:31"
-    },
-    {
-        "Month": 4,
-        "Day": 18,
-        "Fajr": "03:47",
-        "Sunrise": "05:56",
-        "Athkar_elsabah": "07:47",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:01",
-        "Maghrib": "20:16",
-        "Athkar_elmasa": "20:36",
-        "Isha": "22:06",
-        "Tahajjud": "03:27"
-    },
-    {
-        "Month": 4,
-        "Day": 19,
-        "Fajr": "03:46",
-        "Sunrise": "05:54",
-        "Athkar_elsabah": "07:46",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:02",
-        "Maghrib": "20:17",
-        "Athkar_elmasa": "20:37",
-        "Isha": "22:08",
-        "Tahajjud": "03:26"
-    },
-    {
-        "Month": 4,
-        "Day": 20,
-        "Fajr": "03:46",
-        "Sunrise": "05:52",
-        "Athkar_elsabah": "07:46",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:02",
-        "Maghrib": "20:19",
-        "Athkar_elmasa": "20:39",
-        "Isha": "22:09",
-        "Tahajjud": "03:26"
-    },
-    {
-        "Month": 4,
-        "Day": 21,
-        "Fajr": "03:45",
-        "Sunrise": "05:50",
-        "Athkar_elsabah": "07:45",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:03",
-        "Maghrib": "20:21",
-        "Athkar_elmasa": "20:41",
-        "Isha": "22:10",
-        "Tahajjud": "03:25"
-    },
-    {
-        "Month": 4,
-        "Day": 22,
-        "Fajr": "03:44",
-        "Sunrise": "05:48",
-        "Athkar_elsabah": "07:44",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:04",
-        "Maghrib": "20:23",
-        "Athkar_elmasa": "20:43",
-        "Isha": "22:11",
-        "Tahajjud": "03:24"
-    },
-    {
-        "Month": 4,
-        "Day": 23,
-        "Fajr": "03:44",
-        "Sunrise": "05:46",
-        "Athkar_elsabah": "07:44",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:05",
-        "Maghrib": "20:24",
-        "Athkar_elmasa": "20:44",
-        "Isha": "22:11",
-        "Tahajjud": "03:24"
-    },
-    {
-        "Month": 4,
-        "Day": 24,
-        "Fajr": "03:43",
-        "Sunrise": "05:43",
-        "Athkar_elsabah": "07:43",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:05",
-        "Maghrib": "20:26",
-        "Athkar_elmasa": "20:46",
-        "Isha": "22:12",
-        "Tahajjud": "03:23"
-    },
-    {
-        "Month": 4,
-        "Day": 25,
-        "Fajr": "03:42",
-        "Sunrise": "05:41",
-        "Athkar_elsabah": "07:42",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:06",
-        "Maghrib": "20:28",
-        "Athkar_elmasa": "20:48",
-        "Isha": "22:13",
-        "Tahajjud": "03:22"
-    },
-    {
-        "Month": 4,
-        "Day": 26,
-        "Fajr": "03:42",
-        "Sunrise": "05:39",
-        "Athkar_elsabah": "07:42",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:07",
-        "Maghrib": "20:30",
-        "Athkar_elmasa": "20:50",
-        "Isha": "22:14",
-        "Tahajjud": "03:22"
-    },
-    {
-        "Month": 4,
-        "Day": 27,
-        "Fajr": "03:41",
-        "Sunrise": "05:37",
-        "Athkar_elsabah": "07:41",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:08",
-        "Maghrib": "20:31",
-        "Athkar_elmasa": "20:51",
-        "Isha": "22:14",
-        "Tahajjud": "03:21"
-    },
-    {
-        "Month": 4,
-        "Day": 28,
-        "Fajr": "03:40",
-        "Sunrise": "05:35",
-        "Athkar_elsabah": "07:40",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:08",
-        "Maghrib": "20:33",
-        "Athkar_elmasa": "20:53",
-        "Isha": "22:15",
-        "Tahajjud": "03:20"
-    },
-    {
-        "Month": 4,
-        "Day": 29,
-        "Fajr": "03:40",
-        "Sunrise": "05:33",
-        "Athkar_elsabah": "07:40",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:09",
-        "Maghrib": "20:35",
-        "Athkar_elmasa": "20:55",
-        "Isha": "22:16",
-        "Tahajjud": "03:20"
-    },
-    {
-        "Month": 4,
-        "Day": 30,
-        "Fajr": "03:39",
-        "Sunrise": "05:31",
-        "Athkar_elsabah": "07:39",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:10",
-        "Maghrib": "20:36",
-        "Athkar_elmasa": "20:56",
-        "Isha": "22:16",
-        "Tahajjud": "03:19"
-    },
-    {
-        "Month": 5,
-        "Day": 1,
-        "Fajr": "03:38",
-        "Sunrise": "05:29",
-        "Athkar_elsabah": "07:38",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:11",
-        "Maghrib": "20:38",
-        "Athkar_elmasa": "20:58",
-        "Isha": "22:17",
-        "Tahajjud": "03:18"
-    },
-    {
-        "Month": 5,
-        "Day": 2,
-        "Fajr": "03:38",
-        "Sunrise": "05:27",
-        "Athkar_elsabah": "07:38",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:11",
-        "Maghrib": "20:40",
-        "Athkar_elmasa": "21:00",
-        "Isha": "22:18",
-        "Tahajjud": "03:18"
-    },
-    {
-        "Month": 5,
-        "Day": 3,
-        "Fajr": "03:37",
-        "Sunrise": "05:25",
-        "Athkar_elsabah": "07:37",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:12",
-        "Maghrib": "20:42",
-        "Athkar_elmasa": "21:02",
-        "Isha": "22:18",
-        "Tahajjud": "03:17"
-    },
-    {
-        "Month": 5,
-        "Day": 4,
-        "Fajr": "03:26",
-        "Sunrise": "05:23",
-        "Athkar_elsabah": "07:26",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:13",
-        "Maghrib": "20:43",
-        "Athkar_elmasa": "21:03",
-        "Isha": "22:19",
-        "Tahajjud": "03:06"
-    },
-    {
-        "Month": 5,
-        "Day": 5,
-        "Fajr": "03:36",
-        "Sunrise": "05:22",
-        "Athkar_elsabah": "07:36",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:13",
-        "Maghrib": "20:45",
-        "Athkar_elmasa": "21:05",
-        "Isha": "22:20",
-        "Tahajjud": "03:16"
-    },
-    {
-        "Month": 5,
-        "Day": 6,
-        "Fajr": "03:35",
-        "Sunrise": "05:20",
-        "Athkar_elsabah": "07:35",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:14",
-        "Maghrib": "20:47",
-        "Athkar_elmasa": "21:07",
-        "Isha": "22:20",
-        "Tahajjud": "03:15"
-    },
-    {
-        "Month": 5,
-        "Day": 7,
-        "Fajr": "03:34",
-        "Sunrise": "05:18",
-        "Athkar_elsabah": "07:34",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:15",
-        "Maghrib": "20:48",
-        "Athkar_elmasa": "21:08",
-        "Isha": "22:21",
-        "Tahajjud": "03:14"
-    },
-    {
-        "Month": 5,
-        "Day": 8,
-        "Fajr": "03:34",
-        "Sunrise": "05:16",
-        "Athkar_elsabah": "07:34",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:15",
-        "Maghrib": "20:50",
-        "Athkar_elmasa": "21:10",
-        "Isha": "22:22",
-        "Tahajjud": "03:14"
-    },
-    {
-        "Month": 5,
-        "Day": 9,
-        "Fajr": "03:33",
-        "Sunrise": "05:14",
-        "Athkar_elsabah": "07:33",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:16",
-        "Maghrib": "20:52",
-        "Athkar_elmasa": "21:12",
-        "Isha": "22:23",
-        "Tahajjud": "03:13"
-    },
-    {
-        "Month": 5,
-        "Day": 10,
-        "Fajr": "03:32",
-        "Sunrise": "05:12",
-        "Athkar_elsabah": "07:32",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:17",
-        "Maghrib": "20:53",
-        "Athkar_elmasa": "21:13",
-        "Isha": "22:23",
-        "Tahajjud": "03:12"
-    },
-    {
-        "Month": 5,
-        "Day": 11,
-        "Fajr": "03:32",
-        "Sunrise": "05:11",
-        "Athkar_elsabah": "07:32",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:17",
-        "Maghrib": "20:55",
-        "Athkar_elmasa": "21:15",
-        "Isha": "22:24",
-        "Tahajjud": "03:12"
-    },
-    {
-        "Month": 5,
-        "Day": 12,
-        "Fajr": "03:31",
-        "Sunrise": "05:09",
-        "Athkar_elsabah": "07:31",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:18",
-        "Maghrib": "20:57",
-        "Athkar_elmasa": "21:17",
-        "Isha": "22:25",
-        "Tahajjud": "03:11"
-    },
-    {
-        "Month": 5,
-        "Day": 13,
-        "Fajr": "03:30",
-        "Sunrise": "05:07",
-        "Athkar_elsabah": "07:30",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:19",
-        "Maghrib": "20:58",
-        "Athkar_elmasa": "21:18",
-        "Isha": "22:25",
-        "Tahajjud": "03:10"
-    },
-    {
-        "Month": 5,
-        "Day": 14,
-        "Fajr": "03:30",
-        "Sunrise": "05:06",
-        "Athkar_elsabah": "07:30",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:19",
-        "Maghrib": "21:00",
-        "Athkar_elmasa": "21:20",
-        "Isha": "22:26",
-        "Tahajjud": "03:10"
-    },
-    {
-        "Month": 5,
-        "Day": 15,
-        "Fajr": "03:29",
-        "Sunrise": "05:04",
-        "Athkar_elsabah": "07:29",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:20",
-        "Maghrib": "21:01",
-        "Athkar_elmasa": "21:21",
-        "Isha": "22:27",
-        "Tahajjud": "03:09"
-    },
-    {
-        "Month": 5,
-        "Day": 16,
-        "Fajr": "03:28",
-        "Sunrise": "05:03",
-        "Athkar_elsabah": "07:28",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:21",
-        "Maghrib": "21:03",
-        "Athkar_elmasa": "21:23",
-        "Isha": "22:27",
-        "Tahajjud": "03:08"
-    },
-    {
-        "Month": 5,
-        "Day": 17,
-        "Fajr": "03:28",
-        "Sunrise": "05:01",
-        "Athkar_elsabah": "07:28",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:21",
-        "Maghrib": "21:05",
-        "Athkar_elmasa": "21:25",
-        "Isha": "22:28",
-        "Tahajjud": "03:08"
-    },
-    {
-        "Month": 5,
-        "Day": 18,
-        "Fajr": "03:27",
-        "Sunrise": "05:00",
-        "Athkar_elsabah": "07:27",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:22",
-        "Maghrib": "21:06",
-        "Athkar_elmasa": "21:26",
-        "Isha": "22:29",
-        "Tahajjud": "03:07"
-    },
-    {
-        "Month": 5,
-        "Day": 19,
-        "Fajr": "03:26",
-        "Sunrise": "04:58",
-        "Athkar_elsabah": "07:26",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:23",
-        "Maghrib": "21:08",
-        "Athkar_elmasa": "21:28",
-        "Isha": "22:29",
-        "Tahajjud": "03:06"
-    },
-    {
-        "Month": 5,
-        "Day": 20,
-        "Fajr": "03:25",
-        "Sunrise": "04:57",
-        "Athkar_elsabah": "07:25",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:23",
-        "Maghrib": "21:09",
-        "Athkar_elmasa": "21:29",
-        "Isha": "22:30",
-        "Tahajjud": "03:05"
-    },
-    {
-        "Month": 5,
-        "Day": 21,
-        "Fajr": "03:25",
-        "Sunrise": "04:55",
-        "Athkar_elsabah": "07:25",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:24",
-        "Maghrib": "21:11",
-        "Athkar_elmasa": "21:31",
-        "Isha": "22:31",
-        "Tahajjud": "03:05"
-    },
-    {
-        "Month": 5,
-        "Day": 22,
-        "Fajr": "03:24",
-        "Sunrise": "04:54",
-        "Athkar_elsabah": "07:24",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:24",
-        "Maghrib": "21:12",
-        "Athkar_elmasa": "21:32",
-        "Isha": "22:32",
-        "Tahajjud": "03:04"
-    },
-    {
-        "Month": 5,
-        "Day": 23,
-        "Fajr": "03:23",
-        "Sunrise": "04:53",
-        "Athkar_elsabah": "07:23",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:25",
-        "Maghrib": "21:14",
-        "Athkar_elmasa": "21:34",
-        "Isha": "22:33",
-        "Tahajjud": "03:03"
-    },
-    {
-        "Month": 5,
-        "Day": 24,
-        "Fajr": "03:22",
-        "Sunrise": "04:52",
-        "Athkar_elsabah": "07:22",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:25",
-        "Maghrib": "21:15",
-        "Athkar_elmasa": "21:35",
-        "Isha": "22:34",
-        "Tahajjud": "03:02"
-    },
-    {
-        "Month": 5,
-        "Day": 25,
-        "Fajr": "03:22",
-        "Sunrise": "04:50",
-        "Athkar_elsabah": "07:22",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:26",
-        "Maghrib": "21:16",
-        "Athkar_elmasa": "21:36",
-        "Isha": "22:35",
-        "Tahajjud": "03:02"
-    },
-    {
-        "Month": 5,
-        "Day": 26,
-        "Fajr": "03:21",
-        "Sunrise": "04:49",
-        "Athkar_elsabah": "07:21",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "17:27",
-        "Maghrib": "21:18",
-        "Athkar_elmasa": "21:38",
-        "Isha": "22:36",
-        "Tahajjud": "03:01"
-    },
-    {
-        "Month": 5,
-        "Day": 27,
-        "Fajr": "03:20",
-        "Sunrise": "04:48",
-        "Athkar_elsabah": "07:20",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:27",
-        "Maghrib": "21:19",
-        "Athkar_elmasa": "21:39",
-        "Isha": "22:37",
-        "Tahajjud": "03:00"
-    },
-    {
-        "Month": 5,
-        "Day": 28,
-        "Fajr": "03:20",
-        "Sunrise": "04:47",
-        "Athkar_elsabah": "07:20",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:28",
-        "Maghrib": "21:20",
-        "Athkar_elmasa": "21:40",
-        "Isha": "22:38",
-        "Tahajjud": "03:00"
-    },
-    {
-        "Month": 5,
-        "Day": 29,
-        "Fajr": "03:19",
-        "Sunrise": "04:46",
-        "Athkar_elsabah": "07:19",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:28",
-        "Maghrib": "21:22",
-        "Athkar_elmasa": "21:42",
-        "Isha": "22:39",
-        "Tahajjud": "02:59"
-    },
-    {
-        "Month": 5,
-        "Day": 30,
-        "Fajr": "03:19",
-        "Sunrise": "04:45",
-        "Athkar_elsabah": "07:19",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:29",
-        "Maghrib": "21:23",
-        "Athkar_elmasa": "21:43",
-        "Isha": "22:40",
-        "Tahajjud": "02:59"
-    },
-    {
-        "Month": 5,
-        "Day": 31,
-        "Fajr": "03:18",
-        "Sunrise": "04:44",
-        "Athkar_elsabah": "07:18",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:29",
-        "Maghrib": "21:24",
-        "Athkar_elmasa": "21:44",
-        "Isha": "22:41",
-        "Tahajjud": "02:58"
-    },
-    {
-        "Month": 6,
-        "Day": 1,
-        "Fajr": "03:18",
-        "Sunrise": "04:43",
-        "Athkar_elsabah": "07:18",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:30",
-        "Maghrib": "21:25",
-        "Athkar_elmasa": "21:45",
-        "Isha": "22:41",
-        "Tahajjud": "02:58"
-    },
-    {
-        "Month": 6,
-        "Day": 2,
-        "Fajr": "03:17",
-        "Sunrise": "04:42",
-        "Athkar_elsabah": "07:17",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "17:30",
-        "Maghrib": "21:27",
-        "Athkar_elmasa": "21:47",
-        "Isha": "22:42",
-        "Tahajjud": "02:57"
-    },
-    {
-        "Month": 6,
-        "Day": 3,
-        "Fajr": "03:17",
-        "Sunrise": "04:41",
-        "Athkar_elsabah": "07:17",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:31",
-        "Maghrib": "21:28",
-        "Athkar_elmasa": "21:48",
-        "Isha": "22:43",
-        "Tahajjud": "02:57"
-    },
-    {
-        "Month": 6,
-        "Day": 4,
-        "Fajr": "03:16",
-        "Sunrise": "04:41",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:31",
-        "Maghrib": "21:29",
-        "Athkar_elmasa": "21:49",
-        "Isha": "22:44",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 5,
-        "Fajr": "03:16",
-        "Sunrise": "04:40",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:32",
-        "Maghrib": "21:30",
-        "Athkar_elmasa": "21:50",
-        "Isha": "22:44",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 6,
-        "Fajr": "03:16",
-        "Sunrise": "04:39",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:32",
-        "Maghrib": "21:31",
-        "Athkar_elmasa": "21:51",
-        "Isha": "22:45",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 7,
-        "Fajr": "03:15",
-        "Sunrise": "04:39",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:32",
-        "Maghrib": "21:32",
-        "Athkar_elmasa": "21:52",
-        "Isha": "22:46",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 8,
-        "Fajr": "03:15",
-        "Sunrise": "04:38",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "17:33",
-        "Maghrib": "21:33",
-        "Athkar_elmasa": "21:53",
-        "Isha": "22:47",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 9,
-        "Fajr": "03:15",
-        "Sunrise": "04:38",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:33",
-        "Maghrib": "21:33",
-        "Athkar_elmasa": "21:53",
-        "Isha": "22:47",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 10,
-        "Fajr": "03:15",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:34",
-        "Maghrib": "21:34",
-        "Athkar_elmasa": "21:54",
-        "Isha": "22:48",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 11,
-        "Fajr": "03:15",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:34",
-        "Maghrib": "21:35",
-        "Athkar_elmasa": "21:55",
-        "Isha": "22:48",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 12,
-        "Fajr": "03:14",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:34",
-        "Maghrib": "21:36",
-        "Athkar_elmasa": "21:56",
-        "Isha": "22:49",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 13,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "17:35",
-        "Maghrib": "21:37",
-        "Athkar_elmasa": "21:57",
-        "Isha": "22:49",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 14,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "17:35",
-        "Maghrib": "21:37",
-        "Athkar_elmasa": "21:57",
-        "Isha": "22:50",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 15,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "17:35",
-        "Maghrib": "21:38",
-        "Athkar_elmasa": "21:58",
-        "Isha": "22:50",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 16,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "17:36",
-        "Maghrib": "21:38",
-        "Athkar_elmasa": "21:58",
-        "Isha": "22:51",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 17,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "17:36",
-        "Maghrib": "21:39",
-        "Athkar_elmasa": "21:59",
-        "Isha": "22:51",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 18,
-        "Fajr": "03:14",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:14",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:36",
-        "Maghrib": "21:39",
-        "Athkar_elmasa": "21:59",
-        "Isha": "22:52",
-        "Tahajjud": "02:54"
-    },
-    {
-        "Month": 6,
-        "Day": 19,
-        "Fajr": "03:15",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:37",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:52",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 20,
-        "Fajr": "03:15",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:37",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:52",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 21,
-        "Fajr": "03:15",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:37",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:52",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 22,
-        "Fajr": "03:15",
-        "Sunrise": "04:36",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:37",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:53",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 23,
-        "Fajr": "03:15",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:15",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:55"
-    },
-    {
-        "Month": 6,
-        "Day": 24,
-        "Fajr": "03:16",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 25,
-        "Fajr": "03:16",
-        "Sunrise": "04:37",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 26,
-        "Fajr": "03:16",
-        "Sunrise": "04:38",
-        "Athkar_elsabah": "07:16",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:56"
-    },
-    {
-        "Month": 6,
-        "Day": 27,
-        "Fajr": "03:17",
-        "Sunrise": "04:38",
-        "Athkar_elsabah": "07:17",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:57"
-    },
-    {
-        "Month": 6,
-        "Day": 28,
-        "Fajr": "03:17",
-        "Sunrise": "04:39",
-        "Athkar_elsabah": "07:17",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:38",
-        "Maghrib": "21:41",
-        "Athkar_elmasa": "22:01",
-        "Isha": "22:53",
-        "Tahajjud": "02:57"
-    },
-    {
-        "Month": 6,
-        "Day": 29,
-        "Fajr": "03:17",
-        "Sunrise": "04:39",
-        "Athkar_elsabah": "07:17",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:38",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:53",
-        "Tahajjud": "02:57"
-    },
-    {
-        "Month": 6,
-        "Day": 30,
-        "Fajr": "03:18",
-        "Sunrise": "04:40",
-        "Athkar_elsabah": "07:18",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:38",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:53",
-        "Tahajjud": "02:58"
-    },
-    {
-        "Month": 7,
-        "Day": 1,
-        "Fajr": "03:18",
-        "Sunrise": "04:41",
-        "Athkar_elsabah": "07:18",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:38",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:53",
-        "Tahajjud": "02:58"
-    },
-    {
-        "Month": 7,
-        "Day": 2,
-        "Fajr": "03:19",
-        "Sunrise": "04:41",
-        "Athkar_elsabah": "07:19",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:39",
-        "Maghrib": "21:40",
-        "Athkar_elmasa": "22:00",
-        "Isha": "22:53",
-        "Tahajjud": "02:59"
-    },
-    {
-        "Month": 7,
-        "Day": 3,
-        "Fajr": "03:19",
-        "Sunrise": "04:42",
-        "Athkar_elsabah": "07:19",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:39",
-        "Maghrib": "21:39",
-        "Athkar_elmasa": "21:59",
-        "Isha": "22:53",
-        "Tahajjud": "02:59"
-    },
-    {
-        "Month": 7,
-        "Day": 4,
-        "Fajr": "03:20",
-        "Sunrise": "04:43",
-        "Athkar_elsabah": "07:20",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:38",
-        "Maghrib": "21:39",
-        "Athkar_elmasa": "21:59",
-        "Isha": "22:52",
-        "Tahajjud": "03:00"
-    },
-    {
-        "Month": 7,
-        "Day": 5,
-        "Fajr": "03:21",
-        "Sunrise": "04:44",
-        "Athkar_elsabah": "07:21",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:38",
-        "Maghrib": "21:38",
-        "Athkar_elmasa": "21:58",
-        "Isha": "22:52",
-        "Tahajjud": "03:01"
-    },
-    {
-        "Month": 7,
-        "Day": 6,
-        "Fajr": "03:21",
-        "Sunrise": "04:45",
-        "Athkar_elsabah": "07:21",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:38",
-        "Maghrib": "21:38",
-        "Athkar_elmasa": "21:58",
-        "Isha": "22:52",
-        "Tahajjud": "03:01"
-    },
-    {
-        "Month": 7,
-        "Day": 7,
-        "Fajr": "03:22",
-        "Sunrise": "04:45",
-        "Athkar_elsabah": "07:22",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:38",
-        "Maghrib": "21:37",
-        "Athkar_elmasa": "21:57",
-        "Isha": "22:52",
-        "Tahajjud": "03:02"
-    },
-    {
-        "Month": 7,
-        "Day": 8,
-        "Fajr": "03:22",
-        "Sunrise": "04:46",
-        "Athkar_elsabah": "07:22",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:38",
-        "Maghrib": "21:37",
-        "Athkar_elmasa": "21:57",
-        "Isha": "22:51",
-        "Tahajjud": "03:02"
-    },
-    {
-        "Month": 7,
-        "Day": 9,
-        "Fajr": "03:23",
-        "Sunrise": "04:47",
-        "Athkar_elsabah": "07:23",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:38",
-        "Maghrib": "21:36",
-        "Athkar_elmasa": "21:56",
-        "Isha": "22:51",
-        "Tahajjud": "03:03"
-    },
-    {
-        "Month": 7,
-        "Day": 10,
-        "Fajr": "03:24",
-        "Sunrise": "04:48",
-        "Athkar_elsabah": "07:24",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:38",
-        "Maghrib": "21:35",
-        "Athkar_elmasa": "21:55",
-        "Isha": "22:50",
-        "Tahajjud": "03:04"
-    },
-    {
-        "Month": 7,
-        "Day": 11,
-        "Fajr": "03:25",
-        "Sunrise": "04:50",
-        "Athkar_elsabah": "07:25",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:38",
-        "Maghrib": "21:34",
-        "Athkar_elmasa": "21:54",
-        "Isha": "22:50",
-        "Tahajjud": "03:05"
-    },
-    {
-        "Month": 7,
-        "Day": 12,
-        "Fajr": "03:25",
-        "Sunrise": "04:51",
-        "Athkar_elsabah": "07:25",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:38",
-        "Maghrib": "21:34",
-        "Athkar_elmasa": "21:54",
-        "Isha": "22:49",
-        "Tahajjud": "03:05"
-    },
-    {
-        "Month": 7,
-        "Day": 13,
-        "Fajr": "03:26",
-        "Sunrise": "04:52",
-        "Athkar_elsabah": "07:26",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:37",
-        "Maghrib": "21:33",
-        "Athkar_elmasa": "21:53",
-        "Isha": "22:49",
-        "Tahajjud": "03:06"
-    },
-    {
-        "Month": 7,
-        "Day": 14,
-        "Fajr": "03:27",
-        "Sunrise": "04:53",
-        "Athkar_elsabah": "07:27",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:37",
-        "Maghrib": "21:32",
-        "Athkar_elmasa": "21:52",
-        "Isha": "22:48",
-        "Tahajjud": "03:07"
-    },
-    {
-        "Month": 7,
-        "Day": 15,
-        "Fajr": "03:28",
-        "Sunrise": "04:54",
-        "Athkar_elsabah": "07:28",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:37",
-        "Maghrib": "21:31",
-        "Athkar_elmasa": "21:51",
-        "Isha": "22:48",
-        "Tahajjud": "03:08"
-    },
-    {
-        "Month": 7,
-        "Day": 16,
-        "Fajr": "03:28",
-        "Sunrise": "04:55",
-        "Athkar_elsabah": "07:28",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:37",
-        "Maghrib": "21:30",
-        "Athkar_elmasa": "21:50",
-        "Isha": "22:47",
-        "Tahajjud": "03:08"
-    },
-    {
-        "Month": 7,
-        "Day": 17,
-        "Fajr": "03:29",
-        "Sunrise": "04:57",
-        "Athkar_elsabah": "07:29",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:36",
-        "Maghrib": "21:29",
-        "Athkar_elmasa": "21:49",
-        "Isha": "22:46",
-        "Tahajjud": "03:09"
-    },
-    {
-        "Month": 7,
-        "Day": 18,
-        "Fajr": "03:30",
-        "Sunrise": "04:58",
-        "Athkar_elsabah": "07:30",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:36",
-        "Maghrib": "21:27",
-        "Athkar_elmasa": "21:47",
-        "Isha": "22:46",
-        "Tahajjud": "03:10"
-    },
-    {
-        "Month": 7,
-        "Day": 19,
-        "Fajr": "03:31",
-        "Sunrise": "04:59",
-        "Athkar_elsabah": "07:31",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:36",
-        "Maghrib": "21:26",
-        "Athkar_elmasa": "21:46",
-        "Isha": "22:45",
-        "Tahajjud": "03:11"
-    },
-    {
-        "Month": 7,
-        "Day": 20,
-        "Fajr": "03:32",
-        "Sunrise": "05:01",
-        "Athkar_elsabah": "07:32",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:35",
-        "Maghrib": "21:25",
-        "Athkar_elmasa": "21:45",
-        "Isha": "22:44",
-        "Tahajjud": "03:12"
-    },
-    {
-        "Month": 7,
-        "Day": 21,
-        "Fajr": "03:33",
-        "Sunrise": "05:02",
-        "Athkar_elsabah": "07:33",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:35",
-        "Maghrib": "21:24",
-        "Athkar_elmasa": "21:44",
-        "Isha": "22:43",
-        "Tahajjud": "03:13"
-    },
-    {
-        "Month": 7,
-        "Day": 22,
-        "Fajr": "03:33",
-        "Sunrise": "05:03",
-        "Athkar_elsabah": "07:33",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:34",
-        "Maghrib": "21:23",
-        "Athkar_elmasa": "21:43",
-        "Isha": "22:43",
-        "Tahajjud": "03:13"
-    },
-    {
-        "Month": 7,
-        "Day": 23,
-        "Fajr": "03:34",
-        "Sunrise": "05:05",
-        "Athkar_elsabah": "07:34",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:34",
-        "Maghrib": "21:21",
-        "Athkar_elmasa": "21:41",
-        "Isha": "22:42",
-        "Tahajjud": "03:14"
-    },
-    {
-        "Month": 7,
-        "Day": 24,
-        "Fajr": "03:35",
-        "Sunrise": "05:06",
-        "Athkar_elsabah": "07:35",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:33",
-        "Maghrib": "21:20",
-        "Athkar_elmasa": "21:40",
-        "Isha": "22:41",
-        "Tahajjud": "03:15"
-    },
-    {
-        "Month": 7,
-        "Day": 25,
-        "Fajr": "03:36",
-        "Sunrise": "05:08",
-        "Athkar_elsabah": "07:36",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:33",
-        "Maghrib": "21:18",
-        "Athkar_elmasa": "21:38",
-        "Isha": "22:40",
-        "Tahajjud": "03:16"
-    },
-    {
-        "Month": 7,
-        "Day": 26,
-        "Fajr": "03:37",
-        "Sunrise": "05:09",
-        "Athkar_elsabah": "07:37",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:32",
-        "Maghrib": "21:17",
-        "Athkar_elmasa": "21:37",
-        "Isha": "22:39",
-        "Tahajjud": "03:17"
-    },
-    {
-        "Month": 7,
-        "Day": 27,
-        "Fajr": "03:38",
-        "Sunrise": "05:11",
-        "Athkar_elsabah": "07:38",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:32",
-        "Maghrib": "21:15",
-        "Athkar_elmasa": "21:35",
-        "Isha": "22:38",
-        "Tahajjud": "03:18"
-    },
-    {
-        "Month": 7,
-        "Day": 28,
-        "Fajr": "03:38",
-        "Sunrise": "05:12",
-        "Athkar_elsabah": "07:38",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:31",
-        "Maghrib": "21:14",
-        "Athkar_elmasa": "21:34",
-        "Isha": "22:37",
-        "Tahajjud": "03:18"
-    },
-    {
-        "Month": 7,
-        "Day": 29,
-        "Fajr": "03:39",
-        "Sunrise": "05:14",
-        "Athkar_elsabah": "07:39",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:30",
-        "Maghrib": "21:12",
-        "Athkar_elmasa": "21:32",
-        "Isha": "22:37",
-        "Tahajjud": "03:19"
-    },
-    {
-        "Month": 7,
-        "Day": 30,
-        "Fajr": "03:39",
-        "Sunrise": "05:15",
-        "Athkar_elsabah": "07:39",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:30",
-        "Maghrib": "21:11",
-        "Athkar_elmasa": "21:31",
-        "Isha": "22:36",
-        "Tahajjud": "03:19"
-    },
-    {
-        "Month": 7,
-        "Day": 31,
-        "Fajr": "03:40",
-        "Sunrise": "05:17",
-        "Athkar_elsabah": "07:40",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:29",
-        "Maghrib": "21:09",
-        "Athkar_elmasa": "21:29",
-        "Isha": "22:35",
-        "Tahajjud": "03:20"
-    },
-    {
-        "Month": 8,
-        "Day": 1,
-        "Fajr": "03:41",
-        "Sunrise": "05:18",
-        "Athkar_elsabah": "07:41",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:28",
-        "Maghrib": "21:07",
-        "Athkar_elmasa": "21:27",
-        "Isha": "22:34",
-        "Tahajjud": "03:21"
-    },
-    {
-        "Month": 8,
-        "Day": 2,
-        "Fajr": "03:41",
-        "Sunrise": "05:20",
-        "Athkar_elsabah": "07:41",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:28",
-        "Maghrib": "21:06",
-        "Athkar_elmasa": "21:26",
-        "Isha": "22:34",
-        "Tahajjud": "03:21"
-    },
-    {
-        "Month": 8,
-        "Day": 3,
-        "Fajr": "03:42",
-        "Sunrise": "05:22",
-        "Athkar_elsabah": "07:42",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:27",
-        "Maghrib": "21:04",
-        "Athkar_elmasa": "21:24",
-        "Isha": "22:33",
-        "Tahajjud": "03:22"
-    },
-    {
-        "Month": 8,
-        "Day": 4,
-        "Fajr": "03:42",
-        "Sunrise": "05:23",
-        "Athkar_elsabah": "07:42",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:26",
-        "Maghrib": "21:02",
-        "Athkar_elmasa": "21:22",
-        "Isha": "22:32",
-        "Tahajjud": "03:22"
-    },
-    {
-        "Month": 8,
-        "Day": 5,
-        "Fajr": "03:43",
-        "Sunrise": "05:25",
-        "Athkar_elsabah": "07:43",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:25",
-        "Maghrib": "21:00",
-        "Athkar_elmasa": "21:20",
-        "Isha": "22:32",
-        "Tahajjud": "03:23"
-    },
-    {
-        "Month": 8,
-        "Day": 6,
-        "Fajr": "03:44",
-        "Sunrise": "05:26",
-        "Athkar_elsabah": "07:44",
-        "Duha": "12:18",
-        "Dhuhr": "13:18",
-        "Asr": "17:25",
-        "Maghrib": "20:59",
-        "Athkar_elmasa": "21:19",
-        "Isha": "22:31",
-        "Tahajjud": "03:24"
-    },
-    {
-        "Month": 8,
-        "Day": 7,
-        "Fajr": "03:44",
-        "Sunrise": "05:28",
-        "Athkar_elsabah": "07:44",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:24",
-        "Maghrib": "20:57",
-        "Athkar_elmasa": "21:17",
-        "Isha": "22:30",
-        "Tahajjud": "03:24"
-    },
-    {
-        "Month": 8,
-        "Day": 8,
-        "Fajr": "03:45",
-        "Sunrise": "05:30",
-        "Athkar_elsabah": "07:45",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:23",
-        "Maghrib": "20:55",
-        "Athkar_elmasa": "21:15",
-        "Isha": "22:29",
-        "Tahajjud": "03:25"
-    },
-    {
-        "Month": 8,
-        "Day": 9,
-        "Fajr": "03:45",
-        "Sunrise": "05:31",
-        "Athkar_elsabah": "07:45",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:22",
-        "Maghrib": "20:53",
-        "Athkar_elmasa": "21:13",
-        "Isha": "22:29",
-        "Tahajjud": "03:25"
-    },
-    {
-        "Month": 8,
-        "Day": 10,
-        "Fajr": "03:46",
-        "Sunrise": "05:33",
-        "Athkar_elsabah": "07:46",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:21",
-        "Maghrib": "20:51",
-        "Athkar_elmasa": "21:11",
-        "Isha": "22:28",
-        "Tahajjud": "03:26"
-    },
-    {
-        "Month": 8,
-        "Day": 11,
-        "Fajr": "03:47",
-        "Sunrise": "05:35",
-        "Athkar_elsabah": "07:47",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:20",
-        "Maghrib": "20:49",
-        "Athkar_elmasa": "21:09",
-        "Isha": "22:27",
-        "Tahajjud": "03:27"
-    },
-    {
-        "Month": 8,
-        "Day": 12,
-        "Fajr": "03:47",
-        "Sunrise": "05:36",
-        "Athkar_elsabah": "07:47",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:19",
-        "Maghrib": "20:47",
-        "Athkar_elmasa": "21:07",
-        "Isha": "22:26",
-        "Tahajjud": "03:27"
-    },
-    {
-        "Month": 8,
-        "Day": 13,
-        "Fajr": "03:48",
-        "Sunrise": "05:38",
-        "Athkar_elsabah": "07:48",
-        "Duha": "12:17",
-        "Dhuhr": "13:17",
-        "Asr": "17:18",
-        "Maghrib": "20:45",
-        "Athkar_elmasa": "21:05",
-        "Isha": "22:26",
-        "Tahajjud": "03:28"
-    },
-    {
-        "Month": 8,
-        "Day": 14,
-        "Fajr": "03:48",
-        "Sunrise": "05:39",
-        "Athkar_elsabah": "07:48",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:17",
-        "Maghrib": "20:43",
-        "Athkar_elmasa": "21:03",
-        "Isha": "22:25",
-        "Tahajjud": "03:28"
-    },
-    {
-        "Month": 8,
-        "Day": 15,
-        "Fajr": "03:49",
-        "Sunrise": "05:41",
-        "Athkar_elsabah": "07:49",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:16",
-        "Maghrib": "20:41",
-        "Athkar_elmasa": "21:01",
-        "Isha": "22:24",
-        "Tahajjud": "03:29"
-    },
-    {
-        "Month": 8,
-        "Day": 16,
-        "Fajr": "03:50",
-        "Sunrise": "05:43",
-        "Athkar_elsabah": "07:50",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:15",
-        "Maghrib": "20:39",
-        "Athkar_elmasa": "20:59",
-        "Isha": "22:23",
-        "Tahajjud": "03:30"
-    },
-    {
-        "Month": 8,
-        "Day": 17,
-        "Fajr": "03:50",
-        "Sunrise": "05:44",
-        "Athkar_elsabah": "07:50",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:14",
-        "Maghrib": "20:37",
-        "Athkar_elmasa": "20:57",
-        "Isha": "22:23",
-        "Tahajjud": "03:30"
-    },
-    {
-        "Month": 8,
-        "Day": 18,
-        "Fajr": "03:51",
-        "Sunrise": "05:46",
-        "Athkar_elsabah": "07:51",
-        "Duha": "12:16",
-        "Dhuhr": "13:16",
-        "Asr": "17:13",
-        "Maghrib": "20:35",
-        "Athkar_elmasa": "20:55",
-        "Isha": "22:22",
-        "Tahajjud": "03:31"
-    },
-    {
-        "Month": 8,
-        "Day": 19,
-        "Fajr": "03:52",
-        "Sunrise": "05:58",
-        "Athkar_elsabah": "07:52",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:12",
-        "Maghrib": "20:33",
-        "Athkar_elmasa": "20:53",
-        "Isha": "22:21",
-        "Tahajjud": "03:32"
-    },
-    {
-        "Month": 8,
-        "Day": 20,
-        "Fajr": "03:52",
-        "Sunrise": "05:49",
-        "Athkar_elsabah": "07:52",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:10",
-        "Maghrib": "20:31",
-        "Athkar_elmasa": "20:51",
-        "Isha": "22:20",
-        "Tahajjud": "03:32"
-    },
-    {
-        "Month": 8,
-        "Day": 21,
-        "Fajr": "03:53",
-        "Sunrise": "05:51",
-        "Athkar_elsabah": "07:53",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:09",
-        "Maghrib": "20:29",
-        "Athkar_elmasa": "20:49",
-        "Isha": "22:20",
-        "Tahajjud": "03:33"
-    },
-    {
-        "Month": 8,
-        "Day": 22,
-        "Fajr": "03:53",
-        "Sunrise": "05:53",
-        "Athkar_elsabah": "07:53",
-        "Duha": "12:15",
-        "Dhuhr": "13:15",
-        "Asr": "17:08",
-        "Maghrib": "20:26",
-        "Athkar_elmasa": "20:46",
-        "Isha": "22:19",
-        "Tahajjud": "03:33"
-    },
-    {
-        "Month": 8,
-        "Day": 23,
-        "Fajr": "03:54",
-        "Sunrise": "05:54",
-        "Athkar_elsabah": "07:54",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:07",
-        "Maghrib": "20:24",
-        "Athkar_elmasa": "20:44",
-        "Isha": "22:17",
-        "Tahajjud": "03:34"
-    },
-    {
-        "Month": 8,
-        "Day": 24,
-        "Fajr": "03:55",
-        "Sunrise": "05:56",
-        "Athkar_elsabah": "07:55",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:06",
-        "Maghrib": "20:22",
-        "Athkar_elmasa": "20:42",
-        "Isha": "22:14",
-        "Tahajjud": "03:35"
-    },
-    {
-        "Month": 8,
-        "Day": 25,
-        "Fajr": "03:55",
-        "Sunrise": "05:58",
-        "Athkar_elsabah": "07:55",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:04",
-        "Maghrib": "20:20",
-        "Athkar_elmasa": "20:40",
-        "Isha": "22:11",
-        "Tahajjud": "03:35"
-    },
-    {
-        "Month": 8,
-        "Day": 26,
-        "Fajr": "03:56",
-        "Sunrise": "05:59",
-        "Athkar_elsabah": "07:56",
-        "Duha": "12:14",
-        "Dhuhr": "13:14",
-        "Asr": "17:03",
-        "Maghrib": "20:18",
-        "Athkar_elmasa": "20:38",
-        "Isha": "22:08",
-        "Tahajjud": "03:36"
-    },
-    {
-        "Month": 8,
-        "Day": 27,
-        "Fajr": "03:56",
-        "Sunrise": "06:01",
-        "Athkar_elsabah": "07:56",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:02",
-        "Maghrib": "20:15",
-        "Athkar_elmasa": "20:35",
-        "Isha": "22:05",
-        "Tahajjud": "03:36"
-    },
-    {
-        "Month": 8,
-        "Day": 28,
-        "Fajr": "03:57",
-        "Sunrise": "06:03",
-        "Athkar_elsabah": "07:57",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "17:00",
-        "Maghrib": "20:13",
-        "Athkar_elmasa": "20:33",
-        "Isha": "22:01",
-        "Tahajjud": "03:37"
-    },
-    {
-        "Month": 8,
-        "Day": 29,
-        "Fajr": "03:59",
-        "Sunrise": "06:04",
-        "Athkar_elsabah": "07:59",
-        "Duha": "12:13",
-        "Dhuhr": "13:13",
-        "Asr": "16:59",
-        "Maghrib": "20:11",
-        "Athkar_elmasa": "20:31",
-        "Isha": "21:58",
-        "Tahajjud": "03:39"
-    },
-    {
-        "Month": 8,
-        "Day": 30,
-        "Fajr": "04:02",
-        "Sunrise": "06:06",
-        "Athkar_elsabah": "08:02",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:58",
-        "Maghrib": "20:09",
-        "Athkar_elmasa": "20:29",
-        "Isha": "21:55",
-        "Tahajjud": "03:42"
-    },
-    {
-        "Month": 8,
-        "Day": 31,
-        "Fajr": "04:04",
-        "Sunrise": "06:08",
-        "Athkar_elsabah": "08:04",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:56",
-        "Maghrib": "20:06",
-        "Athkar_elmasa": "20:26",
-        "Isha": "21:52",
-        "Tahajjud": "03:44"
-    },
-    {
-        "Month": 9,
-        "Day": 1,
-        "Fajr": "04:07",
-        "Sunrise": "06:09",
-        "Athkar_elsabah": "08:07",
-        "Duha": "12:12",
-        "Dhuhr": "13:12",
-        "Asr": "16:55",
-        "Maghrib": "20:04",
-        "Athkar_elmasa": "20:24",
-        "Isha": "21:49",
-        "Tahajjud": "03:47"
-    },
-    {
-        "Month": 9,
-        "Day": 2,
-        "Fajr": "04:09",
-        "Sunrise": "06:11",
-        "Athkar_elsabah": "08:09",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "16:53",
-        "Maghrib": "20:02",
-        "Athkar_elmasa": "20:22",
-        "Isha": "21:46",
-        "Tahajjud": "03:49"
-    },
-    {
-        "Month": 9,
-        "Day": 3,
-        "Fajr": "04:12",
-        "Sunrise": "06:13",
-        "Athkar_elsabah": "08:12",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "16:52",
-        "Maghrib": "19:59",
-        "Athkar_elmasa": "20:19",
-        "Isha": "21:43",
-        "Tahajjud": "03:52"
-    },
-    {
-        "Month": 9,
-        "Day": 4,
-        "Fajr": "04:14",
-        "Sunrise": "06:14",
-        "Athkar_elsabah": "08:14",
-        "Duha": "12:11",
-        "Dhuhr": "13:11",
-        "Asr": "16:50",
-        "Maghrib": "19:57",
-        "Athkar_elmasa": "20:17",
-        "Isha": "21:41",
-        "Tahajjud": "03:54"
-    },
-    {
-        "Month": 9,
-        "Day": 5,
-        "Fajr": "04:17",
-        "Sunrise": "06:16",
-        "Athkar_elsabah": "08:17",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "16:49",
-        "Maghrib": "19:55",
-        "Athkar_elmasa": "20:15",
-        "Isha": "21:38",
-        "Tahajjud": "03:57"
-    },
-    {
-        "Month": 9,
-        "Day": 6,
-        "Fajr": "04:19",
-        "Sunrise": "06:18",
-        "Athkar_elsabah": "08:19",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "16:48",
-        "Maghrib": "19:52",
-        "Athkar_elmasa": "20:12",
-        "Isha": "21:35",
-        "Tahajjud": "03:59"
-    },
-    {
-        "Month": 9,
-        "Day": 7,
-        "Fajr": "04:22",
-        "Sunrise": "06:19",
-        "Athkar_elsabah": "08:22",
-        "Duha": "12:10",
-        "Dhuhr": "13:10",
-        "Asr": "16:46",
-        "Maghrib": "19:50",
-        "Athkar_elmasa": "20:10",
-        "Isha": "21:32",
-        "Tahajjud": "04:02"
-    },
-    {
-        "Month": 9,
-        "Day": 8,
-        "Fajr": "04:24",
-        "Sunrise": "06:21",
-        "Athkar_elsabah": "08:24",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "16:44",
-        "Maghrib": "19:48",
-        "Athkar_elmasa": "20:08",
-        "Isha": "21:29",
-        "Tahajjud": "04:04"
-    },
-    {
-        "Month": 9,
-        "Day": 9,
-        "Fajr": "04:26",
-        "Sunrise": "06:23",
-        "Athkar_elsabah": "08:26",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "16:43",
-        "Maghrib": "19:45",
-        "Athkar_elmasa": "20:05",
-        "Isha": "21:26",
-        "Tahajjud": "04:06"
-    },
-    {
-        "Month": 9,
-        "Day": 10,
-        "Fajr": "04:29",
-        "Sunrise": "06:24",
-        "Athkar_elsabah": "08:29",
-        "Duha": "12:09",
-        "Dhuhr": "13:09",
-        "Asr": "16:41",
-        "Maghrib": "19:43",
-        "Athkar_elmasa": "20:03",
-        "Isha": "21:23",
-        "Tahajjud": "04:09"
-    },
-    {
-        "Month": 9,
-        "Day": 11,
-        "Fajr": "04:31",
-        "Sunrise": "06:26",
-        "Athkar_elsabah": "08:31",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "16:40",
-        "Maghrib": "19:41",
-        "Athkar_elmasa": "20:01",
-        "Isha": "21:20",
-        "Tahajjud": "04:11"
-    },
-    {
-        "Month": 9,
-        "Day": 12,
-        "Fajr": "04:33",
-        "Sunrise": "06:28",
-        "Athkar_elsabah": "08:33",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "16:38",
-        "Maghrib": "19:38",
-        "Athkar_elmasa": "19:58",
-        "Isha": "21:17",
-        "Tahajjud": "04:13"
-    },
-    {
-        "Month": 9,
-        "Day": 13,
-        "Fajr": "04:35",
-        "Sunrise": "06:29",
-        "Athkar_elsabah": "08:35",
-        "Duha": "12:08",
-        "Dhuhr": "13:08",
-        "Asr": "16:37",
-        "Maghrib": "19:36",
-        "Athkar_elmasa": "19:56",
-        "Isha": "21:15",
-        "Tahajjud": "04:15"
-    },
-    {
-        "Month": 9,
-        "Day": 14,
-        "Fajr": "04:38",
-        "Sunrise": "06:31",
-        "Athkar_elsabah": "08:38",
-        "Duha": "12:07",
-        "Dhuhr": "13:07",
-        "Asr": "16:35",
-        "Maghrib": "19:34",
-        "Athkar_elmasa": "19:54",
-        "Isha": "21:12",
-        "Tahajjud": "04:18"
-    },
-    {
-        "Month": 9,
-        "Day": 15,
-        "Fajr": "04:40",
-        "Sunrise": "06:33",
-        "Athkar_elsabah": "08:40",
-        "Duha": "12:07",
-        "Dhuhr": "13:07",
-        "Asr": "16:33",
-        "Maghrib": "19:31",
-        "Athkar_elmasa": "19:51",
-        "Isha": "21:09",
-        "Tahajjud": "04:20"
-    },
-    {
-        "Month": 9,
-        "Day": 16,
-        "Fajr": "04:42",
-        "Sunrise": "06:34",
-        "Athkar_elsabah": "08:42",
-        "Duha": "12:07",
-        "Dhuhr": "13:07",
-        "Asr": "16:32",
-        "Maghrib": "19:29",
-        "Athkar_elmasa": "19:49",
-        "Isha": "21:06",
-        "Tahajjud": "04:22"
-    },
-    {
-        "Month": 9,
-        "Day": 17,
-        "Fajr": "04:44",
-        "Sunrise": "06:36",
-        "Athkar_elsabah": "08:44",
-        "Duha": "12:06",
-        "Dhuhr": "13:06",
-        "Asr": "16:30",
-        "Maghrib": "19:26",
-        "Athkar_elmasa": "19:46",
-        "Isha": "21:04",
-        "Tahajjud": "04:24"
-    },
-    {
-        "Month": 9,
-        "Day": 18,
-        "Fajr": "04:46",
-        "Sunrise": "06:38",
-        "Athkar_elsabah": "08:46",
-        "Duha": "12:06",
-        "Dhuhr": "13:06",
-        "Asr": "16:28",
-        "Maghrib": "19:24",
-        "Athkar_elmasa": "19:44",
-        "Isha": "21:01",
-        "Tahajjud": "04:26"
-    },
-    {
-        "Month": 9,
-        "Day": 19,
-        "Fajr": "04:48",
-        "Sunrise": "06:39",
-        "Athkar_elsabah": "08:48",
-        "Duha": "12:06",
-        "Dhuhr": "13:06",
-        "Asr": "16:27",
-        "Maghrib": "19:22",
-        "Athkar_elmasa": "19:42",
-        "Isha": "20:58",
-        "Tahajjud": "04:28"
-    },
-    {
-        "Month": 9,
-        "Day": 20,
-        "Fajr": "04:50",
-        "Sunrise": "06:41",
-        "Athkar_elsabah": "08:50",
-        "Duha": "12:05",
-        "Dhuhr": "13:05",
-        "Asr": "16:25",
-        "Maghrib": "19:19",
-        "Athkar_elmasa": "19:39",
-        "Isha": "20:55",
-        "Tahajjud": "04:30"
-    },
-    {
-        "Month": 9,
-        "Day": 21,
-        "Fajr": "04:52",
-        "Sunrise": "06:43",
-        "Athkar_elsabah": "08:52",
-        "Duha": "12:05",
-        "Dhuhr": "13:05",
-        "Asr": "16:23",
-        "Maghrib": "19:17",
-        "Athkar_elmasa": "19:37",
-        "Isha": "20:53",
-        "Tahajjud": "04:32"
-    },
-    {
-        "Month": 9,
-        "Day": 22,
-        "Fajr": "04:54",
-        "Sunrise": "06:44",
-        "Athkar_elsabah": "08:54",
-        "Duha": "12:04",
-        "Dhuhr": "13:04",
-        "Asr": "16:22",
-        "Maghrib": "19:15",
-        "Athkar_elmasa": "19:35",
-        "Isha": "20:50",
-        "Tahajjud": "04:34"
-    },
-    {
-        "Month": 9,
-        "Day": 23,
-        "Fajr": "04:56",
-        "Sunrise": "06:46",
-        "Athkar_elsabah": "08:56",
-        "Duha": "12:04",
-        "Dhuhr": "13:04",
-        "Asr": "16:20",
-        "Maghrib": "19:12",
-        "Athkar_elmasa": "19:32",
-        "Isha": "20:48",
-        "Tahajjud": "04:36"
-    },
-    {
-        "Month": 9,
-        "Day": 24,
-        "Fajr": "04:58",
-        "Sunrise": "06:48",
-        "Athkar_elsabah": "08:58",
-        "Duha": "12:04",
-        "Dhuhr": "13:04",
-        "Asr": "16:18",
-        "Maghrib": "19:10",
-        "Athkar_elmasa": "19:30",
-        "Isha": "20:45",
-        "Tahajjud": "04:38"
-    },
-    {
-        "Month": 9,
-        "Day": 25,
-        "Fajr": "05:00",
-        "Sunrise": "06:49",
-        "Athkar_elsabah": "09:00",
-        "Duha": "12:03",
-        "Dhuhr": "13:03",
-        "Asr": "16:17",
-        "Maghrib": "19:07",
-        "Athkar_elmasa": "19:27",
-        "Isha": "20:42",
-        "Tahajjud": "04:40"
-    },
-    {
-        "Month": 9,
-        "Day": 26,
-        "Fajr": "05:02",
-        "Sunrise": "06:51",
-        "Athkar_elsabah": "09:02",
-        "Duha": "12:03",
-        "Dhuhr": "13:03",
-        "Asr": "16:15",
-        "Maghrib": "19:05",
-        "Athkar_elmasa": "19:25",
-        "Isha": "20:40",
-        "Tahajjud": "04:42"
-    },
-    {
-        "Month": 9,
-        "Day": 27,
-        "Fajr": "05:04",
-        "Sunrise": "06:53",
-        "Athkar_elsabah": "09:04",
-        "Duha": "12:03",
-        "Dhuhr": "13:03",
-        "Asr": "16:13",
-        "Maghrib": "19:03",
-        "Athkar_elmasa": "19:23",
-        "Isha": "20:37",
-        "Tahajjud": "04:44"
-    },
-    {
-        "Month": 9,
-        "Day": 28,
-        "Fajr": "05:06",
-        "Sunrise": "06:55",
-        "Athkar_elsabah": "09:06",
-        "Duha": "12:02",
-        "Dhuhr": "13:02",
-        "Asr": "16:11",
-        "Maghrib": "19:00",
-        "Athkar_elmasa": "19:20",
-        "Isha": "20:35",
-        "Tahajjud": "04:46"
-    },
-    {
-        "Month": 9,
-        "Day": 29,
-        "Fajr": "05:08",
-        "Sunrise": "06:56",
-        "Athkar_elsabah": "09:08",
-        "Duha": "12:02",
-        "Dhuhr": "13:02",
-        "Asr": "16:10",
-        "Maghrib": "18:58",
-        "Athkar_elmasa": "19:18",
-        "Isha": "20:32",
-        "Tahajjud": "04:48"
-    },
-    {
-        "Month": 9,
-        "Day": 30,
-        "Fajr": "05:10",
-        "Sunrise": "06:58",
-        "Athkar_elsabah": "09:10",
-        "Duha": "12:02",
-        "Dhuhr": "13:02",
-        "Asr": "16:08",
-        "Maghrib": "18:56",
-        "Athkar_elmasa": "19:16",
-        "Isha": "20:30",
-        "Tahajjud": "04:50"
-    },
-    {
-        "Month": 10,
-        "Day": 1,
-        "Fajr": "05:12",
-        "Sunrise": "07:00",
-        "Athkar_elsabah": "09:12",
-        "Duha": "12:01",
-        "Dhuhr": "13:01",
-        "Asr": "16:06",
-        "Maghrib": "18:53",
-        "Athkar_elmasa": "19:13",
-        "Isha": "20:27",
-        "Tahajjud": "04:52"
-    },
-    {
-        "Month": 10,
-        "Day": 2,
-        "Fajr": "05:14",
-        "Sunrise": "07:01",
-        "Athkar_elsabah": "09:14",
-        "Duha": "12:01",
-        "Dhuhr": "13:01",
-        "Asr": "16:04",
-        "Maghrib": "18:51",
-        "Athkar_elmasa": "19:11",
-        "Isha": "20:25",
-        "Tahajjud": "04:54"
-    },
-    {
-        "Month": 10,
-        "Day": 3,
-        "Fajr": "05:16",
-        "Sunrise": "07:03",
-        "Athkar_elsabah": "09:16",
-        "Duha": "12:01",
-        "Dhuhr": "13:01",
-        "Asr": "16:03",
-        "Maghrib": "18:48",
-        "Athkar_elmasa": "19:08",
-        "Isha": "20:22",
-        "Tahajjud": "04:56"
-    },
-    {
-        "Month": 10,
-        "Day": 4,
-        "Fajr": "05:18",
-        "Sunrise": "07:05",
-        "Athkar_elsabah": "09:18",
-        "Duha": "12:00",
-        "Dhuhr": "13:00",
-        "Asr": "16:01",
-        "Maghrib": "18:46",
-        "Athkar_elmasa": "19:06",
-        "Isha": "20:20",
-        "Tahajjud": "04:58"
-    },
-    {
-        "Month": 10,
-        "Day": 5,
-        "Fajr": "05:19",
-        "Sunrise": "07:06",
-        "Athkar_elsabah": "09:19",
-        "Duha": "12:00",
-        "Dhuhr": "13:00",
-        "Asr": "15:59",
-        "Maghrib": "18:44",
-        "Athkar_elmasa": "19:04",
-        "Isha": "20:17",
-        "Tahajjud": "04:59"
-    },
-    {
-        "Month": 10,
-        "Day": 6,
-        "Fajr": "05:21",
-        "Sunrise": "07:08",
-        "Athkar_elsabah": "09:21",
-        "Duha": "12:00",
-        "Dhuhr": "13:00",
-        "Asr": "15:57",
-        "Maghrib": "18:41",
-        "Athkar_elmasa": "19:01",
-        "Isha": "20:15",
-        "Tahajjud": "05:01"
-    },
-    {
-        "Month": 10,
-        "Day": 7,
-        "Fajr": "05:23",
-        "Sunrise": "07:10",
-        "Athkar_elsabah": "09:23",
-        "Duha": "12:00",
-        "Dhuhr": "13:00",
-        "Asr": "15:56",
-        "Maghrib": "18:39",
-        "Athkar_elmasa": "18:59",
-        "Isha": "20:12",
-        "Tahajjud": "05:03"
-    },
-    {
-        "Month": 10,
-        "Day": 8,
-        "Fajr": "05:25",
-        "Sunrise": "07:12",
-        "Athkar_elsabah": "09:25",
-        "Duha": "11:59",
-        "Dhuhr": "12:59",
-        "Asr": "15:54",
-        "Maghrib": "18:37",
-        "Athkar_elmasa": "18:57",
-        "Isha": "20:10",
-        "Tahajjud": "05:05"
-    },
-    {
-        "Month": 10,
-        "Day": 9,
-        "Fajr": "05:27",
-        "Sunrise": "07:13",
-        "Athkar_elsabah": "09:27",
-        "Duha": "11:59",
-        "Dhuhr": "12:59",
-        "Asr": "15:52",
-        "Maghrib": "18:35",
-        "Athkar_elmasa": "18:55",
-        "Isha": "20:08",
-        "Tahajjud": "05:07"
-    },
-    {
-        "Month": 10,
-        "Day": 10,
-        "Fajr": "05:28",
-        "Sunrise": "07:15",
-        "Athkar_elsabah": "09:28",
-        "Duha": "11:59",
-        "Dhuhr": "12:59",
-        "Asr": "15:50",
-        "Maghrib": "18:32",
-        "Athkar_elmasa": "18:52",
-        "Isha": "20:05",
-        "Tahajjud": "05:08"
-    },
-    {
-        "Month": 10,
-        "Day": 11,
-        "Fajr": "05:30",
-        "Sunrise": "07:17",
-        "Athkar_elsabah": "09:30",
-        "Duha": "11:58",
-        "Dhuhr": "12:58",
-        "Asr": "15:49",
-        "Maghrib": "18:30",
-        "Athkar_elmasa": "18:50",
-        "Isha": "20:03",
-        "Tahajjud": "05:10"
-    },
-    {
-        "Month": 10,
-        "Day": 12,
-        "Fajr": "05:32",
-        "Sunrise": "07:19",
-        "Athkar_elsabah": "09:32",
-        "Duha": "11:58",
-        "Dhuhr": "12:58",
-        "Asr": "15:47",
-        "Maghrib": "18:28",
-        "Athkar_elmasa": "18:48",
-        "Isha": "20:01",
-        "Tahajjud": "05:12"
-    },
-    {
-        "Month": 10,
-        "Day": 13,
-        "Fajr": "05:34",
-        "Sunrise": "07:20",
-        "Athkar_elsabah": "09:34",
-        "Duha": "11:58",
-        "Dhuhr": "12:58",
-        "Asr": "15:45",
-        "Maghrib": "18:25",
-        "Athkar_elmasa": "18:45",
-        "Isha": "19:59",
-        "Tahajjud": "05:14"
-    },
-    {
-        "Month": 10,
-        "Day": 14,
-        "Fajr": "05:36",
-        "Sunrise": "07:22",
-        "Athkar_elsabah": "09:36",
-        "Duha": "11:58",
-        "Dhuhr": "12:58",
-        "Asr": "15:43",
-        "Maghrib": "18:23",
-        "Athkar_elmasa": "18:43",
-        "Isha": "19:56",
-        "Tahajjud": "05:16"
-    },
-    {
-        "Month": 10,
-        "Day": 15,
-        "Fajr": "05:37",
-        "Sunrise": "07:24",
-        "Athkar_elsabah": "09:37",
-        "Duha": "11:57",
-        "Dhuhr": "12:57",
-        "Asr": "15:42",
-        "Maghrib": "18:21",
-        "Athkar_elmasa": "18:41",
-        "Isha": "19:54",
-        "Tahajjud": "05:17"
-    },
-    {
-        "Month": 10,
-        "Day": 16,
-        "Fajr": "05:39",
-        "Sunrise": "07:26",
-        "Athkar_elsabah": "09:39",
-        "Duha": "11:57",
-        "Dhuhr": "12:57",
-        "Asr": "15:40",
-        "Maghrib": "18:19",
-        "Athkar_elmasa": "18:39",
-        "Isha": "19:52",
-        "Tahajjud": "05:19"
-    },
-    {
-        "Month": 10,
-        "Day": 17,
-        "Fajr": "05:41",
-        "Sunrise": "07:27",
-        "Athkar_elsabah": "09:41",
-        "Duha": "11:57",
-        "Dhuhr": "12:57",
-        "Asr": "15:38",
-        "Maghrib": "18:17",
-        "Athkar_elmasa": "18:37",
-        "Isha": "19:50",
-        "Tahajjud": "05:21"
-    },
-    {
-        "Month": 10,
-        "Day": 18,
-        "Fajr": "05:42",
-        "Sunrise": "07:29",
-        "Athkar_elsabah": "09:42",
-        "Duha": "11:57",
-        "Dhuhr": "12:57",
-        "Asr": "15:37",
-        "Maghrib": "18:14",
-        "Athkar_elmasa": "18:34",
-        "Isha": "19:48",
-        "Tahajjud": "05:22"
-    },
-    {
-        "Month": 10,
-        "Day": 19,
-        "Fajr": "05:44",
-        "Sunrise": "07:31",
-        "Athkar_elsabah": "09:44",
-        "Duha": "11:57",
-        "Dhuhr": "12:57",
-        "Asr": "15:35",
-        "Maghrib": "18:12",
-        "Athkar_elmasa": "18:32",
-        "Isha": "19:46",
-        "Tahajjud": "05:24"
-    },
-    {
-        "Month": 10,
-        "Day": 20,
-        "Fajr": "05:46",
-        "Sunrise": "07:33",
-        "Athkar_elsabah": "09:46",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:33",
-        "Maghrib": "18:10",
-        "Athkar_elmasa": "18:30",
-        "Isha": "19:44",
-        "Tahajjud": "05:26"
-    },
-    {
-        "Month": 10,
-        "Day": 21,
-        "Fajr": "05:48",
-        "Sunrise": "07:35",
-        "Athkar_elsabah": "09:48",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:32",
-        "Maghrib": "18:08",
-        "Athkar_elmasa": "18:28",
-        "Isha": "19:42",
-        "Tahajjud": "05:28"
-    },
-    {
-        "Month": 10,
-        "Day": 22,
-        "Fajr": "05:49",
-        "Sunrise": "07:36",
-        "Athkar_elsabah": "09:49",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:30",
-        "Maghrib": "18:06",
-        "Athkar_elmasa": "18:26",
-        "Isha": "19:40",
-        "Tahajjud": "05:29"
-    },
-    {
-        "Month": 10,
-        "Day": 23,
-        "Fajr": "05:51",
-        "Sunrise": "07:38",
-        "Athkar_elsabah": "09:51",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:28",
-        "Maghrib": "18:04",
-        "Athkar_elmasa": "18:24",
-        "Isha": "19:38",
-        "Tahajjud": "05:31"
-    },
-    {
-        "Month": 10,
-        "Day": 24,
-        "Fajr": "05:53",
-        "Sunrise": "07:40",
-        "Athkar_elsabah": "09:53",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:27",
-        "Maghrib": "18:02",
-        "Athkar_elmasa": "18:22",
-        "Isha": "19:36",
-        "Tahajjud": "05:33"
-    },
-    {
-        "Month": 10,
-        "Day": 25,
-        "Fajr": "05:54",
-        "Sunrise": "07:42",
-        "Athkar_elsabah": "09:54",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:25",
-        "Maghrib": "17:59",
-        "Athkar_elmasa": "18:19",
-        "Isha": "19:34",
-        "Tahajjud": "05:34"
-    },
-    {
-        "Month": 10,
-        "Day": 26,
-        "Fajr": "05:56",
-        "Sunrise": "07:44",
-        "Athkar_elsabah": "09:56",
-        "Duha": "11:56",
-        "Dhuhr": "12:56",
-        "Asr": "15:23",
-        "Maghrib": "17:57",
-        "Athkar_elmasa": "18:17",
-        "Isha": "19:32",
-        "Tahajjud": "05:36"
-    },
-    {
-        "Month": 10,
-        "Day": 27,
-        "Fajr": "05:58",
-        "Sunrise": "07:46",
-        "Athkar_elsabah": "09:58",
-        "Duha": "11:55",
-        "Dhuhr": "12:55",
-        "Asr": "15:22",
-        "Maghrib": "17:55",
-        "Athkar_elmasa": "18:15",
-        "Isha": "19:30",
-        "Tahajjud": "05:38"
-    },
-    {
-        "Month": 10,
-        "Day": 28,
-        "Fajr": "05:59",
-        "Sunrise": "07:47",
-        "Athkar_elsabah": "09:59",
-        "Duha": "11:55",
-        "Dhuhr": "12:55",
-        "Asr": "15:20",
-        "Maghrib": "17:53",
-        "Athkar_elmasa": "18:13",
-        "Isha": "19:28",
-        "Tahajjud": "05:39"
-    },
-    {
-        "Month": 10,
-        "Day": 29,
-        "Fajr": "06:01",
-        "Sunrise": "07:49",
-        "Athkar_elsabah": "10:01",
-        "Duha": "11:55",
-        "Dhuhr": "12:55",
-        "Asr": "15:19",
-        "Maghrib": "17:51",
-        "Athkar_elmasa": "18:11",
-        "Isha": "19:26",
-        "Tahajjud": "05:41"
-    },
-    {
-        "Month": 10,
-        "Day": 30,
-        "Fajr": "06:03",
-        "Sunrise": "07:51",
-        "Athkar_elsabah": "10:03",
-        "Duha": "11:55",
-        "Dhuhr": "12:55",
-        "Asr": "15:17",
-        "Maghrib": "17:49",
-        "Athkar_elmasa": "18:09",
-        "Isha": "19:25",
-        "Tahajjud": "05:43"
-    },
-    {
-        "Month": 10,
-        "Day": 31,
-        "Fajr": "06:04",
-        "Sunrise": "07:53",
-        "Athkar_elsabah": "10:04",
-        "Duha": "11:55",
-        "Dhuhr": "12:55",
-        "Asr": "15:16",
-        "Maghrib": "17:47",
-        "Athkar_elmasa": "18:07",
-        "Isha": "19:23",
-        "Tahajjud": "05:44"
-    },
-    {
-        "Month": 11,
-        "Day": 1,
-        "Fajr": "05:06",
-        "Sunrise": "06:55",
-        "Athkar_elsabah": "09:06",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:14",
-        "Maghrib": "16:46",
-        "Athkar_elmasa": "17:06",
-        "Isha": "18:21",
-        "Tahajjud": "04:46"
-    },
-    {
-        "Month": 11,
-        "Day": 2,
-        "Fajr": "05:07",
-        "Sunrise": "06:56",
-        "Athkar_elsabah": "09:07",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:13",
-        "Maghrib": "16:44",
-        "Athkar_elmasa": "17:04",
-        "Isha": "18:20",
-        "Tahajjud": "04:47"
-    },
-    {
-        "Month": 11,
-        "Day": 3,
-        "Fajr": "05:09",
-        "Sunrise": "06:58",
-        "Athkar_elsabah": "09:09",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:11",
-        "Maghrib": "16:42",
-        "Athkar_elmasa": "17:02",
-        "Isha": "18:18",
-        "Tahajjud": "04:49"
-    },
-    {
-        "Month": 11,
-        "Day": 4,
-        "Fajr": "05:11",
-        "Sunrise": "07:00",
-        "Athkar_elsabah": "09:11",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:10",
-        "Maghrib": "16:40",
-        "Athkar_elmasa": "17:00",
-        "Isha": "18:16",
-        "Tahajjud": "04:51"
-    },
-    {
-        "Month": 11,
-        "Day": 5,
-        "Fajr": "05:12",
-        "Sunrise": "07:02",
-        "Athkar_elsabah": "09:12",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:08",
-        "Maghrib": "16:38",
-        "Athkar_elmasa": "16:58",
-        "Isha": "18:15",
-        "Tahajjud": "04:52"
-    },
-    {
-        "Month": 11,
-        "Day": 6,
-        "Fajr": "05:14",
-        "Sunrise": "07:04",
-        "Athkar_elsabah": "09:14",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:07",
-        "Maghrib": "16:36",
-        "Athkar_elmasa": "16:56",
-        "Isha": "18:13",
-        "Tahajjud": "04:54"
-    },
-    {
-        "Month": 11,
-        "Day": 7,
-        "Fajr": "05:15",
-        "Sunrise": "07:06",
-        "Athkar_elsabah": "09:15",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:06",
-        "Maghrib": "16:35",
-        "Athkar_elmasa": "16:55",
-        "Isha": "18:12",
-        "Tahajjud": "04:55"
-    },
-    {
-        "Month": 11,
-        "Day": 8,
-        "Fajr": "05:17",
-        "Sunrise": "07:08",
-        "Athkar_elsabah": "09:17",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:04",
-        "Maghrib": "16:33",
-        "Athkar_elmasa": "16:53",
-        "Isha": "18:10",
-        "Tahajjud": "04:57"
-    },
-    {
-        "Month": 11,
-        "Day": 9,
-        "Fajr": "05:18",
-        "Sunrise": "07:09",
-        "Athkar_elsabah": "09:18",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:03",
-        "Maghrib": "16:31",
-        "Athkar_elmasa": "16:51",
-        "Isha": "18:09",
-        "Tahajjud": "04:58"
-    },
-    {
-        "Month": 11,
-        "Day": 10,
-        "Fajr": "05:20",
-        "Sunrise": "07:11",
-        "Athkar_elsabah": "09:20",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:02",
-        "Maghrib": "16:30",
-        "Athkar_elmasa": "16:50",
-        "Isha": "18:08",
-        "Tahajjud": "05:00"
-    },
-    {
-        "Month": 11,
-        "Day": 11,
-        "Fajr": "05:21",
-        "Sunrise": "07:13",
-        "Athkar_elsabah": "09:21",
-        "Duha": "10:55",
-        "Dhuhr": "11:55",
-        "Asr": "14:00",
-        "Maghrib": "16:28",
-        "Athkar_elmasa": "16:48",
-        "Isha": "18:06",
-        "Tahajjud": "05:01"
-    },
-    {
-        "Month": 11,
-        "Day": 12,
-        "Fajr": "05:23",
-        "Sunrise": "07:15",
-        "Athkar_elsabah": "09:23",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:59",
-        "Maghrib": "16:26",
-        "Athkar_elmasa": "16:46",
-        "Isha": "18:05",
-        "Tahajjud": "05:03"
-    },
-    {
-        "Month": 11,
-        "Day": 13,
-        "Fajr": "05:25",
-        "Sunrise": "07:17",
-        "Athkar_elsabah": "09:25",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:58",
-        "Maghrib": "16:25",
-        "Athkar_elmasa": "16:45",
-        "Isha": "18:04",
-        "Tahajjud": "05:05"
-    },
-    {
-        "Month": 11,
-        "Day": 14,
-        "Fajr": "05:26",
-        "Sunrise": "07:18",
-        "Athkar_elsabah": "09:26",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:57",
-        "Maghrib": "16:23",
-        "Athkar_elmasa": "16:43",
-        "Isha": "18:02",
-        "Tahajjud": "05:06"
-    },
-    {
-        "Month": 11,
-        "Day": 15,
-        "Fajr": "05:27",
-        "Sunrise": "07:20",
-        "Athkar_elsabah": "09:27",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:56",
-        "Maghrib": "16:22",
-        "Athkar_elmasa": "16:42",
-        "Isha": "18:01",
-        "Tahajjud": "05:07"
-    },
-    {
-        "Month": 11,
-        "Day": 16,
-        "Fajr": "05:29",
-        "Sunrise": "07:22",
-        "Athkar_elsabah": "09:29",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:55",
-        "Maghrib": "16:20",
-        "Athkar_elmasa": "16:40",
-        "Isha": "18:00",
-        "Tahajjud": "05:09"
-    },
-    {
-        "Month": 11,
-        "Day": 17,
-        "Fajr": "05:30",
-        "Sunrise": "07:24",
-        "Athkar_elsabah": "09:30",
-        "Duha": "10:56",
-        "Dhuhr": "11:56",
-        "Asr": "13:54",
-        "Maghrib": "16:19",
-        "Athkar_elmasa": "16:39",
-        "Isha": "17:59",
-        "Tahajjud": "05:10"
-    },
-    {
-        "Month": 11,
-        "Day": 18,
-        "Fajr": "05:32",
-        "Sunrise": "07:25",
-        "Athkar_elsabah": "09:32",
-        "Duha": "10:57",
-        "Dhuhr": "11:57",
-        "Asr": "13:52",
-        "Maghrib": "16:18",
-        "Athkar_elmasa": "16:38",
-        "Isha": "17:58",
-        "Tahajjud": "05:12"
-    },
-    {
-        "Month": 11,
-        "Day": 19,
-        "Fajr": "05:33",
-        "Sunrise": "07:27",
-        "Athkar_elsabah": "09:33",
-        "Duha": "10:57",
-        "Dhuhr": "11:57",
-        "Asr": "13:51",
-        "Maghrib": "16:16",
-        "Athkar_elmasa": "16:36",
-        "Isha": "17:57",
-        "Tahajjud": "05:13"
-    },
-    {
-        "Month": 11,
-        "Day": 20,
-        "Fajr": "05:35",
-        "Sunrise": "07:29",
-        "Athkar_elsabah": "09:35",
-        "Duha": "10:57",
-        "Dhuhr": "11:57",
-        "Asr": "13:51",
-        "Maghrib": "16:15",
-        "Athkar_elmasa": "16:35",
-        "Isha": "17:56",
-        "Tahajjud": "05:15"
-    },
-    {
-        "Month": 11,
-        "Day": 21,
-        "Fajr": "05:36",
-        "Sunrise": "07:31",
-        "Athkar_elsabah": "09:36",
-        "Duha": "10:57",
-        "Dhuhr": "11:57",
-        "Asr": "13:50",
-        "Maghrib": "16:14",
-        "Athkar_elmasa": "16:34",
-        "Isha": "17:55",
-        "Tahajjud": "05:16"
-    },
-    {
-        "Month": 11,
-        "Day": 22,
-        "Fajr": "05:37",
-        "Sunrise": "07:32",
-        "Athkar_elsabah": "09:37",
-        "Duha": "10:57",
-        "Dhuhr": "11:57",
-        "Asr": "13:49",
-        "Maghrib": "16:12",
-        "Athkar_elmasa": "16:32",
-        "Isha": "17:54",
-        "Tahajjud": "05:17"
-    },
-    {
-        "Month": 11,
-        "Day": 23,
-        "Fajr": "05:39",
-        "Sunrise": "07:34",
-        "Athkar_elsabah": "09:39",
-        "Duha": "10:58",
-        "Dhuhr": "11:58",
-        "Asr": "13:48",
-        "Maghrib": "16:11",
-        "Athkar_elmasa": "16:31",
-        "Isha": "17:53",
-        "Tahajjud": "05:19"
-    },
-    {
-        "Month": 11,
-        "Day": 24,
-        "Fajr": "05:40",
-        "Sunrise": "07:36",
-        "Athkar_elsabah": "09:40",
-        "Duha": "10:58",
-        "Dhuhr": "11:58",
-        "Asr": "13:47",
-        "Maghrib": "16:10",
-        "Athkar_elmasa": "16:30",
-        "Isha": "17:52",
-        "Tahajjud": "05:20"
-    },
-    {
-        "Month": 11,
-        "Day": 25,
-        "Fajr": "05:42",
-        "Sunrise": "07:37",
-        "Athkar_elsabah": "09:42",
-        "Duha": "10:58",
-        "Dhuhr": "11:58",
-        "Asr": "13:46",
-        "Maghrib": "16:09",
-        "Athkar_elmasa": "16:29",
-        "Isha": "17:52",
-        "Tahajjud": "05:22"
-    },
-    {
-        "Month": 11,
-        "Day": 26,
-        "Fajr": "05:43",
-        "Sunrise": "07:39",
-        "Athkar_elsabah": "09:43",
-        "Duha": "10:59",
-        "Dhuhr": "11:59",
-        "Asr": "13:46",
-        "Maghrib": "16:08",
-        "Athkar_elmasa": "16:28",
-        "Isha": "17:51",
-        "Tahajjud": "05:23"
-    },
-    {
-        "Month": 11,
-        "Day": 27,
-        "Fajr": "05:44",
-        "Sunrise": "07:41",
-        "Athkar_elsabah": "09:44",
-        "Duha": "10:59",
-        "Dhuhr": "11:59",
-        "Asr": "13:45",
-        "Maghrib": "16:07",
-        "Athkar_elmasa": "16:27",
-        "Isha": "17:50",
-        "Tahajjud": "05:24"
-    },
-    {
-        "Month": 11,
-        "Day": 28,
-        "Fajr": "05:45",
-        "Sunrise": "07:42",
-        "Athkar_elsabah": "09:45",
-        "Duha": "10:59",
-        "Dhuhr": "11:59",
-        "Asr": "13:44",
-        "Maghrib": "16:06",
-        "Athkar_elmasa": "16:26",
-        "Isha": "17:50",
-        "Tahajjud": "05:25"
-    },
-    {
-        "Month": 11,
-        "Day": 29,
-        "Fajr": "05:47",
-        "Sunrise": "07:44",
-        "Athkar_elsabah": "09:47",
-        "Duha": "11:00",
-        "Dhuhr": "12:00",
-        "Asr": "13:44",
-        "Maghrib": "16:05",
-        "Athkar_elmasa": "16:25",
-        "Isha": "17:49",
-        "Tahajjud": "05:27"
-    },
-    {
-        "Month": 11,
-        "Day": 30,
-        "Fajr": "05:48",
-        "Sunrise": "07:45",
-        "Athkar_elsabah": "09:48",
-        "Duha": "11:00",
-        "Dhuhr": "12:00",
-        "Asr": "13:43",
-        "Maghrib": "16:05",
-        "Athkar_elmasa": "16:25",
-        "Isha": "17:48",
-        "Tahajjud": "05:28"
-    },
-    {
-        "Month": 12,
-        "Day": 1,
-        "Fajr": "05:49",
-        "Sunrise": "07:47",
-        "Athkar_elsabah": "09:49",
-        "Duha": "11:00",
-        "Dhuhr": "12:00",
-        "Asr": "13:43",
-        "Maghrib": "16:04",
-        "Athkar_elmasa": "16:24",
-        "Isha": "17:48",
-        "Tahajjud": "05:29"
-    },
-    {
-        "Month": 12,
-        "Day": 2,
-        "Fajr": "05:50",
-        "Sunrise": "07:48",
-        "Athkar_elsabah": "09:50",
-        "Duha": "11:01",
-        "Dhuhr": "12:01",
-        "Asr": "13:42",
-        "Maghrib": "16:03",
-        "Athkar_elmasa": "16:23",
-        "Isha": "17:47",
-        "Tahajjud": "05:30"
-    },
-    {
-        "Month": 12,
-        "Day": 3,
-        "Fajr": "05:51",
-        "Sunrise": "07:49",
-        "Athkar_elsabah": "09:51",
-        "Duha": "11:01",
-        "Dhuhr": "12:01",
-        "Asr": "13:42",
-        "Maghrib": "16:02",
-        "Athkar_elmasa": "16:22",
-        "Isha": "17:47",
-        "Tahajjud": "05:31"
-    },
-    {
-        "Month": 12,
-        "Day": 4,
-        "Fajr": "05:52",
-        "Sunrise": "07:51",
-        "Athkar_elsabah": "09:52",
-        "Duha": "11:01",
-        "Dhuhr": "12:01",
-        "Asr": "13:41",
-        "Maghrib": "16:02",
-        "Athkar_elmasa": "16:22",
-        "Isha": "17:47",
-        "Tahajjud": "05:32"
-    },
-    {
-        "Month": 12,
-        "Day": 5,
-        "Fajr": "05:54",
-        "Sunrise": "07:52",
-        "Athkar_elsabah": "09:54",
-        "Duha": "11:02",
-        "Dhuhr": "12:02",
-        "Asr": "13:41",
-        "Maghrib": "16:01",
-        "Athkar_elmasa": "16:21",
-        "Isha": "17:46",
-        "Tahajjud": "05:34"
-    },
-    {
-        "Month": 12,
-        "Day": 6,
-        "Fajr": "05:55",
-        "Sunrise": "07:54",
-        "Athkar_elsabah": "09:55",
-        "Duha": "11:02",
-        "Dhuhr": "12:02",
-        "Asr": "13:41",
-        "Maghrib": "16:01",
-        "Athkar_elmasa": "16:21",
-        "Isha": "17:46",
-        "Tahajjud": "05:35"
-    },
-    {
-        "Month": 12,
-        "Day": 7,
-        "Fajr": "05:56",
-        "Sunrise": "07:55",
-        "Athkar_elsabah": "09:56",
-        "Duha": "11:03",
-        "Dhuhr": "12:03",
-        "Asr": "13:41",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:46",
-        "Tahajjud": "05:36"
-    },
-    {
-        "Month": 12,
-        "Day": 8,
-        "Fajr": "05:57",
-        "Sunrise": "07:56",
-        "Athkar_elsabah": "09:57",
-        "Duha": "11:03",
-        "Dhuhr": "12:03",
-        "Asr": "13:40",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:46",
-        "Tahajjud": "05:37"
-    },
-    {
-        "Month": 12,
-        "Day": 9,
-        "Fajr": "05:58",
-        "Sunrise": "07:57",
-        "Athkar_elsabah": "09:58",
-        "Duha": "11:03",
-        "Dhuhr": "12:03",
-        "Asr": "13:40",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:46",
-        "Tahajjud": "05:38"
-    },
-    {
-        "Month": 12,
-        "Day": 10,
-        "Fajr": "05:59",
-        "Sunrise": "07:58",
-        "Athkar_elsabah": "09:59",
-        "Duha": "11:04",
-        "Dhuhr": "12:04",
-        "Asr": "13:40",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:46",
-        "Tahajjud": "05:39"
-    },
-    {
-        "Month": 12,
-        "Day": 11,
-        "Fajr": "06:00",
-        "Sunrise": "07:59",
-        "Athkar_elsabah": "10:00",
-        "Duha": "11:04",
-        "Dhuhr": "12:04",
-        "Asr": "13:40",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:40"
-    },
-    {
-        "Month": 12,
-        "Day": 12,
-        "Fajr": "06:00",
-        "Sunrise": "08:00",
-        "Athkar_elsabah": "10:00",
-        "Duha": "11:05",
-        "Dhuhr": "12:05",
-        "Asr": "13:40",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:40"
-    },
-    {
-        "Month": 12,
-        "Day": 13,
-        "Fajr": "06:01",
-        "Sunrise": "08:02",
-        "Athkar_elsabah": "10:01",
-        "Duha": "11:05",
-        "Dhuhr": "12:05",
-        "Asr": "13:40",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:41"
-    },
-    {
-        "Month": 12,
-        "Day": 14,
-        "Fajr": "06:02",
-        "Sunrise": "08:02",
-        "Athkar_elsabah": "10:02",
-        "Duha": "11:06",
-        "Dhuhr": "12:06",
-        "Asr": "13:40",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:42"
-    },
-    {
-        "Month": 12,
-        "Day": 15,
-        "Fajr": "06:03",
-        "Sunrise": "08:03",
-        "Athkar_elsabah": "10:03",
-        "Duha": "11:06",
-        "Dhuhr": "12:06",
-        "Asr": "13:41",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:43"
-    },
-    {
-        "Month": 12,
-        "Day": 16,
-        "Fajr": "06:04",
-        "Sunrise": "08:04",
-        "Athkar_elsabah": "10:04",
-        "Duha": "11:07",
-        "Dhuhr": "12:07",
-        "Asr": "13:41",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:44"
-    },
-    {
-        "Month": 12,
-        "Day": 17,
-        "Fajr": "06:04",
-        "Sunrise": "08:05",
-        "Athkar_elsabah": "10:04",
-        "Duha": "11:07",
-        "Dhuhr": "12:07",
-        "Asr": "13:41",
-        "Maghrib": "15:59",
-        "Athkar_elmasa": "16:19",
-        "Isha": "17:46",
-        "Tahajjud": "05:44"
-    },
-    {
-        "Month": 12,
-        "Day": 18,
-        "Fajr": "06:05",
-        "Sunrise": "08:06",
-        "Athkar_elsabah": "10:05",
-        "Duha": "11:08",
-        "Dhuhr": "12:08",
-        "Asr": "13:41",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:47",
-        "Tahajjud": "05:45"
-    },
-    {
-        "Month": 12,
-        "Day": 19,
-        "Fajr": "06:06",
-        "Sunrise": "08:06",
-        "Athkar_elsabah": "10:06",
-        "Duha": "11:08",
-        "Dhuhr": "12:08",
-        "Asr": "13:42",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:47",
-        "Tahajjud": "05:46"
-    },
-    {
-        "Month": 12,
-        "Day": 20,
-        "Fajr": "06:06",
-        "Sunrise": "08:07",
-        "Athkar_elsabah": "10:06",
-        "Duha": "11:09",
-        "Dhuhr": "12:09",
-        "Asr": "13:42",
-        "Maghrib": "16:00",
-        "Athkar_elmasa": "16:20",
-        "Isha": "17:47",
-        "Tahajjud": "05:46"
-    },
-    {
-        "Month": 12,
-        "Day": 21,
-        "Fajr": "06:07",
-        "Sunrise": "08:08",
-        "Athkar_elsabah": "10:07",
-        "Duha": "11:09",
-        "Dhuhr": "12:09",
-        "Asr": "13:42",
-        "Maghrib": "16:01",
-        "Athkar_elmasa": "16:21",
-        "Isha": "17:48",
-        "Tahajjud": "05:47"
-    },
-    {
-        "Month": 12,
-        "Day": 22,
-        "Fajr": "06:07",
-        "Sunrise": "08:08",
-        "Athkar_elsabah": "10:07",
-        "Duha": "11:10",
-        "Dhuhr": "12:10",
-        "Asr": "13:43",
-        "Maghrib": "16:01",
-        "Athkar_elmasa": "16:21",
-        "Isha": "17:48",
-        "Tahajjud": "05:47"
-    },
-    {
-        "Month": 12,
-        "Day": 23,
-        "Fajr": "06:08",
-        "Sunrise": "08:09",
-        "Athkar_elsabah": "10:08",
-        "Duha": "11:10",
-        "Dhuhr": "12:10",
-        "Asr": "13:43",
-        "Maghrib": "16:02",
-        "Athkar_elmasa": "16:22",
-        "Isha": "17:49",
-        "Tahajjud": "05:48"
-    },
-    {
-        "Month": 12,
-        "Day": 24,
-        "Fajr": "06:08",
-        "Sunrise": "08:09",
-        "Athkar_elsabah": "10:08",
-        "Duha": "11:11",
-        "Dhuhr": "12:11",
-        "Asr": "13:44",
-        "Maghrib": "16:02",
-        "Athkar_elmasa": "16:22",
-        "Isha": "17:49",
-        "Tahajjud": "05:48"
-    },
-    {
-        "Month": 12,
-        "Day": 25,
-        "Fajr": "06:09",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:11",
-        "Dhuhr": "12:11",
-        "Asr": "13:45",
-        "Maghrib": "16:03",
-        "Athkar_elmasa": "16:23",
-        "Isha": "17:50",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 12,
-        "Day": 26,
-        "Fajr": "06:09",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:12",
-        "Dhuhr": "12:12",
-        "Asr": "13:45",
-        "Maghrib": "16:04",
-        "Athkar_elmasa": "16:24",
-        "Isha": "17:51",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 12,
-        "Day": 27,
-        "Fajr": "06:09",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:09",
-        "Duha": "11:12",
-        "Dhuhr": "12:12",
-        "Asr": "13:46",
-        "Maghrib": "16:04",
-        "Athkar_elmasa": "16:24",
-        "Isha": "17:51",
-        "Tahajjud": "05:49"
-    },
-    {
-        "Month": 12,
-        "Day": 28,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:13",
-        "Dhuhr": "12:13",
-        "Asr": "13:47",
-        "Maghrib": "16:05",
-        "Athkar_elmasa": "16:25",
-        "Isha": "17:52",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 12,
-        "Day": 29,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:13",
-        "Dhuhr": "12:13",
-        "Asr": "13:47",
-        "Maghrib": "16:06",
-        "Athkar_elmasa": "16:26",
-        "Isha": "17:53",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 12,
-        "Day": 30,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:14",
-        "Dhuhr": "12:14",
-        "Asr": "13:48",
-        "Maghrib": "16:07",
-        "Athkar_elmasa": "16:27",
-        "Isha": "17:53",
-        "Tahajjud": "05:50"
-    },
-    {
-        "Month": 12,
-        "Day": 31,
-        "Fajr": "06:10",
-        "Sunrise": "08:10",
-        "Athkar_elsabah": "10:10",
-        "Duha": "11:14",
-        "Dhuhr": "12:14",
-        "Asr": "13:49",
-        "Maghrib": "16:08",
-        "Athkar_elmasa": "16:28",
-        "Isha": "17:54",
-        "Tahajjud": "05:50"
-    }
-]
\ No newline at end of file
@@ -47,6 +47,13 @@ QURAN_AUDIO_DIR = os.path.join(MAIN_DIR, "audio", "quran")
 APPLY_SETTINGS_SCRIPT_FILE = os.path.join(MAIN_DIR, "config", "scripts", "apply_settings.sh")
 APPLY_SETTINGS_LOG_FILE = os.path.join(MAIN_DIR, "logs", "apply_settings.log")
 PRAYER_CSV_FILE = os.path.join(DESKTOP_DIR, "إدخال-مواقيت-الصلاة-للمستخدم.csv")
+PRAYER_SCHEDULE_FILE = os.path.join(MAIN_DIR, "config", "prayer_times.bin")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import ScheduleStore, ScheduleFormatError, BASE_COLUMNS
+from timetable import Timetable
+from settings_snapshot import write_settings
+from prayer_csv import validate_prayer_csv, format_issue, ERROR
 
 # ---- per-prayer audio directories (NEW) ----
 PRAYER_AUDIO_DIRS = {
@@ -63,10 +70,8 @@ ATHKAR_ELSABAH_AUDIO_DIR = os.path.join(MAIN_DIR, "audio", "athkar_elsabah")
 ATHKAR_ELMASA_AUDIO_DIR = os.path.join(MAIN_DIR, "audio", "athkar_elmasa")
 
 
-EXPECTED_CSV_HEADER = [
-    "Month", "Day", "Fajr", "Sunrise",
-    "Dhuhr", "Asr", "Maghrib", "Isha"
-]
+# Problems listed in the error box when the prayer CSV is rejected
+MAX_SHOWN_CSV_ERRORS = 10
 
 
 # ---------------- Defaults ----------------
@@ -112,6 +117,15 @@ PRAYER_TIMES = [
 for key, _ in PRAYER_TIMES:
     DEFAULTS_BOOL[f"{PRAYER_PREFIX}{key}"] = True
 
+# Keys of [Settings] this window edits; the others (location, prearm_seconds,
+# measure_onset, ...) are written by other tools and left as they are
+OWNED_SETTINGS = (
+    list(DEFAULTS_INT) + list(DEFAULTS_BOOL) + ["listen_to_quran"]
+    + [f"{name}_audio_checked" for name in
+       ("quran", "tahajjud", "duha", "athkar_elsabah", "athkar_elmasa")]
+    + [f"{prayer_key}_audio_checked" for prayer_key in PRAYER_AUDIO_DIRS]
+)
+
 PRAYER_SECTION_TITLE_STYLE = "font-size: 22px; font-weight: bold; margin-top: 15px;"
 
 # =====================================================
@@ -581,32 +595,29 @@ class ControlApp(QMainWindow):
     def get_today_sunrise_dhuhr(self):
         """
         Returns (sunrise_minutes, dhuhr_minutes) for today
-        from إدخال-مواقيت-الصلاة-للمستخدم.csv
+        from the compiled schedule (or إدخال-مواقيت-الصلاة-للمستخدم.csv)
         """
-        from datetime import datetime
-
-        today = datetime.now()
-        month = today.month
-        day = today.day
-
-        with open(PRAYER_CSV_FILE, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                if int(row["Month"]) == month and int(row["Day"]) == day:
-                    sunrise = self.time_to_minutes(row["Sunrise"])
-                    dhuhr = self.time_to_minutes(row["Dhuhr"])
-                    return sunrise, dhuhr
-
-        raise ValueError("لم يتم العثور على مواقيت الصلاة لليوم الحالي")
+        times = self.get_today_prayer_times()
+        return times["sunrise"], times["dhuhr"]
 
-        # --- Read today's prayer times from CSV ---
+    # --- Read today's prayer times from the compiled schedule ---
     def get_today_prayer_times(self):
         from datetime import datetime
 
         today = datetime.now()
         month, day = today.month, today.day
 
+        try:
+            store = ScheduleStore(PRAYER_SCHEDULE_FILE)
+            try:
+                times = Timetable(store, BASE_COLUMNS).on(today.date())
+            finally:
+                store.close()
+            if len(times) == len(BASE_COLUMNS):
+                return {label.lower(): minutes for label, minutes in times.items()}
+        except (OSError, ScheduleFormatError):
+            pass  # not compiled yet, fall back to the user's CSV
+
         with open(PRAYER_CSV_FILE, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for row in reader:
@@ -711,8 +722,6 @@ class ControlApp(QMainWindow):
         Returns a dictionary with actual times for Duha, Tahajjud, Athkar Elsabah, Athkar Elmasa
         in HH:MM format, based on today’s prayer times and user-configured minutes.
         """
-        from datetime import datetime
-
         times = {}
         try:
             sunrise, dhuhr = self.get_today_sunrise_dhuhr()
@@ -722,13 +731,8 @@ class ControlApp(QMainWindow):
             times['duha'] = f"{duha_minutes//60:02d}:{duha_minutes%60:02d}"
 
             # Tahajjud: fajr - tahajjud_spin
-            with open(PRAYER_CSV_FILE, newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                today = datetime.now()
-                for row in reader:
-                    if int(row["Month"]) == today.month and int(row["Day"]) == today.day:
-                        fajr = self.time_to_minutes(row["Fajr"])
-                        break
+            today_times = self.get_today_prayer_times()
+            fajr = today_times["fajr"]
             tahajjud_minutes = fajr - self.tahajjud_spin.value()
             times['tahajjud'] = f"{tahajjud_minutes//60:02d}:{tahajjud_minutes%60:02d}"
 
@@ -737,7 +741,7 @@ class ControlApp(QMainWindow):
             times['athkar_elsabah'] = f"{athkar_sabah_minutes//60:02d}:{athkar_sabah_minutes%60:02d}"
 
             # Athkar Elmasa: maghrib + athkar_elmasa_spin
-            maghrib = self.time_to_minutes(row["Maghrib"])
+            maghrib = today_times["maghrib"]
             athkar_masa_minutes = maghrib + self.athkar_elmasa_spin.value()
             times['athkar_elmasa'] = f"{athkar_masa_minutes//60:02d}:{athkar_masa_minutes%60:02d}"
 
@@ -824,40 +828,23 @@ class ControlApp(QMainWindow):
             )
             return False
 
+        # 2 Check every row in one pass: format, dates, prayer order, whole year
         try:
-            with open(PRAYER_CSV_FILE, newline="", encoding="utf-8") as csvfile:
-                reader = csv.reader(csvfile)
-                rows = list(reader)
-
-            # 2 Check empty file
-            if not rows:
-                raise ValueError("empty file")
-
-            # 3 Validate header
-            header = [h.strip() for h in rows[0]]
-            if header != EXPECTED_CSV_HEADER:
-                arabic_error(
-                    self,
-                    "خطأ",
-                    "ملف إدخال-مواقيت-الصلاة-للمستخدم.csv ليس مولد بالصغة المطلوبة التي هي\n\n"
-                    "على سبيل المثال:\n"
-                    "Month,Day,Fajr,Sunrise,Dhuhr,Asr,Maghrib,Isha\n"
-                    "1,1,06:10,08:10,12:15,13:50,16:09,17:55"
-                )
-                return False
-
-            # 4 Ensure at least one data row
-            if len(rows) < 2:
-                raise ValueError("no data rows")
+            result = validate_prayer_csv(PRAYER_CSV_FILE)
+            errors = [format_issue(issue) for issue in result.issues if issue.severity == ERROR]
+            ok = result.ok
+        except (OSError, UnicodeDecodeError) as e:
+            errors, ok = [str(e)], False
 
-        except Exception:
+        if not ok:
             arabic_error(
                 self,
                 "خطأ",
                 "ملف إدخال-مواقيت-الصلاة-للمستخدم.csv ليس مولد بالصغة المطلوبة التي هي\n\n"
                 "على سبيل المثال:\n"
                 "Month,Day,Fajr,Sunrise,Dhuhr,Asr,Maghrib,Isha\n"
-                "1,1,06:10,08:10,12:15,13:50,16:09,17:55"
+                "1,1,06:10,08:10,12:15,13:50,16:09,17:55\n\n"
+                + "\n".join(errors[:MAX_SHOWN_CSV_ERRORS])
             )
             return False
 
@@ -1094,6 +1081,22 @@ class ControlApp(QMainWindow):
 
 
 
+    def write_config(self):
+        """Writes this window's keys into config.ini as it is now on disk, so
+        keys other tools wrote since the window opened are kept."""
+        config = configparser.ConfigParser(interpolation=None)
+        config.read(SETTINGS_INI_FILE, encoding="utf-8")
+        if "Settings" not in config:
+            config["Settings"] = {}
+        ours, current = self.config["Settings"], config["Settings"]
+        for key in OWNED_SETTINGS:
+            if key in ours:
+                current[key] = ours[key]
+            else:
+                current.pop(key, None)
+        write_settings(config, SETTINGS_INI_FILE)
+        self.config = config
+
     def save_settings(self, show_message=True):
         # --- Validation for Duha ---
         if self.duha_spin.value() <= 30:
@@ -1137,9 +1140,8 @@ class ControlApp(QMainWindow):
                 f"{prayer_key}_audio_checked"
             )
 
-        # Write config to file
-        with open(SETTINGS_INI_FILE, "w", encoding="utf-8") as f:
-            self.config.write(f)
+        # Write config to file (atomically, the scheduler service may be reading it)
+        self.write_config()
 
         return True  # indicate save succeeded
 
@@ -1205,9 +1207,8 @@ class ControlApp(QMainWindow):
             # Ensure config directory exists
             os.makedirs(os.path.dirname(SETTINGS_INI_FILE), exist_ok=True)
 
-            # Write config.ini (override)
-            with open(SETTINGS_INI_FILE, "w", encoding="utf-8") as f:
-                self.config.write(f)
+            # Write config.ini (this window's keys only)
+            self.write_config()
 
             # Reload UI from config
             self.apply_config_to_ui()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Append-only journal of executed events.
+
+Every state change of an event is one 16-byte record: a 64-bit integer key,
+a status byte (started, done, failed) and a CRC32 of both. The last record
+of a key wins. Records are appended and fsync'd one at a time, so a power
+cut can at worst leave a torn last record, which is ignored on load.
+
+Keys start with the event minute (minutes since the epoch), so the journal
+can drop everything older than the retention window. It compacts itself by
+rewriting the live keys to a temporary file and renaming it over the old one.
+"""
+import os
+import struct
+import zlib
+
+# ──────────────────────────────────────────────────────────────
+# Format
+# ──────────────────────────────────────────────────────────────
+MAGIC = b"EVJ2"
+RECORD_BODY = struct.Struct("<QB3x")  # key, status
+RECORD_SIZE = RECORD_BODY.size + 4    # + crc32 of the body
+
+STATUS_STARTED = 1
+STATUS_DONE = 2
+STATUS_FAILED = 3
+
+KIND_BITS = 4  # low bits of a key hold the event kind
+
+DEFAULT_RETENTION_MINUTES = 2 * 24 * 60
+DEFAULT_COMPACT_EVERY = 256  # appends between automatic compactions
+
+
+def make_key(epoch_minute, kind):
+    return (epoch_minute << KIND_BITS) | kind
+
+
+def key_minute(key):
+    return key >> KIND_BITS
+
+
+def key_kind(key):
+    return key & ((1 << KIND_BITS) - 1)
+
+
+def _pack(key, status):
+    body = RECORD_BODY.pack(key, status)
+    return body + zlib.crc32(body).to_bytes(4, "little")
+
+
+class EventJournal:
+    def __init__(self, path, retention_minutes=DEFAULT_RETENTION_MINUTES,
+                 compact_every=DEFAULT_COMPACT_EVERY):
+        self.path = path
+        self.retention_minutes = retention_minutes
+        self.compact_every = compact_every
+        self.statuses = {}  # key -> last status
+        self.records = 0    # records in the file, live or not
+        self._fd = -1
+        self._load()
+
+    def __contains__(self, key):
+        return key in self.statuses
+
+    def __len__(self):
+        return len(self.statuses)
+
+    def status(self, key):
+        return self.statuses.get(key)
+
+    def _load(self):
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                data = f.read()
+            valid = len(MAGIC)
+            body = memoryview(data)[len(MAGIC):]
+            if data[:len(MAGIC)] == MAGIC:
+                for offset in range(0, len(body) - RECORD_SIZE + 1, RECORD_SIZE):
+                    record = body[offset:offset + RECORD_SIZE]
+                    if zlib.crc32(record[:RECORD_BODY.size]) != int.from_bytes(record[RECORD_BODY.size:], "little"):
+                        break  # torn write at the tail
+                    key, status = RECORD_BODY.unpack_from(record)
+                    self.statuses[key] = status
+                    self.records += 1
+                    valid += RECORD_SIZE
+            # A torn tail or a foreign file is fixed by rewriting it now
+            if len(data) != valid:
+                self._rewrite()
+        else:
+            self._rewrite()
+        self._open()
+
+    def _open(self):
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CLOEXEC)
+
+    def _rewrite(self):
+        tmp_path = f"{self.path}.tmp"
+        buf = bytearray(MAGIC)
+        for key in sorted(self.statuses):
+            buf += _pack(key, self.statuses[key])
+        with open(tmp_path, "wb") as f:
+            f.write(buf)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_dir(os.path.dirname(self.path))
+        self.records = len(self.statuses)
+
+    def add(self, key, status=STATUS_DONE, now_minute=None):
+        """Records the status of `key` durably; compacts first if enough records piled up."""
+        if self.statuses.get(key) == status:
+            return
+        if now_minute is not None and self.records >= self.compact_every:
+            self.compact(now_minute)
+        os.write(self._fd, _pack(key, status))
+        os.fsync(self._fd)
+        self.statuses[key] = status
+        self.records += 1
+
+    def compact(self, now_minute):
+        """Drops keys older than the retention window and rewrites the file."""
+        cutoff = now_minute - self.retention_minutes
+        self.statuses = {key: status for key, status in self.statuses.items()
+                         if key_minute(key) >= cutoff}
+        os.close(self._fd)
+        self._rewrite()
+        self._open()
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _fsync_dir(path):
+    fd = os.open(path or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -1,35 +1,35 @@
 #!/bin/bash
 MAIN_DIR="/home/ihms/Desktop"
 INPUT_CSV_FILE="$MAIN_DIR/إدخال-مواقيت-الصلاة-للمستخدم.csv"
-OUTPUT_CSV_FILE="$MAIN_DIR/اوقات-الصلاة-المستخدمةبالتطبيقات.csv"
 CONFIG_DIR="$MAIN_DIR/scheduler/config"
 SCRIPTS_DIR="$MAIN_DIR/scheduler/config/scripts"
-DESKTOP_APP_DIR="$MAIN_DIR/scheduler/applications/desktop/prayer_times_gui"
 
 
 
-if [[ ! -z $INPUT_CSV_FILE ]]; then
-	echo "copy $INPUT_CSV_FILE file to $CONFIG_DIR/input-prayers-time.csv"
-	cp -f $INPUT_CSV_FILE $CONFIG_DIR/input-prayers-time.csv
+# A location picked with switch_location.py replaces the user's CSV
+LOCATION=$(sed -n 's/^location *= *//p' "$CONFIG_DIR/config.ini")
+
+if [[ -n $LOCATION ]]; then
+	START_NS=$(date +%s%N)
+
+	echo "Publish location $LOCATION based on config.ini settings"
+	/usr/bin/python3 $SCRIPTS_DIR/switch_location.py "$LOCATION" || exit 1
 	echo
-	
-	echo "Add fields to csv file based on config.ini settings"
-	/usr/bin/python3 $SCRIPTS_DIR/01_add_fields.py
+
+	echo "Applied in $(( ($(date +%s%N) - START_NS) / 1000000 )) ms"
 	echo
-	
-	echo "copy $CONFIG_DIR/prayer_times.csv file to $OUTPUT_CSV_FILE"
-	cp -f $CONFIG_DIR/prayer_times.csv $OUTPUT_CSV_FILE 
+elif [[ -f $INPUT_CSV_FILE ]]; then
+	START_NS=$(date +%s%N)
+
+	echo "Compile $INPUT_CSV_FILE based on config.ini settings"
+	/usr/bin/python3 $SCRIPTS_DIR/ingest_prayer_times.py "$INPUT_CSV_FILE" || exit 1
 	echo
-	
-	echo "convert csv flie to map..."
-	/usr/bin/python3 $SCRIPTS_DIR/02_convert_list_to_map.py
+
+	echo "Applied in $(( ($(date +%s%N) - START_NS) / 1000000 )) ms"
 	echo
-	
-	echo "copy $CONFIG_DIR/prayer_times_map.py file to $DESKTOP_APP_DIR"
-	cp -f $CONFIG_DIR/prayer_times_map.py $DESKTOP_APP_DIR/
-	
-	echo "Restart the scheduler App & Desktop scheduler App"
-	sudo systemctl restart audio_event_scheduler.service
+
+	# The scheduler service watches config.ini and prayer_times.bin and
+	# applies the change itself, no restart needed
 
 	# DESKTOP_APP_PROCESS_ID=$(ps -ef | grep scheduler_settings_gui | grep pyth | awk '{print $2}')
 	# if [[ ! -z $DESKTOP_APP_PROCESS_ID ]]; then
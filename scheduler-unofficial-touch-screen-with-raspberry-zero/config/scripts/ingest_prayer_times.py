@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Turns the user's prayer-times CSV into the schedule used by the applications.
+
+The input (Month,Day,Fajr,Sunrise,Dhuhr,Asr,Maghrib,Isha) is read row by row.
+Each row is checked (common/prayer_csv.py) and goes straight into the
+compiled schedule, which only holds these base times, and into the full CSV
+shown to the user, which also gets the derived times (Athkar, Duha,
+Tahajjud) from the config.ini offsets. Both files are written next to their
+targets and renamed over them only once the whole input went through
+without errors, so a bad row never leaves a half-applied schedule behind.
+
+Each output is a stage with a fingerprint of what it was built from (the
+input's SHA-256, plus the offsets for the CSV) and of the file it produced.
+A stage whose fingerprints still match is reused instead of rebuilt, so
+applying unchanged settings again costs one hash of the input.
+
+Usage:
+    ingest_prayer_times.py [--force] [input.csv]
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+
+started = time.perf_counter()
+
+# ===== CONFIGURATION =====
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+DESKTOP_DIR = os.path.dirname(MAIN_DIR)
+CONFIG_DIR = os.path.join(MAIN_DIR, "config")
+VAR_DIR = os.path.join(MAIN_DIR, "var")
+
+SETTINGS_INI_FILE = os.path.join(CONFIG_DIR, "config.ini")
+PRAYER_INPUT_CSV_FILE = os.path.join(DESKTOP_DIR, "إدخال-مواقيت-الصلاة-للمستخدم.csv")
+PRAYER_OUTPUT_CSV_FILE = os.path.join(DESKTOP_DIR, "اوقات-الصلاة-المستخدمةبالتطبيقات.csv")
+PRAYER_SCHEDULE_FILE = os.path.join(CONFIG_DIR, "prayer_times.bin")
+BUILD_CACHE_FILE = os.path.join(VAR_DIR, "ingest-cache.json")
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import ScheduleWriter, COLUMNS, FORMAT_VERSION, MISSING, minutes_to_hhmm, resolver
+from settings_snapshot import SettingsCache
+from prayer_csv import PrayerCsvReader, WARNING, format_issue
+
+OUTPUT_HEADER = ['Month', 'Day'] + COLUMNS
+
+# Bump when the way an output is built changes, so cached stages are rebuilt
+CACHE_VERSION = 1
+
+
+class IngestError(Exception):
+    pass
+
+
+# ===== INGEST =====
+def ingest(lines, csv_path, schedule_path, offsets):
+    """Streams CSV `lines` into the outputs whose path is not None; returns
+    the number of days, the revision of the schedule (None if not built) and
+    the warnings about the input."""
+    schedule = ScheduleWriter(schedule_path) if schedule_path else None
+    resolve = resolver(offsets)
+    tmp_csv_path = f"{csv_path}.{os.getpid()}.tmp" if csv_path else None
+    reader = PrayerCsvReader(lines)
+    revision = None
+    try:
+        with open(tmp_csv_path or os.devnull, 'w', newline='', encoding='utf-8') as dst:
+            writer = csv.writer(dst, lineterminator='\n') if csv_path else None
+            if writer:
+                writer.writerow(OUTPUT_HEADER)
+            for month, day, base in reader:
+                if schedule:
+                    schedule.add(month, day, base)
+                if writer:
+                    writer.writerow([month, day] + [
+                        '' if m == MISSING else minutes_to_hhmm(m) for m in resolve(base)
+                    ])
+            if not reader.ok:
+                raise IngestError("\n".join(format_issue(issue) for issue in reader.issues))
+            if writer:
+                dst.flush()
+                os.fsync(dst.fileno())
+        if schedule:
+            revision = schedule.commit()
+        if csv_path:
+            os.replace(tmp_csv_path, csv_path)
+    finally:
+        if tmp_csv_path and os.path.exists(tmp_csv_path):
+            os.remove(tmp_csv_path)
+    warnings = [format_issue(issue) for issue in reader.issues if issue.severity == WARNING]
+    return reader.days, revision, warnings
+
+
+# ===== BUILD CACHE =====
+def file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(path, cache):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def up_to_date(cache, path, inputs):
+    """True if `path` was built from `inputs` and has not been touched since."""
+    entry = cache.get(path)
+    return (isinstance(entry, dict) and entry.get('inputs') == inputs
+            and entry.get('output') == file_digest(path))
+
+
+def apply(input_path, csv_path, schedule_path, offsets, cache_path, force=False):
+    """Rebuilds the outputs that are out of date; returns (days, stage reports).
+    `days` is None when every stage was reused."""
+    with open(input_path, 'rb') as f:
+        data = f.read()
+    source = hashlib.sha256(data).hexdigest()
+    offsets = {key: offsets[key] for key in sorted(offsets)}
+
+    stages = {
+        schedule_path: f"v{CACHE_VERSION}.{FORMAT_VERSION}:{source}",
+        csv_path: f"v{CACHE_VERSION}:{source}:{json.dumps(offsets)}",
+    }
+    cache = {} if force else load_cache(cache_path)
+    stale = {path for path, inputs in stages.items() if not up_to_date(cache, path, inputs)}
+
+    days = revision = None
+    warnings = []
+    if stale:
+        lines = io.StringIO(data.decode('utf-8-sig'), newline='')
+        days, revision, warnings = ingest(lines,
+                                          csv_path if csv_path in stale else None,
+                                          schedule_path if schedule_path in stale else None,
+                                          offsets)
+        for path in stale:
+            cache[path] = {'inputs': stages[path], 'output': file_digest(path)}
+        save_cache(cache_path, {path: cache[path] for path in stages})
+
+    reports = [f"{'rebuilt' if path in stale else 'reused '} {path}" for path in stages]
+    if revision is not None:
+        reports[0] += f" (revision {revision})"
+    return days, reports + [f"warning: {w}" for w in warnings]
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    force = '--force' in args
+    args = [arg for arg in args if arg != '--force']
+    input_path = args[0] if args else PRAYER_INPUT_CSV_FILE
+    if not os.path.exists(input_path):
+        print(f"CSV file not found: {input_path}")
+        sys.exit(1)
+    try:
+        days, reports = apply(input_path, PRAYER_OUTPUT_CSV_FILE, PRAYER_SCHEDULE_FILE,
+                              SettingsCache(SETTINGS_INI_FILE).current().offsets,
+                              BUILD_CACHE_FILE, force)
+    except (IngestError, UnicodeDecodeError) as e:
+        print(f"{input_path} was not applied:")
+        print(e)
+        sys.exit(1)
+    for report in reports:
+        print(report)
+    done = f"{days} days ingested" if days is not None else "Nothing to do"
+    print(f"{done} in {(time.perf_counter() - started) * 1000:.1f} ms")
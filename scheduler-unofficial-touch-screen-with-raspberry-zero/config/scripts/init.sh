@@ -36,12 +36,12 @@ fi
 #######################################
 # Install required python packages
 #######################################
-if ! dpkg -s python3-pandas >/dev/null 2>&1; then
-    echo "Installing python3-pandas..."
+if ! dpkg -s python3-vlc >/dev/null 2>&1; then
+    echo "Installing python3-vlc..."
     sudo apt update
-    sudo apt install -y python3-pandas
+    sudo apt install -y python3-vlc
 else
-    echo "python3-pandas already installed"
+    echo "python3-vlc already installed"
 fi
 
 #######################################
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Makes one of the compiled locations the unit's schedule.
+
+The location's var/locations/<name>.bin (see compile_locations.py) is
+published as config/prayer_times.bin, the Desktop CSV is rewritten from it,
+and config.ini remembers the location, so apply_settings.sh keeps using it
+instead of the user's CSV. Nothing is parsed or calculated: it is a copy of
+366 records, and the scheduler adopts the new revision on its own.
+
+Usage:
+    switch_location.py              list the locations
+    switch_location.py NAME         switch to NAME
+    switch_location.py --csv        back to the user's CSV on the Desktop
+"""
+import configparser
+import csv
+import json
+import os
+import sys
+import time
+
+started = time.perf_counter()
+
+# ===== CONFIGURATION =====
+MAIN_DIR = "/home/ihms/Desktop/scheduler"
+DESKTOP_DIR = os.path.dirname(MAIN_DIR)
+CONFIG_DIR = os.path.join(MAIN_DIR, "config")
+VAR_DIR = os.path.join(MAIN_DIR, "var")
+
+SETTINGS_INI_FILE = os.path.join(CONFIG_DIR, "config.ini")
+LOCATIONS_INI_FILE = os.path.join(CONFIG_DIR, "locations.ini")
+LOCATIONS_DIR = os.path.join(VAR_DIR, "locations")
+PRAYER_INPUT_CSV_FILE = os.path.join(DESKTOP_DIR, "إدخال-مواقيت-الصلاة-للمستخدم.csv")
+PRAYER_OUTPUT_CSV_FILE = os.path.join(DESKTOP_DIR, "اوقات-الصلاة-المستخدمةبالتطبيقات.csv")
+PRAYER_SCHEDULE_FILE = os.path.join(CONFIG_DIR, "prayer_times.bin")
+BUILD_CACHE_FILE = os.path.join(VAR_DIR, "ingest-cache.json")
+
+LOCATION_KEY = "location"
+
+sys.path.insert(0, os.path.join(MAIN_DIR, "applications", "common"))
+from schedule_store import ScheduleStore, ScheduleWriter, ScheduleFormatError, MISSING, minutes_to_hhmm
+from settings_snapshot import SECTION, SettingsCache, write_settings
+from location_catalog import CatalogError, load_catalog, compiled_path
+from ingest_prayer_times import (OUTPUT_HEADER, IngestError, apply, file_digest,
+                                 load_cache, save_cache, up_to_date)
+
+
+class SwitchError(Exception):
+    pass
+
+
+# ===== PUBLISH =====
+def write_output_csv(path, days):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(OUTPUT_HEADER)
+            for month, day, minutes in days:
+                writer.writerow([month, day] + ['' if m == MISSING else minutes_to_hhmm(m) for m in minutes])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def publish(name, source, csv_path, schedule_path, offsets, cache_path):
+    """Publishes the compiled schedule `source` of location `name`; returns
+    stage reports like ingest_prayer_times.apply(). Stages already built from
+    the same file (and offsets) are reused."""
+    digest = file_digest(source)
+    if digest is None:
+        raise SwitchError(f"{name} is not compiled yet, run compile_locations.py {name}")
+    offsets = {key: offsets[key] for key in sorted(offsets)}
+    stages = {
+        schedule_path: f"location:{name}:{digest}",
+        csv_path: f"location:{name}:{digest}:{json.dumps(offsets)}",
+    }
+    cache = load_cache(cache_path)
+    stale = {path for path, inputs in stages.items() if not up_to_date(cache, path, inputs)}
+
+    revision = None
+    if stale:
+        try:
+            store = ScheduleStore(source, offsets)
+        except ScheduleFormatError as e:
+            raise SwitchError(f"{e}, run compile_locations.py --force {name}")
+        try:
+            if schedule_path in stale:
+                writer = ScheduleWriter(schedule_path)
+                for month, day, base in store.base_days():
+                    writer.add(month, day, base)
+                revision = writer.commit()
+            if csv_path in stale:
+                write_output_csv(csv_path, store.days())
+        finally:
+            store.close()
+        for path in stale:
+            cache[path] = {'inputs': stages[path], 'output': file_digest(path)}
+        save_cache(cache_path, {path: cache[path] for path in stages})
+
+    reports = [f"{'rebuilt' if path in stale else 'reused '} {path}" for path in stages]
+    if revision is not None:
+        reports[0] += f" (revision {revision})"
+    return reports
+
+
+def set_location(path, name):
+    """Records the current location in config.ini (None removes it); the
+    file is only rewritten if that changes something."""
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(path, encoding="utf-8")
+    if not config.has_section(SECTION):
+        config[SECTION] = {}
+    if config[SECTION].get(LOCATION_KEY) == name:
+        return
+    if name is None:
+        config.remove_option(SECTION, LOCATION_KEY)
+    else:
+        config[SECTION][LOCATION_KEY] = name
+    write_settings(config, path)
+
+
+def current_location(path):
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(path, encoding="utf-8")
+    return config.get(SECTION, LOCATION_KEY, fallback=None) or None
+
+
+# ===== MAIN =====
+def list_locations(catalog, current):
+    for name, location in catalog.items():
+        path = compiled_path(LOCATIONS_DIR, name)
+        source = os.path.basename(location.csv) if location.csv else \
+            f"{location.latitude}, {location.longitude} ({location.method})"
+        state = "" if os.path.exists(path) else "  [not compiled]"
+        print(f"{'*' if name == current else ' '} {name:20} {source}{state}")
+    if current is None:
+        print(f"* using {PRAYER_INPUT_CSV_FILE}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    try:
+        catalog = load_catalog(LOCATIONS_INI_FILE)
+    except CatalogError as e:
+        print(e)
+        sys.exit(1)
+
+    if not args:
+        list_locations(catalog, current_location(SETTINGS_INI_FILE))
+        sys.exit(0)
+
+    offsets = SettingsCache(SETTINGS_INI_FILE).current().offsets
+    try:
+        if args[0] == "--csv":
+            if not os.path.exists(PRAYER_INPUT_CSV_FILE):
+                raise SwitchError(f"CSV file not found: {PRAYER_INPUT_CSV_FILE}")
+            set_location(SETTINGS_INI_FILE, None)
+            _, reports = apply(PRAYER_INPUT_CSV_FILE, PRAYER_OUTPUT_CSV_FILE, PRAYER_SCHEDULE_FILE,
+                               offsets, BUILD_CACHE_FILE)
+        else:
+            name = args[0]
+            if name not in catalog:
+                raise SwitchError(f"{name} is not in {LOCATIONS_INI_FILE}")
+            reports = publish(name, compiled_path(LOCATIONS_DIR, name), PRAYER_OUTPUT_CSV_FILE,
+                              PRAYER_SCHEDULE_FILE, offsets, BUILD_CACHE_FILE)
+            set_location(SETTINGS_INI_FILE, name)
+    except (SwitchError, IngestError, UnicodeDecodeError) as e:
+        print(e)
+        sys.exit(1)
+    for report in reports:
+        print(report)
+    print(f"Switched in {(time.perf_counter() - started) * 1000:.1f} ms")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Audio selection of the scheduler's Player.
+
+Run from the scheduler directory with: python3 -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "applications", "services",
+                                "audio_event_scheduler"))
+from player import Player, RESULT_DONE
+
+
+class RecordingBackend:
+    """Backend that plays nothing and remembers what it was given."""
+
+    def __init__(self):
+        self.prepared = []
+        self.started = []
+
+    def prepare(self, paths):
+        self.prepared.append(list(paths))
+
+    def start(self, paths):
+        self.started.append(list(paths))
+
+    def release(self):
+        pass
+
+    def audible_at(self, timeout=1.0):
+        return None
+
+    def stop(self):
+        pass
+
+    def wait(self, timeout=None):
+        return True
+
+    def failed(self):
+        return False
+
+
+class LateIshaTest(unittest.TestCase):
+    def setUp(self):
+        self.audio_dir = tempfile.TemporaryDirectory()
+        for event_type in ("isha", "fajr"):
+            os.makedirs(os.path.join(self.audio_dir.name, event_type))
+            open(os.path.join(self.audio_dir.name, event_type, f"{event_type}.mp3"), "w").close()
+        self.backend = RecordingBackend()
+        self.player = Player(self.audio_dir.name, backend=self.backend)
+
+    def tearDown(self):
+        self.audio_dir.cleanup()
+
+    def arm_isha(self, hour, minute):
+        due = datetime(2026, 1, 1, hour, minute).timestamp()
+        request = self.player.arm("isha", (), due)
+        self.assertIsNotNone(request)
+        self.assertEqual(request.wait(5), RESULT_DONE)
+        return [os.path.basename(path) for path in self.backend.prepared[-1]]
+
+    def test_isha_due_at_22_plays_the_fajr_audio(self):
+        # Armed seconds before 22:00, the files are still chosen for 22:00
+        self.assertEqual(self.arm_isha(22, 0), ["fajr.mp3"])
+
+    def test_isha_due_before_22_plays_the_isha_audio(self):
+        self.assertEqual(self.arm_isha(21, 59), ["isha.mp3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Row checks of PrayerCsvReader.
+
+Run from the scheduler directory with: python3 -m unittest discover tests
+"""
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "applications", "common"))
+from prayer_csv import ERROR, WARNING, PrayerCsvReader
+
+HEADER = "Month,Day,Fajr,Sunrise,Dhuhr,Asr,Maghrib,Isha\n"
+ROW = "{month},{day},05:10,06:40,12:30,15:45,18:20,19:50\n"
+
+
+def read(text):
+    """(days read, [(line, severity, message)]) of CSV `text`."""
+    reader = PrayerCsvReader(io.StringIO(text))
+    days = list(reader)
+    return days, [tuple(issue) for issue in reader.issues]
+
+
+def errors(issues):
+    return [(line, message) for line, severity, message in issues if severity == ERROR]
+
+
+def read_row(fajr, sunrise, dhuhr, asr, maghrib, isha):
+    """(days read, error messages) of a file with a single 6/21 row."""
+    reader = PrayerCsvReader(io.StringIO(HEADER + f"6,21,{fajr},{sunrise},{dhuhr},{asr},{maghrib},{isha}\n"))
+    days = list(reader)
+    return days, [issue.message for issue in reader.issues if issue.severity == ERROR and issue.line]
+
+
+class IshaOrderTest(unittest.TestCase):
+    def test_isha_after_maghrib(self):
+        days, errors = read_row("03:10", "04:45", "13:10", "17:30", "21:30", "23:20")
+        self.assertEqual(len(days), 1)
+        self.assertEqual(errors, [])
+
+    def test_high_latitude_summer_isha_past_midnight(self):
+        # Berlin around midsummer: Isha after midnight, before the next Fajr
+        days, errors = read_row("02:40", "04:43", "13:11", "17:33", "21:33", "00:40")
+        self.assertEqual(len(days), 1)
+        self.assertEqual(errors, [])
+
+    def test_high_latitude_summer_isha_equal_to_fajr(self):
+        # Middle-of-the-night rule: Isha and Fajr fall on the same minute
+        days, errors = read_row("01:33", "04:43", "13:11", "17:33", "21:33", "01:33")
+        self.assertEqual(len(days), 1)
+        self.assertEqual(errors, [])
+
+    def test_isha_during_the_day_names_both_bounds(self):
+        days, errors = read_row("03:10", "04:45", "13:10", "17:30", "21:30", "20:00")
+        self.assertEqual(days, [])
+        self.assertEqual(errors, ["Isha (20:00) is neither after Maghrib (21:30) "
+                                  "nor at or before Fajr (03:10)"])
+
+    def test_isha_equal_to_maghrib(self):
+        days, errors = read_row("03:10", "04:45", "13:10", "17:30", "21:30", "21:30")
+        self.assertEqual(days, [])
+        self.assertEqual(len(errors), 1)
+
+
+class FormatTest(unittest.TestCase):
+    def test_missing_column(self):
+        days, issues = read("Month,Day,Fajr,Sunrise,Dhuhr,Asr,Maghrib\n" + ROW.format(month=1, day=1))
+        self.assertEqual(days, [])
+        self.assertEqual(errors(issues), [(1, "missing columns: Isha")])
+
+    def test_short_row(self):
+        days, issues = read(HEADER + "1,1,05:10,06:40\n")
+        self.assertEqual(days, [])
+        self.assertEqual(errors(issues)[0], (2, "expected 8 fields, got 4"))
+
+    def test_bad_time(self):
+        days, issues = read(HEADER + "1,1,05:10,06:40,25:30,15:45,18:20,19:50\n")
+        self.assertEqual(days, [])
+        self.assertEqual(errors(issues)[0], (2, "invalid Dhuhr time '25:30'"))
+
+    def test_bad_dates(self):
+        days, issues = read(HEADER + ROW.format(month="x", day=1) + ROW.format(month=2, day=30))
+        self.assertEqual(days, [])
+        self.assertEqual(errors(issues)[:2], [(2, "invalid date 'x'/'1'"), (3, "invalid date 2/30")])
+
+
+class DuplicateDateTest(unittest.TestCase):
+    def test_second_row_of_a_date_is_refused(self):
+        days, issues = read(HEADER + ROW.format(month=3, day=5) + ROW.format(month=3, day=5))
+        self.assertEqual(len(days), 1)
+        self.assertEqual(errors(issues)[0], (3, "3/5 already given on line 2"))
+
+
+class ColumnOrderTest(unittest.TestCase):
+    def test_prayer_before_the_previous_one(self):
+        days, errors = read_row("05:10", "06:40", "12:30", "12:15", "18:20", "19:50")
+        self.assertEqual(days, [])
+        self.assertEqual(errors, ["Asr (12:15) is not after Dhuhr (12:30)"])
+
+    def test_prayer_equal_to_the_previous_one(self):
+        days, errors = read_row("05:10", "05:10", "12:30", "15:45", "18:20", "19:50")
+        self.assertEqual(days, [])
+        self.assertEqual(errors, ["Sunrise (05:10) is not after Fajr (05:10)"])
+
+
+class MissingDaysTest(unittest.TestCase):
+    def test_partial_year_is_read_with_a_warning(self):
+        text = HEADER + "".join(ROW.format(month=1, day=d) for d in range(1, 32))
+        days, issues = read(text)
+        self.assertEqual(len(days), 31)
+        self.assertEqual(errors(issues), [])
+        warnings = [message for line, severity, message in issues if severity == WARNING]
+        self.assertTrue(warnings[0].startswith("missing days: 2/1-2/28, 3/1-12/31"), warnings)
+
+    def test_empty_file_is_refused(self):
+        days, issues = read(HEADER)
+        self.assertEqual(days, [])
+        self.assertEqual(errors(issues), [(0, "no days in the file")])
+
+
+if __name__ == "__main__":
+    unittest.main()